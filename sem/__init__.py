@@ -68,13 +68,32 @@ if _MPI_RANK != 0:
         _handler.setLevel(logging.ERROR)
 
 # Import main classes and functions
-from .vertical_movement_sem import VerticalMovementSEM, AnalyteOverlapError
 from .van_der_waals import VanDerWaalsRadii
-from .pore_geometry import PoreGeometry
 from .conductivity_models import SimpleConductivityModel
 from .config import load_config, validate_config, print_config_summary, create_example_config
 from .rotation import RotationSpec, rotate_pdb_to_grid_center, parse_angle_file, random_uniform_rotations
-from .cli import main, create_sem_from_config
+
+# These need DOLFINx/PETSc and are imported on first access, so the NumPy
+# and Numba helpers (sem.analyte_index, sem.kernels, ...) stay importable
+# without the FEM stack.
+_LAZY_EXPORTS = {
+    'VerticalMovementSEM': '.vertical_movement_sem',
+    'AnalyteOverlapError': '.vertical_movement_sem',
+    'PoreGeometry': '.pore_geometry',
+    'main': '.cli',
+    'create_sem_from_config': '.cli',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Package metadata
 __version__ = "1.0.0"
@@ -0,0 +1,133 @@
+"""
+Adaptive z-sampling for translocation traces.
+
+Positions far from the pore give near-constant current, so sampling every
+``z_step`` there is wasted work. ``AdaptiveZSampler`` walks the same uniform
+grid as the regular run but starts from a coarse subset of it and bisects
+intervals whose current changes faster than a tolerance, or where the
+trace bends sharply, until neighbouring samples are one grid step apart.
+Unsampled grid positions are filled in by interpolation afterwards.
+"""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveZSampler:
+    """
+    Iterate over grid indices to sample, refining where the current varies.
+
+    Iterating yields indices into the uniform z grid; the caller reports each
+    result with :meth:`record` before asking for the next index.
+
+    Args:
+        num_steps: Number of positions on the fine (``z_step``) grid.
+        coarse_stride: Grid steps between samples of the initial coarse pass.
+        current_tol: Refine an interval when the current changes by more than
+            this fraction of ``scale`` across it.
+        curvature_tol: Refine the intervals next to a sample where the slope
+            (per grid step, as a fraction of ``scale``) changes by more than this.
+        scale: Current used to normalise the tolerances (the open-pore current).
+    """
+
+    def __init__(self, num_steps, coarse_stride=8, current_tol=0.005,
+                 curvature_tol=None, scale=1.0):
+        self.num_steps = int(num_steps)
+        self.coarse_stride = max(int(coarse_stride), 1)
+        self.current_tol = float(current_tol)
+        self.curvature_tol = float(curvature_tol) if curvature_tol is not None else None
+        self.scale = abs(float(scale)) if scale else 1.0
+        self.values = {}
+        self.num_passes = 0
+
+    def record(self, index, current):
+        """Store the current computed at grid ``index`` (NaN for skipped positions)."""
+        self.values[int(index)] = float(current)
+
+    def _coarse_indices(self):
+        indices = list(range(0, self.num_steps, self.coarse_stride))
+        if indices[-1] != self.num_steps - 1:
+            indices.append(self.num_steps - 1)
+        return indices
+
+    def _needs_refinement(self, a, b):
+        ia, ib = self.values.get(a, np.nan), self.values.get(b, np.nan)
+        finite_a, finite_b = np.isfinite(ia), np.isfinite(ib)
+        if not finite_a and not finite_b:
+            # Inside a skipped (e.g. overlapping) stretch: nothing to resolve.
+            return False
+        if finite_a != finite_b:
+            # Locate where the trace starts or stops being computable.
+            return True
+        return abs(ib - ia) / self.scale > self.current_tol
+
+    def _bends(self, a, b, c):
+        """Whether the slope changes sharply at sample ``b`` between ``a`` and ``c``."""
+        ia, ib, ic = (self.values.get(k, np.nan) for k in (a, b, c))
+        if not (np.isfinite(ia) and np.isfinite(ib) and np.isfinite(ic)):
+            return False
+        slope_left = (ib - ia) / (b - a)
+        slope_right = (ic - ib) / (c - b)
+        return abs(slope_right - slope_left) / self.scale > self.curvature_tol
+
+    def _refinement_pass(self):
+        """Midpoints of all intervals flagged for refinement, in grid order."""
+        sampled = sorted(self.values)
+        refine = set()
+        for a, b in zip(sampled[:-1], sampled[1:]):
+            if b - a > 1 and self._needs_refinement(a, b):
+                refine.add((a, b))
+        if self.curvature_tol is not None:
+            for a, b, c in zip(sampled[:-2], sampled[1:-1], sampled[2:]):
+                if self._bends(a, b, c):
+                    if b - a > 1:
+                        refine.add((a, b))
+                    if c - b > 1:
+                        refine.add((b, c))
+        return sorted((a + b) // 2 for a, b in refine)
+
+    def __iter__(self):
+        if self.num_steps <= 0:
+            return
+        for index in self._coarse_indices():
+            yield index
+        while True:
+            midpoints = self._refinement_pass()
+            if not midpoints:
+                break
+            self.num_passes += 1
+            for index in midpoints:
+                yield index
+
+    @property
+    def sampled_indices(self):
+        return np.array(sorted(self.values), dtype=int)
+
+
+def fill_unsampled(values, sampled_mask):
+    """
+    Linearly interpolate ``values`` at grid positions that were not sampled.
+
+    Args:
+        values: Full-length array, valid where ``sampled_mask`` is True
+        sampled_mask: Boolean array of sampled grid positions
+
+    Returns:
+        Array with unsampled entries interpolated between finite samples
+    """
+    values = np.array(values, dtype=float)
+    index = np.arange(values.size)
+    known = sampled_mask & np.isfinite(values)
+    missing = ~sampled_mask
+    if np.any(known) and np.any(missing):
+        values[missing] = np.interp(index[missing], index[known], values[known])
+        # Gaps bordering a skipped (NaN) sample stay NaN.
+        sampled = index[sampled_mask]
+        right = np.clip(np.searchsorted(sampled, index[missing]), 0, sampled.size - 1)
+        left = np.clip(right - 1, 0, sampled.size - 1)
+        invalid = ~known[sampled[left]] | ~known[sampled[right]]
+        values[index[missing][invalid]] = np.nan
+    return values
@@ -0,0 +1,368 @@
+"""
+Spatial index of the analyte atoms in the analyte body frame.
+
+The analyte only moves rigidly: translocation translates it along z and a
+rotation scan rotates it about its centre of mass. Distances are invariant
+under rigid motions, so the KD-tree is built once on the body-frame atom
+coordinates and queries map the query points into that frame instead of
+rebuilding the tree for every position and orientation.
+
+Only mesh points within the cutoff of an atom can change conductivity.
+``ZSortedPointIndex`` keeps the mesh points sorted by z, so the points in
+the analyte's bounding box are found with two binary searches and a filter
+on x and y. Only those points are passed to the tree.
+
+``AnalyteStamp`` goes one step further: it tabulates the analyte's surface
+distance once on a regular grid in the body frame. At each position that
+grid is sampled by trilinear interpolation, so the cost per position no
+longer depends on the number of atoms.
+"""
+
+import logging
+
+import numpy as np
+from scipy.spatial import KDTree
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyteIndex:
+    """
+    KD-tree over analyte atoms, queried at any rigid placement.
+
+    A placement puts body-frame coordinates ``b`` at ``b @ R.T + origin``,
+    with ``origin`` the position of the body-frame origin (the centre of mass
+    for the SEM analyte).
+
+    Besides the nearest atom centre (``query``), the index gives the exact
+    distance to the nearest atom surface, ``min_a(|p - a| - r_a)``
+    (``surface_distances``). The nearest centre need not belong to the
+    nearest surface when radii differ. By default the cutoff still applies
+    to the centre distance, as for ``query``, so both modes modify the same
+    points and only the distance values differ.
+
+    Args:
+        positions: Mx3 reference atom positions (Å)
+        center: Point of the reference positions used as body-frame origin
+        radii: Optional M array of atom radii (Å), needed for surface distances
+    """
+
+    # Above this many distinct radii the surface search uses k-nearest
+    # neighbours instead of one tree per radius level.
+    MAX_RADIUS_LEVELS = 16
+
+    def __init__(self, positions, center, radii=None):
+        positions = np.asarray(positions, dtype=float)
+        self.center = np.asarray(center, dtype=float)
+        self.body_positions = positions - self.center
+        self.tree = KDTree(self.body_positions)
+        self.num_atoms = positions.shape[0]
+        self.radii = np.asarray(radii, dtype=float) if radii is not None else None
+        self._radius_ladder = None
+
+    def to_body_frame(self, points, rotation, origin):
+        """Map world points into the body frame of a placement (inverse rigid motion)."""
+        rotation = np.asarray(rotation, dtype=float)
+        # Row vectors: (p - origin) @ R applies R^-1 = R^T.
+        return (np.asarray(points, dtype=float) - origin) @ rotation
+
+    def query(self, points, rotation, origin, distance_upper_bound=np.inf):
+        """
+        Nearest atom to each point with the analyte at the given placement.
+
+        Args:
+            points: Nx3 query points (Å)
+            rotation: 3x3 rotation matrix of the placement
+            origin: World position of the body-frame origin
+            distance_upper_bound: Return ``inf`` distances beyond this (Å)
+
+        Returns:
+            distances, indices: As from ``scipy.spatial.KDTree.query``
+        """
+        body_points = self.to_body_frame(points, rotation, origin)
+        return self.tree.query(body_points, distance_upper_bound=distance_upper_bound)
+
+    @property
+    def max_radius(self):
+        return float(self.radii.max()) if self.radii is not None and self.radii.size else 0.0
+
+    def surface_distances(self, points, rotation, origin, cutoff, center_cutoff=True):
+        """
+        Exact distance to the nearest atom surface at the given placement.
+
+        Args:
+            points: Nx3 query points (Å)
+            rotation: 3x3 rotation matrix of the placement
+            origin: World position of the body-frame origin
+            cutoff: Cutoff distance (Å)
+            center_cutoff: Report ``inf`` where no atom centre is within
+                ``cutoff`` (the nearest-centre region). False applies the
+                cutoff to the surface distance instead.
+
+        Returns:
+            N array of surface distances clamped at 0, ``inf`` beyond ``cutoff``
+        """
+        body_points = self.to_body_frame(points, rotation, origin)
+        return self.body_surface_distances(body_points, cutoff, center_cutoff)
+
+    def body_surface_distances(self, body_points, cutoff, center_cutoff=True):
+        """``surface_distances`` for points already in the body frame."""
+        if self.radii is None:
+            raise ValueError("AnalyteIndex needs atom radii for surface distances")
+        levels = np.unique(self.radii)
+        if levels.size <= self.MAX_RADIUS_LEVELS:
+            surface = self._ladder_search(body_points, cutoff, levels, center_cutoff)
+        else:
+            surface = self._knn_search(body_points, cutoff, center_cutoff)
+        np.maximum(surface, 0.0, out=surface)
+        surface[surface >= cutoff] = np.inf
+        return surface
+
+    def _nearest(self, body_points, cutoff, center_cutoff):
+        """Nearest-centre surface distance and the radius of that atom."""
+        r_max = self.max_radius
+        distances, indices = self.tree.query(body_points, distance_upper_bound=cutoff + r_max)
+        near = np.isfinite(distances)
+        surface = np.full(body_points.shape[0], np.inf)
+        nearest_radius = np.full(body_points.shape[0], r_max)
+        surface[near] = distances[near] - self.radii[indices[near]]
+        nearest_radius[near] = self.radii[indices[near]]
+        # Any other atom is at least as far, so its surface is beyond d - r_max.
+        open_points = near & (surface > 0) & (distances - r_max < np.minimum(surface, cutoff))
+        if center_cutoff:
+            # No atom centre within the cutoff: unmodified, nothing to refine.
+            outside = distances >= cutoff
+            surface[outside] = np.inf
+            open_points &= ~outside
+        return surface, nearest_radius, open_points
+
+    def _ladder_search(self, body_points, cutoff, levels, center_cutoff):
+        """
+        Surface distances with one tree per radius level.
+
+        Atoms no larger than the nearest atom found so far cannot have a closer
+        surface, so each unresolved point is re-queried against the atoms with
+        larger radii until no closer candidate is found.
+        """
+        if self._radius_ladder is None:
+            ladder = {}
+            for level in levels[:-1]:
+                members = np.flatnonzero(self.radii > level)
+                ladder[level] = (KDTree(self.body_positions[members]), members)
+            self._radius_ladder = ladder
+
+        surface, nearest_radius, open_points = self._nearest(body_points, cutoff, center_cutoff)
+        r_max = self.max_radius
+        for level in levels[:-1]:
+            todo = np.flatnonzero(open_points & (nearest_radius == level))
+            if todo.size == 0:
+                continue
+            tree, members = self._radius_ladder[level]
+            bound = min(cutoff, float(surface[todo].max())) + r_max
+            distances, indices = tree.query(body_points[todo], distance_upper_bound=bound)
+            found = np.isfinite(distances)
+            candidate = np.full(todo.size, np.inf)
+            candidate[found] = distances[found] - self.radii[members[indices[found]]]
+            surface[todo] = np.minimum(surface[todo], candidate)
+            # Continue from the radius of the atom just found; stop if none.
+            nearest_radius[todo] = np.where(found, self.radii[members[np.minimum(indices, members.size - 1)]], r_max)
+            open_points[todo] = found & (surface[todo] > 0)
+        return surface
+
+    def _knn_search(self, body_points, cutoff, center_cutoff, k=4):
+        """
+        Surface distances from k-nearest centres, doubling k where needed.
+
+        A point is resolved once its k-th neighbour lies beyond
+        ``surface + r_max``, since no farther atom can have a closer surface.
+        """
+        surface, _, open_points = self._nearest(body_points, cutoff, center_cutoff)
+        r_max = self.max_radius
+        todo = np.flatnonzero(open_points)
+        k = min(k, self.num_atoms)
+        while todo.size:
+            distances, indices = self.tree.query(body_points[todo], k=k,
+                                                 distance_upper_bound=cutoff + r_max)
+            candidate = distances - self.radii[np.minimum(indices, self.num_atoms - 1)]
+            surface[todo] = np.minimum(surface[todo], candidate.min(axis=1))
+            resolved = (~np.isfinite(distances[:, -1])
+                        | (distances[:, -1] >= surface[todo] + r_max)
+                        | (k >= self.num_atoms))
+            todo = todo[~resolved]
+            k = min(2 * k, self.num_atoms)
+        return surface
+
+
+class ZSortedPointIndex:
+    """
+    Points sorted by z for fast axis-aligned box selection.
+
+    Args:
+        points: Nx3 point coordinates (Å), e.g. the conductivity DOF coordinates
+    """
+
+    def __init__(self, points):
+        self.points = np.asarray(points)
+        self.order = np.argsort(self.points[:, 2], kind="stable")
+        self.sorted_z = self.points[self.order, 2]
+
+    def __len__(self):
+        return self.points.shape[0]
+
+    def candidates(self, box_min, box_max):
+        """
+        Indices (into ``points``) of the points inside the box.
+
+        Args:
+            box_min, box_max: Opposite corners of the box (Å)
+
+        Returns:
+            Sorted integer array of point indices
+        """
+        lo = np.searchsorted(self.sorted_z, box_min[2], side="left")
+        hi = np.searchsorted(self.sorted_z, box_max[2], side="right")
+        slab = self.order[lo:hi]
+        xy = self.points[slab, :2]
+        inside = np.all((xy >= box_min[:2]) & (xy <= box_max[:2]), axis=1)
+        return np.sort(slab[inside])
+
+
+class AnalyteStamp:
+    """
+    Body-frame surface-distance field of the analyte on a regular grid.
+
+    Grid values are the distance from a point to the surface of its nearest
+    atom (nearest by centre, minus that atom's radius, clamped at 0), as in
+    the KD-tree path. Points with no atom centre within ``cutoff`` hold
+    ``cutoff``, where the steric conductivity is back to bulk. With
+    ``exact=True`` the values are exact surface distances
+    (``AnalyteIndex.surface_distances``) over the same region instead.
+
+    Args:
+        index: ``AnalyteIndex`` of the analyte
+        radii: M array of atom radii (Å)
+        cutoff: Atom-centre distance cutoff (Å)
+        resolution: Grid spacing (Å)
+        exact: Tabulate exact surface distances (needs radii on ``index``)
+    """
+
+    def __init__(self, index, radii, cutoff, resolution=0.5, exact=False):
+        self.cutoff = float(cutoff)
+        self.resolution = float(resolution)
+        self.exact = bool(exact)
+        body = index.body_positions
+        self.lower = body.min(axis=0) - self.cutoff
+        upper = body.max(axis=0) + self.cutoff
+        self.shape = tuple(int(n) for n in np.ceil((upper - self.lower) / self.resolution).astype(int) + 1)
+
+        axes = [self.lower[k] + self.resolution * np.arange(self.shape[k]) for k in range(3)]
+        radii = np.asarray(radii, dtype=float)
+        values = np.empty(self.shape)
+        # One x-plane at a time keeps the query arrays small for large analytes.
+        Y, Z = np.meshgrid(axes[1], axes[2], indexing="ij")
+        plane = np.column_stack([np.zeros(Y.size), Y.ravel(), Z.ravel()])
+        for i, x in enumerate(axes[0]):
+            plane[:, 0] = x
+            if self.exact:
+                surface = index.body_surface_distances(plane, self.cutoff)
+                surface[~np.isfinite(surface)] = self.cutoff
+            else:
+                distances, indices = index.tree.query(plane, distance_upper_bound=self.cutoff)
+                surface = np.full(plane.shape[0], self.cutoff)
+                near = np.isfinite(distances)
+                surface[near] = np.maximum(distances[near] - radii[indices[near]], 0.0)
+            values[i] = surface.reshape(Y.shape)
+        self.values = values
+        self.index = index
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    def sample(self, points, rotation, origin):
+        """
+        Trilinearly interpolated surface distance at world points.
+
+        Args:
+            points: Nx3 query points (Å)
+            rotation: 3x3 rotation matrix of the placement
+            origin: World position of the body-frame origin
+
+        Returns:
+            N array of surface distances; ``cutoff`` outside the grid
+        """
+        body = self.index.to_body_frame(points, rotation, origin)
+        return _trilinear(self.values, self.lower, self.resolution, body, self.cutoff)
+
+
+class AnalytePotentialGrid:
+    """
+    Body-frame screened potential of the analyte charges on a regular grid.
+
+    The Debye-Hückel sum is rigid with the analyte, so it is tabulated once
+    and trilinearly sampled at every placement instead of re-summed over the
+    charged atoms for every DOF. The grid covers the atoms plus ``pad`` (the
+    region where the steric field modifies the conductivity).
+
+    Args:
+        index: ``AnalyteIndex`` of the analyte
+        potential: Callable giving the reduced potential at body-frame points
+            (e.g. ``DebyeHuckelPotential`` built on ``index.body_positions``)
+        pad: Margin around the atom centres (Å)
+        resolution: Grid spacing (Å)
+    """
+
+    def __init__(self, index, potential, pad, resolution=1.0):
+        self.resolution = float(resolution)
+        body = index.body_positions
+        self.lower = body.min(axis=0) - pad
+        upper = body.max(axis=0) + pad
+        self.shape = tuple(int(n) for n in np.ceil((upper - self.lower) / self.resolution).astype(int) + 1)
+
+        axes = [self.lower[k] + self.resolution * np.arange(self.shape[k]) for k in range(3)]
+        values = np.empty(self.shape)
+        Y, Z = np.meshgrid(axes[1], axes[2], indexing="ij")
+        plane = np.column_stack([np.zeros(Y.size), Y.ravel(), Z.ravel()])
+        for i, x in enumerate(axes[0]):
+            plane[:, 0] = x
+            values[i] = potential(plane).reshape(Y.shape)
+        self.values = values
+        self.index = index
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    def sample(self, points, rotation, origin):
+        """
+        Trilinearly interpolated analyte potential at world points.
+
+        Returns:
+            N array of reduced potentials; 0 outside the grid
+        """
+        body = self.index.to_body_frame(points, rotation, origin)
+        return _trilinear(self.values, self.lower, self.resolution, body, 0.0)
+
+
+def _trilinear(v, lower, resolution, body, fill):
+    """Trilinear interpolation of grid ``v`` at body-frame points; ``fill`` outside."""
+    f = (body - lower) / resolution
+    i0 = np.floor(f).astype(np.intp)
+    shape = np.array(v.shape)
+    inside = np.all((i0 >= 0) & (i0 < shape - 1), axis=1)
+
+    result = np.full(body.shape[0], fill, dtype=float)
+    if not np.any(inside):
+        return result
+    i0 = i0[inside]
+    t = f[inside] - i0
+    i, j, k = i0[:, 0], i0[:, 1], i0[:, 2]
+    tx, ty, tz = t[:, 0], t[:, 1], t[:, 2]
+    c00 = v[i, j, k] * (1 - tx) + v[i + 1, j, k] * tx
+    c10 = v[i, j + 1, k] * (1 - tx) + v[i + 1, j + 1, k] * tx
+    c01 = v[i, j, k + 1] * (1 - tx) + v[i + 1, j, k + 1] * tx
+    c11 = v[i, j + 1, k + 1] * (1 - tx) + v[i + 1, j + 1, k + 1] * tx
+    c0 = c00 * (1 - ty) + c10 * ty
+    c1 = c01 * (1 - ty) + c11 * ty
+    result[inside] = c0 * (1 - tz) + c1 * tz
+    return result
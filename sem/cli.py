@@ -80,6 +80,9 @@ def create_sem_from_config(config, prepare_analyte=True, *, gmsh_center_mode_ove
     debye_length = sim.get("debye_length", 2.15)
     bjerrum_length = sim.get("bjerrum_length", 7.15)
     charge_clip = sim.get("charge_clip", 2.0)
+    charge_cutoff = sim.get("charge_cutoff", None)
+    charge_grid_resolution = sim.get("charge_grid_resolution", 1.0)
+    charge_potential_cache = bool(sim.get("charge_potential_cache", True))
     default_radius = sim["default_radius"]
     xy_margin = float(sim.get("xy_margin", 0.0))
     prevent_analyte_overlap = bool(sim.get("prevent_analyte_overlap", False))
@@ -97,6 +100,14 @@ def create_sem_from_config(config, prepare_analyte=True, *, gmsh_center_mode_ove
     gmsh_random_seed = sim.get("gmsh_random_seed", None)
     gmsh_random_factor = sim.get("gmsh_random_factor", None)
     save_mesh_xdmf = sim.get("save_mesh_xdmf", False)
+    solver_cfg = sim.get("solver", None)
+    stamp_cfg = sim.get("analyte_stamp", None)
+    conductivity_kernel = sim.get("conductivity_kernel", "numpy")
+    surface_distance = sim.get("surface_distance", "nearest_center")
+    precision = sim.get("precision", "double")
+    pore_evaluation = sim.get("pore_evaluation", "grid")
+    distance_engine = sim.get("distance_engine", "numba")
+    distance_threads = sim.get("distance_threads")
     if gmsh_center_mode_override is not None:
         gmsh_fine_center_mode = gmsh_center_mode_override
         if gmsh_center_mode_override == "origin":
@@ -112,6 +123,7 @@ def create_sem_from_config(config, prepare_analyte=True, *, gmsh_center_mode_ove
     z_start = movement["z_start"]
     z_end = movement["z_end"]
     z_step = movement["z_step"]
+    sampling_cfg = movement.get("sampling", None)
     
     # Output parameters
     output = config["output"]
@@ -170,6 +182,9 @@ def create_sem_from_config(config, prepare_analyte=True, *, gmsh_center_mode_ove
         debye_length=debye_length,
         bjerrum_length=bjerrum_length,
         charge_clip=charge_clip,
+        charge_cutoff=charge_cutoff,
+        charge_grid_resolution=charge_grid_resolution,
+        charge_potential_cache=charge_potential_cache,
         default_radius=default_radius,
         membrane_conductivity=membrane_conductivity,
         membrane_z_offset=membrane_z_offset,
@@ -193,6 +208,15 @@ def create_sem_from_config(config, prepare_analyte=True, *, gmsh_center_mode_ove
         overlap_distance_threshold=overlap_distance_threshold,
         bin_file_units=bin_file_units,
         arbd_export=arbd_export_cfg,
+        solver=solver_cfg,
+        sampling=sampling_cfg,
+        analyte_stamp=stamp_cfg,
+        conductivity_kernel=conductivity_kernel,
+        surface_distance=surface_distance,
+        precision=precision,
+        pore_evaluation=pore_evaluation,
+        distance_engine=distance_engine,
+        distance_threads=distance_threads,
     )
     
     if rank == 0:
@@ -464,6 +488,60 @@ def run_rotation_scan(base_config: dict, args: argparse.Namespace, config_file:
             hybrid_path, len(hybrid_rows), len(results),
         )
 
+def run_solver_bench(config: dict, args: argparse.Namespace, config_file: Path):
+    """Time solver presets on the configured problem and store the fastest."""
+    from .solver_bench import (
+        benchmark_current_evaluators,
+        benchmark_solver_presets,
+        select_fastest,
+        write_preset_to_config,
+    )
+
+    sem, config = create_sem_from_config(config)
+    results = benchmark_solver_presets(sem, presets=args.presets, rtol=args.rtol)
+    best = select_fastest(results)
+
+    if rank == 0:
+        print(f"\n{'='*60}")
+        print("SOLVER PRESET BENCHMARK")
+        print(f"{'='*60}")
+        print(f"{'Preset':<14}{'Setup(s)':>10}{'Open(s)':>10}{'First(s)':>10}{'Total(s)':>10}{'Its':>8}  Status")
+        for r in results:
+            if "total_time" not in r:
+                print(f"{r['preset']:<14}{'-':>10}{'-':>10}{'-':>10}{'-':>10}{'-':>8}  failed: {r.get('error', '')}")
+                continue
+            if r["ok"]:
+                status = "ok"
+            elif not r["converged"]:
+                status = f"diverged (reasons {r['open_pore_reason']}, {r['position_reason']})"
+            else:
+                status = f"rejected (deviation {r.get('deviation', float('nan')):.1e})"
+            print(f"{r['preset']:<14}{r['setup_time']:>10.3f}{r['open_pore_time']:>10.3f}"
+                  f"{r['position_time']:>10.3f}{r['total_time']:>10.3f}"
+                  f"{r['position_iterations']:>8d}  {status}")
+        print(f"{'='*60}")
+
+    if args.current_evaluators:
+        evaluator_results = benchmark_current_evaluators(sem)
+        if rank == 0:
+            print("\nCURRENT EVALUATORS (vs. surface flux)")
+            print(f"{'Problem':<16}{'Evaluator':<10}{'Current(nA)':>14}{'Rel.diff':>11}{'Time(s)':>10}")
+            for r in evaluator_results:
+                print(f"{r['problem']:<16}{r['evaluator']:<10}{r['current']:>14.6e}"
+                      f"{r['relative_difference']:>11.2e}{r['time']:>10.4f}")
+            print(f"{'='*60}")
+
+    if rank == 0:
+        if best is None:
+            logger.error("No solver preset produced a converged, consistent result")
+        elif args.no_write:
+            logger.info("Fastest preset: %s (config not modified)", best)
+        else:
+            write_preset_to_config(config_file, best)
+            logger.info("Fastest preset '%s' written to %s", best, config_file)
+    return best
+
+
 def main():
     """
     Main function to run SEM with JSON configuration.
@@ -479,6 +557,7 @@ Examples:
   python -m sem config.json preview_only  # Generate preview plots only
   python -m sem config.json open_pore     # Calculate open pore current only
   python -m sem config.json rotation_scan map.dx angles.txt --samples 10
+  python -m sem solver_bench config.json  # Pick the fastest linear solver preset
   python -m sem create_config cylindrical # Create example config file
   
 Pore Types:
@@ -522,6 +601,18 @@ Pore Types:
     rotation_parser.add_argument('--reuse-open-pore', action='store_true',
                                  help='Compute open pore current once and reuse for all rotations (assumes mesh is unchanged)')
     
+    bench_parser = subparsers.add_parser('solver_bench',
+                                         help='Time solver presets and write the fastest to the config')
+    bench_parser.add_argument('config', help='Path to JSON configuration file')
+    bench_parser.add_argument('--presets', nargs='+', default=None,
+                              help='Presets to compare (default: all)')
+    bench_parser.add_argument('--rtol', type=float, default=1e-6,
+                              help='Relative current tolerance against the reference preset (default: 1e-6)')
+    bench_parser.add_argument('--no-write', action='store_true',
+                              help='Report the fastest preset without modifying the config file')
+    bench_parser.add_argument('--current-evaluators', action='store_true',
+                              help='Also compare the surface, residual and energy current evaluators')
+
     # Create config command
     config_parser = subparsers.add_parser('create_config', help='Create example configuration file')
     config_parser.add_argument('pore_type', choices=['cylindrical', 'double_cone', 'biological', 'bin_file'],
@@ -566,6 +657,12 @@ Pore Types:
             if rank == 0:
                 logger.info("Execution completed successfully!")
             return
+
+        if args.command == 'solver_bench':
+            run_solver_bench(config, args, config_path)
+            if rank == 0:
+                logger.info("Execution completed successfully!")
+            return
         
         # Create SEM instance
         prepare_analyte = args.command != 'open_pore'
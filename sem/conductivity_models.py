@@ -70,3 +70,70 @@ class ChargeAwareConductivityModel(SimpleConductivityModel):
         charge_factor = np.clip(charge_factor, 1 / self.charge_clip, self.charge_clip)
         
         return steric_cond * charge_factor
+
+
+class DebyeHuckelPotential:
+    """
+    Cutoff-limited screened (Debye-Hückel) potential of a set of point charges.
+
+    The reduced potential ``beta * e * phi = l_B * sum_j q_j exp(-r_j / lambda_D) / r_j``
+    is summed over charges within ``cutoff`` using a cell list and a compiled
+    kernel. All lengths in Angstroms, charges in elementary charges.
+
+    Args:
+        positions: Mx3 charge positions (Å)
+        charges: M charges (e); neutral atoms are dropped
+        radii: M atom radii (Å), used as the minimum distance to a charge
+        debye_length: Debye screening length (Å)
+        bjerrum_length: Bjerrum length (Å)
+        cutoff: Interaction cutoff (Å); defaults to 4 Debye lengths
+    """
+
+    def __init__(self, positions, charges, radii, debye_length=2.15,
+                 bjerrum_length=7.15, cutoff=None):
+        self.debye_length = float(debye_length)
+        self.bjerrum_length = float(bjerrum_length)
+        self.cutoff = float(cutoff) if cutoff is not None else 4.0 * self.debye_length
+
+        charges = np.asarray(charges, dtype=float)
+        charged = charges != 0
+        positions = np.asarray(positions, dtype=float)[charged]
+        radii = np.broadcast_to(np.asarray(radii, dtype=float), charges.shape)[charged]
+        self.num_charges = int(charged.sum())
+
+        # Uniform cell list with cells of one cutoff.
+        self.cell_size = self.cutoff
+        if self.num_charges:
+            self.lower = positions.min(axis=0)
+            self.dims = (np.floor((positions.max(axis=0) - self.lower) / self.cell_size)
+                         .astype(np.int64) + 1)
+        else:
+            self.lower = np.zeros(3)
+            self.dims = np.ones(3, dtype=np.int64)
+        cell = np.floor((positions - self.lower) / self.cell_size).astype(np.int64)
+        flat = (cell[:, 0] * self.dims[1] + cell[:, 1]) * self.dims[2] + cell[:, 2]
+        order = np.argsort(flat, kind="stable")
+        self.positions = np.ascontiguousarray(positions[order])
+        self.charges = np.ascontiguousarray(charges[charged][order])
+        self.radii = np.ascontiguousarray(radii[order])
+        self.cell_start = np.searchsorted(flat[order], np.arange(int(np.prod(self.dims)) + 1))
+
+    def __call__(self, points):
+        """
+        Reduced potential at the given points.
+
+        Args:
+            points: Nx3 points (Å), in the frame of ``positions``
+
+        Returns:
+            N array of dimensionless potentials
+        """
+        points = np.ascontiguousarray(points, dtype=float)
+        if self.num_charges == 0 or points.shape[0] == 0:
+            return np.zeros(points.shape[0])
+        from .kernels import screened_potential_sum
+        return screened_potential_sum(
+            points, self.positions, self.charges, self.radii, self.cell_start,
+            self.lower, self.cell_size, self.dims, self.cutoff,
+            self.debye_length, self.bjerrum_length,
+        )
@@ -45,6 +45,229 @@ def load_config(config_path):
         else:
             sys.exit(1)
 
+def _validate_solver_config(solver_cfg):
+    """
+    Validate and normalize the optional ``simulation.solver`` block in place.
+
+    Args:
+        solver_cfg: Solver configuration dictionary
+
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    if not isinstance(solver_cfg, dict):
+        logger.error("Simulation parameter 'solver' must be an object")
+        return False
+
+    rebuild_every = solver_cfg.get("pc_rebuild_every", 1)
+    try:
+        rebuild_every = int(rebuild_every)
+    except (TypeError, ValueError):
+        logger.error("Solver parameter 'pc_rebuild_every' must be an integer")
+        return False
+    if rebuild_every < 0:
+        logger.error("Solver parameter 'pc_rebuild_every' must be >= 0")
+        return False
+    solver_cfg["pc_rebuild_every"] = rebuild_every
+
+    growth = solver_cfg.get("pc_rebuild_iteration_growth", None)
+    if growth is not None:
+        try:
+            growth = float(growth)
+        except (TypeError, ValueError):
+            logger.error("Solver parameter 'pc_rebuild_iteration_growth' must be numeric")
+            return False
+        if growth <= 1.0:
+            logger.error("Solver parameter 'pc_rebuild_iteration_growth' must be > 1")
+            return False
+        solver_cfg["pc_rebuild_iteration_growth"] = growth
+
+    preset = solver_cfg.get("preset", None)
+    if preset is not None:
+        from .fem_solver import SOLVER_PRESETS
+        if preset not in SOLVER_PRESETS:
+            logger.error(
+                "Solver parameter 'preset' must be one of: %s", ", ".join(SOLVER_PRESETS)
+            )
+            return False
+
+    petsc_options = solver_cfg.get("petsc_options", None)
+    if petsc_options is not None and not isinstance(petsc_options, dict):
+        logger.error("Solver parameter 'petsc_options' must be an object of PETSc option names")
+        return False
+
+    initial_guess = str(solver_cfg.get("initial_guess", "zero")).lower()
+    if initial_guess not in ("zero", "previous", "open_pore"):
+        logger.error("Solver parameter 'initial_guess' must be 'zero', 'previous' or 'open_pore'")
+        return False
+    solver_cfg["initial_guess"] = initial_guess
+
+    if not isinstance(solver_cfg.get("incremental_assembly", False), bool):
+        logger.error("Solver parameter 'incremental_assembly' must be true or false")
+        return False
+    try:
+        max_fraction = float(solver_cfg.get("incremental_max_fraction", 0.1))
+    except (TypeError, ValueError):
+        logger.error("Solver parameter 'incremental_max_fraction' must be numeric")
+        return False
+    if not 0.0 < max_fraction <= 1.0:
+        logger.error("Solver parameter 'incremental_max_fraction' must be in (0, 1]")
+        return False
+    solver_cfg["incremental_max_fraction"] = max_fraction
+
+    local_cfg = solver_cfg.get("local_correction", None)
+    if local_cfg is not None:
+        if not isinstance(local_cfg, dict):
+            logger.error("Solver parameter 'local_correction' must be an object")
+            return False
+        if not isinstance(local_cfg.get("enabled", False), bool):
+            logger.error("Solver 'local_correction.enabled' must be true or false")
+            return False
+        validate_every = local_cfg.get("validate_every", 25)
+        if isinstance(validate_every, bool) or not isinstance(validate_every, int) or validate_every < 0:
+            logger.error("Solver 'local_correction.validate_every' must be an integer >= 0 (0 = never)")
+            return False
+        try:
+            halo = float(local_cfg.get("halo", 10.0))
+            validation_rtol = float(local_cfg.get("validation_rtol", 1e-4))
+            local_rtol = float(local_cfg.get("rtol", 1e-8))
+            residual_rtol = float(local_cfg.get("residual_rtol", local_rtol))
+            local_max_it = int(local_cfg.get("max_iterations", 200))
+        except (TypeError, ValueError):
+            logger.error("Solver 'local_correction' parameters must be numeric")
+            return False
+        if halo < 0 or validation_rtol <= 0 or local_rtol <= 0 or residual_rtol <= 0 or local_max_it < 1:
+            logger.error(
+                "Solver 'local_correction' requires halo >= 0, validation_rtol > 0, rtol > 0, "
+                "residual_rtol > 0 and max_iterations >= 1"
+            )
+            return False
+        local_cfg.update({
+            "halo": halo,
+            "validate_every": validate_every,
+            "validation_rtol": validation_rtol,
+            "rtol": local_rtol,
+            "residual_rtol": residual_rtol,
+            "max_iterations": local_max_it,
+        })
+
+    recycle = str(solver_cfg.get("recycle", "off")).lower()
+    if recycle not in ("off", "projection", "deflation"):
+        logger.error("Solver parameter 'recycle' must be 'off', 'projection' or 'deflation'")
+        return False
+    solver_cfg["recycle"] = recycle
+    try:
+        recycle_size = int(solver_cfg.get("recycle_size", 8))
+    except (TypeError, ValueError):
+        logger.error("Solver parameter 'recycle_size' must be an integer")
+        return False
+    if recycle_size < 1:
+        logger.error("Solver parameter 'recycle_size' must be >= 1")
+        return False
+    solver_cfg["recycle_size"] = recycle_size
+
+    evaluator = str(solver_cfg.get("current_evaluator", "surface")).lower()
+    if evaluator not in ("surface", "residual", "energy"):
+        logger.error("Solver parameter 'current_evaluator' must be 'surface', 'residual' or 'energy'")
+        return False
+    solver_cfg["current_evaluator"] = evaluator
+
+    stopping = str(solver_cfg.get("stopping", "residual")).lower()
+    if stopping not in ("residual", "current"):
+        logger.error("Solver parameter 'stopping' must be 'residual' or 'current'")
+        return False
+    solver_cfg["stopping"] = stopping
+
+    try:
+        current_rtol = float(solver_cfg.get("current_rtol", 1e-5))
+        check_every = int(solver_cfg.get("current_check_every", 5))
+    except (TypeError, ValueError):
+        logger.error("Solver parameters 'current_rtol' and 'current_check_every' must be numeric")
+        return False
+    if current_rtol <= 0:
+        logger.error("Solver parameter 'current_rtol' must be > 0")
+        return False
+    if check_every < 1:
+        logger.error("Solver parameter 'current_check_every' must be >= 1")
+        return False
+    solver_cfg["current_rtol"] = current_rtol
+    solver_cfg["current_check_every"] = check_every
+
+    return True
+
+def _validate_sampling_config(sampling_cfg):
+    """
+    Validate and normalize the optional ``movement.sampling`` block in place.
+
+    Args:
+        sampling_cfg: Sampling configuration dictionary
+
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    if not isinstance(sampling_cfg, dict):
+        logger.error("Movement parameter 'sampling' must be an object")
+        return False
+
+    mode = str(sampling_cfg.get("mode", "uniform")).lower()
+    if mode not in ("uniform", "adaptive"):
+        logger.error("Sampling parameter 'mode' must be 'uniform' or 'adaptive'")
+        return False
+    sampling_cfg["mode"] = mode
+
+    try:
+        coarse_stride = int(sampling_cfg.get("coarse_stride", 8))
+        current_tol = float(sampling_cfg.get("current_tol", 0.005))
+        curvature_tol = sampling_cfg.get("curvature_tol", None)
+        curvature_tol = float(curvature_tol) if curvature_tol is not None else None
+    except (TypeError, ValueError):
+        logger.error("Sampling parameters 'coarse_stride', 'current_tol' and 'curvature_tol' must be numeric")
+        return False
+    if coarse_stride < 1:
+        logger.error("Sampling parameter 'coarse_stride' must be >= 1")
+        return False
+    if current_tol <= 0 or (curvature_tol is not None and curvature_tol <= 0):
+        logger.error("Sampling tolerances must be > 0")
+        return False
+    sampling_cfg["coarse_stride"] = coarse_stride
+    sampling_cfg["current_tol"] = current_tol
+    sampling_cfg["curvature_tol"] = curvature_tol
+
+    return True
+
+def _validate_stamp_config(stamp_cfg):
+    """
+    Validate and normalize the optional ``simulation.analyte_stamp`` block in place.
+
+    Args:
+        stamp_cfg: Analyte stamp configuration dictionary
+
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    if not isinstance(stamp_cfg, dict):
+        logger.error("Simulation parameter 'analyte_stamp' must be an object")
+        return False
+
+    for key in ("enabled", "validate"):
+        if key in stamp_cfg and not isinstance(stamp_cfg[key], bool):
+            logger.error(f"Analyte stamp parameter '{key}' must be true or false")
+            return False
+
+    try:
+        resolution = float(stamp_cfg.get("resolution", 0.5))
+        tolerance = float(stamp_cfg.get("tolerance", 0.02))
+    except (TypeError, ValueError):
+        logger.error("Analyte stamp parameters 'resolution' and 'tolerance' must be numeric")
+        return False
+    if resolution <= 0 or tolerance <= 0:
+        logger.error("Analyte stamp parameters 'resolution' and 'tolerance' must be > 0")
+        return False
+    stamp_cfg["resolution"] = resolution
+    stamp_cfg["tolerance"] = tolerance
+
+    return True
+
 def validate_config(config, require_analyte=True):
     """
     Validate configuration dictionary.
@@ -214,6 +437,83 @@ def validate_config(config, require_analyte=True):
             return False
         sim_section["gmsh_fine_center_mode"] = fine_center_mode
 
+    if "solver" in sim_section and sim_section["solver"] is not None:
+        if not _validate_solver_config(sim_section["solver"]):
+            return False
+
+    charge_cutoff = sim_section.get("charge_cutoff")
+    if charge_cutoff is not None:
+        try:
+            charge_cutoff = float(charge_cutoff)
+        except (TypeError, ValueError):
+            logger.error("Simulation parameter 'charge_cutoff' must be numeric or null")
+            return False
+        if charge_cutoff <= 0:
+            logger.error("Simulation parameter 'charge_cutoff' must be > 0")
+            return False
+        sim_section["charge_cutoff"] = charge_cutoff
+
+    try:
+        charge_grid_resolution = float(sim_section.get("charge_grid_resolution", 1.0))
+    except (TypeError, ValueError):
+        logger.error("Simulation parameter 'charge_grid_resolution' must be numeric")
+        return False
+    if charge_grid_resolution < 0:
+        logger.error("Simulation parameter 'charge_grid_resolution' must be >= 0")
+        return False
+    sim_section["charge_grid_resolution"] = charge_grid_resolution
+
+    if not isinstance(sim_section.get("charge_potential_cache", True), bool):
+        logger.error("Simulation parameter 'charge_potential_cache' must be true or false")
+        return False
+
+    kernel = str(sim_section.get("conductivity_kernel", "numpy")).lower()
+    if kernel not in ("numpy", "numba"):
+        logger.error("Simulation parameter 'conductivity_kernel' must be 'numpy' or 'numba'")
+        return False
+    sim_section["conductivity_kernel"] = kernel
+
+    surface_distance = str(sim_section.get("surface_distance", "nearest_center")).lower()
+    if surface_distance not in ("nearest_center", "exact"):
+        logger.error("Simulation parameter 'surface_distance' must be 'nearest_center' or 'exact'")
+        return False
+    sim_section["surface_distance"] = surface_distance
+
+    precision = str(sim_section.get("precision", "double")).lower()
+    if precision not in ("double", "single"):
+        logger.error("Simulation parameter 'precision' must be 'double' or 'single'")
+        return False
+    sim_section["precision"] = precision
+
+    pore_evaluation = str(sim_section.get("pore_evaluation", "grid")).lower()
+    if pore_evaluation not in ("grid", "analytic"):
+        logger.error("Simulation parameter 'pore_evaluation' must be 'grid' or 'analytic'")
+        return False
+    sim_section["pore_evaluation"] = pore_evaluation
+
+    distance_engine = str(sim_section.get("distance_engine", "numba")).lower()
+    if distance_engine not in ("subprocess", "kdtree", "numba"):
+        logger.error("Simulation parameter 'distance_engine' must be 'subprocess', 'kdtree' or 'numba'")
+        return False
+    sim_section["distance_engine"] = distance_engine
+
+    distance_threads = sim_section.get("distance_threads")
+    if distance_threads is not None:
+        if isinstance(distance_threads, bool) or not isinstance(distance_threads, int):
+            logger.error("Simulation parameter 'distance_threads' must be an integer or null")
+            return False
+        if distance_threads < 1:
+            logger.error("Simulation parameter 'distance_threads' must be >= 1")
+            return False
+
+    if sim_section.get("analyte_stamp") is not None:
+        if not _validate_stamp_config(sim_section["analyte_stamp"]):
+            return False
+
+    if config["movement"].get("sampling") is not None:
+        if not _validate_sampling_config(config["movement"]["sampling"]):
+            return False
+
     # Validate input files exist
     input_pdb = config["input"]["moving_pdb"]
     if require_analyte:
@@ -306,10 +606,91 @@ def print_config_summary(config):
                 )
         if "cleanup_temp_files" in sim:
             logger.info(f"  Cleanup temporary files: {sim['cleanup_temp_files']}")
+        solver_cfg = sim.get("solver") or {}
+        if solver_cfg:
+            logger.info("  Solver preset: %s", solver_cfg.get("preset") or "gmres_hypre")
+            if solver_cfg.get("petsc_options"):
+                logger.info("  Solver PETSc options: %s", solver_cfg["petsc_options"])
+            logger.info(
+                "  Solver PC reuse: rebuild every %s solve(s), iteration growth %s",
+                solver_cfg.get("pc_rebuild_every", 1),
+                solver_cfg.get("pc_rebuild_iteration_growth", "off"),
+            )
+            logger.info("  Solver initial guess: %s", solver_cfg.get("initial_guess", "zero"))
+            logger.info("  Current evaluator: %s", solver_cfg.get("current_evaluator", "surface"))
+            if solver_cfg.get("recycle", "off") != "off":
+                logger.info(
+                    "  Krylov recycling: %s (%d vectors)",
+                    solver_cfg["recycle"],
+                    solver_cfg.get("recycle_size", 8),
+                )
+            local_cfg = solver_cfg.get("local_correction") or {}
+            if local_cfg.get("enabled", False):
+                logger.info(
+                    "  Local correction: halo %.1f Å, residual rtol %.1e, "
+                    "validate every %d positions (rtol %.1e)",
+                    local_cfg.get("halo", 10.0),
+                    local_cfg.get("residual_rtol", local_cfg.get("rtol", 1e-8)),
+                    local_cfg.get("validate_every", 25),
+                    local_cfg.get("validation_rtol", 1e-4),
+                )
+            if solver_cfg.get("incremental_assembly", False):
+                logger.info(
+                    "  Incremental assembly: up to %.1f%% changed cells",
+                    100.0 * solver_cfg.get("incremental_max_fraction", 0.1),
+                )
+            if solver_cfg.get("stopping", "residual") == "current":
+                logger.info(
+                    "  Solver stopping: current within %.1e (checked every %d iterations)",
+                    solver_cfg.get("current_rtol", 1e-5),
+                    solver_cfg.get("current_check_every", 5),
+                )
+
+        if config["simulation"].get("use_charges", False):
+            debye = config["simulation"].get("debye_length", 2.15)
+            charge_cutoff = config["simulation"].get("charge_cutoff")
+            grid = config["simulation"].get("charge_grid_resolution", 1.0)
+            logger.info(
+                "  Charges: Debye length %.2f Å, potential cutoff %.2f Å, %s",
+                debye, charge_cutoff if charge_cutoff is not None else 4.0 * debye,
+                f"analyte potential grid {grid:.2f} Å" if grid else "direct analyte potential",
+            )
+        if config["simulation"].get("conductivity_kernel", "numpy") != "numpy":
+            logger.info("  Conductivity kernel: %s", config["simulation"]["conductivity_kernel"])
+        if config["simulation"].get("surface_distance", "nearest_center") != "nearest_center":
+            logger.info("  Analyte surface distance: %s", config["simulation"]["surface_distance"])
+        if config["simulation"].get("precision", "double") != "double":
+            logger.info("  Grid/DOF array precision: %s (solve in double)",
+                        config["simulation"]["precision"])
+        if config["simulation"].get("pore_evaluation", "grid") != "grid":
+            logger.info("  Pore conductivity: %s (no base grid for analytic pore shapes)",
+                        config["simulation"]["pore_evaluation"])
+        if (config["pore_geometry"].get("pore_type") == "biological"
+                and config["simulation"].get("distance_engine", "numba") != "numba"):
+            logger.info("  Pore distance field: %s engine",
+                        config["simulation"]["distance_engine"])
+        if (config["pore_geometry"].get("pore_type") == "biological"
+                and config["simulation"].get("distance_threads") is not None):
+            logger.info("  Pore distance field threads: %d", config["simulation"]["distance_threads"])
+        stamp_cfg = config["simulation"].get("analyte_stamp") or {}
+        if stamp_cfg.get("enabled", False):
+            logger.info(
+                "  Analyte stamp: %.2f Å grid (accuracy check %s)",
+                stamp_cfg.get("resolution", 0.5),
+                "on" if stamp_cfg.get("validate", True) else "off",
+            )
 
         movement = config["movement"]
         logger.info(f"  Z Range: {movement['z_start']} to {movement['z_end']} Å")
         logger.info(f"  Z Step: {movement['z_step']} Å")
+        sampling = movement.get("sampling") or {}
+        if sampling.get("mode", "uniform") == "adaptive":
+            logger.info(
+                "  Sampling: adaptive (coarse stride %d, current tol %.3g, curvature tol %s)",
+                sampling.get("coarse_stride", 8),
+                sampling.get("current_tol", 0.005),
+                sampling.get("curvature_tol", None),
+            )
         
         output = config["output"]
         logger.info(f"  Output Prefix: {output['output_prefix']}")
@@ -352,6 +733,9 @@ def create_example_config(pore_type="cylindrical", output_file="example_config.j
             "debye_length": 2.15,  # Angstroms, for ~2M KCl
             "bjerrum_length": 7.15,  # Angstroms, for water at 293K
             "charge_clip": 2.0,  # Clip cosh factor to [1/clip, clip] e.g. [0.5, 2.0]
+            "charge_cutoff": None,  # Screened-potential cutoff (Å); None = 4 Debye lengths
+            "charge_grid_resolution": 1.0,  # Analyte potential grid spacing (Å); 0 = direct sum
+            "charge_potential_cache": True,  # Cache the pore's FFT potential grid next to the distance field
             "xy_margin": 0.0,  # Additional XY padding applied to mesh extent (Å)
             "mesh_engine": "dolfinx",
             "gmsh_reproducible": False,
@@ -363,11 +747,53 @@ def create_example_config(pore_type="cylindrical", output_file="example_config.j
             "use_radius_overlap_check": False,
             "overlap_buffer": 0.0,
             "overlap_distance_threshold": None,
+            "solver": {
+                "preset": "gmres_hypre",  # "cg_boomeramg", "cg_gamg", "gmres_hypre" or "mumps_lu"
+                "petsc_options": {},  # Raw PETSc options overriding the preset
+                "pc_rebuild_every": 1,  # 1 = rebuild preconditioner every solve
+                "pc_rebuild_iteration_growth": None,  # e.g. 1.5 to rebuild on iteration growth
+                "initial_guess": "zero",  # "zero", "previous" or "open_pore"
+                "stopping": "residual",  # "residual" (ksp_rtol) or "current" (flux settled)
+                "current_rtol": 1e-5,  # Relative agreement of successive currents
+                "current_check_every": 5,  # Evaluate the current every N iterations
+                "current_evaluator": "surface",  # "surface", "residual" or "energy"
+                "incremental_assembly": False,  # Assemble only cells whose conductivity changed
+                "incremental_max_fraction": 0.1,  # Full assembly above this changed-cell fraction
+                "recycle": "off",  # "off", "projection" or "deflation" across positions
+                "recycle_size": 8,  # Previous solutions kept in the recycle space
+                "local_correction": {
+                    "enabled": False,  # Correct the open-pore field on a subdomain around the analyte
+                    "halo": 10.0,  # Å added beyond analyte extent + cutoff
+                    "rtol": 1e-8,  # Subdomain solve tolerance
+                    "residual_rtol": 1e-8,  # Full solve when the global relative residual is above this
+                    "max_iterations": 200,
+                    "validate_every": 25,  # Compare with a full solve every N positions (0 = never)
+                    "validation_rtol": 1e-4,  # Fall back to the full-solve current above this difference
+                },
+            },
+            "conductivity_kernel": "numpy",  # "numba" = fused compiled conductivity update
+            "surface_distance": "nearest_center",  # "exact" = nearest atom surface; cutoff stays on centre distance
+            "precision": "double",  # "single" = float32 grids, distance fields and DOF arrays
+            "pore_evaluation": "grid",  # "analytic" = closed-form cylindrical/conical/double-cone pores
+            "distance_engine": "numba",  # Biological pore distance field: "numba"/"kdtree" in process, "subprocess" = pdb2xyz.py + gen_dist.py
+            "distance_threads": None,  # gen_dist kernel threads ("numba"/"subprocess"); null = all cores
+            "analyte_stamp": {
+                "enabled": False,  # Sample a precomputed analyte distance grid instead of atom queries
+                "resolution": 0.5,  # Stamp grid spacing (Å)
+                "validate": True,  # Compare with the exact atom query at the first position
+                "tolerance": 0.02,  # Warn above this mean |Δσ| / bulk conductivity
+            },
         },
         "movement": {
             "z_start": 150.0,
             "z_end": -150.0,
-            "z_step": 1.0
+            "z_step": 1.0,
+            "sampling": {
+                "mode": "uniform",  # "uniform" or "adaptive" (bisect where the current varies)
+                "coarse_stride": 8,  # Grid steps between initial adaptive samples
+                "current_tol": 0.005,  # Refine where current changes > this fraction of open pore
+                "curvature_tol": None,  # Optional slope-change tolerance (fraction of open pore)
+            },
         },
         "output": {
             "output_prefix": f"{pore_type}_sem",
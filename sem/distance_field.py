@@ -0,0 +1,124 @@
+"""
+In-process engines for the gen_dist distance field of a biological pore.
+
+``compute_distance_field`` returns the grid that ``scripts/gen_dist.py``
+writes, in the ``(val3d, [Lm, Wm, Hm], [nx, ny, nz])`` form that
+``readbinGrid`` returns. It does not write or read files, and it does not
+start a subprocess. The grid and atom conventions follow gen_dist:
+
+- Grid points sit at ``lower + i * resolution`` for
+  ``i = 0 .. int(box / resolution)``.
+- Atoms are kept only if they lie inside ``(lower, upper]``.
+- Values are ``min_a(|p - a| - r_a)``, clamped to ``[0, cutoff]``.
+
+Engines (``DISTANCE_ENGINES``):
+
+``"kdtree"``
+    Batched KD-tree search for the exact nearest atom surface
+    (``AnalyteIndex.body_surface_distances``), one z-slab at a time.
+``"numba"``
+    gen_dist's own generator and prange-parallel kernel, called on the
+    arrays through ``gen_dist.compute_distance_field``.
+
+The ``"subprocess"`` pipeline (pdb2xyz.py, then gen_dist.py, then
+``readbinGrid``) lives in ``BiologicalPore``.
+"""
+
+import logging
+
+import numpy as np
+
+from .analyte_index import AnalyteIndex
+
+logger = logging.getLogger(__name__)
+
+DISTANCE_ENGINES = ("subprocess", "kdtree", "numba")
+
+# gen_dist searches with cutoff + 2, so larger radii can be missed.
+_SEARCH_MARGIN = 2.0
+
+
+class DistanceFieldError(ValueError):
+    """An in-process engine cannot compute the requested field (unknown engine, empty box)."""
+
+
+def _select_atoms(positions, radii, lower, upper):
+    """Atoms gen_dist keeps (``lower < p <= upper``), translated to ``lower``."""
+    positions = np.asarray(positions, dtype=float)
+    radii = np.broadcast_to(np.asarray(radii, dtype=float), positions.shape[:1])
+    keep = np.all((positions <= upper) & (positions - lower > 0), axis=1)
+    return positions[keep] - lower, radii[keep]
+
+
+def _kdtree_field(positions, radii, counts, resolution, cutoff):
+    field = np.full(tuple(counts), cutoff, dtype=np.float32)
+    if positions.shape[0] == 0:
+        return field
+    index = AnalyteIndex(positions, np.zeros(3), radii)
+    x = np.arange(counts[0]) * resolution
+    y = np.arange(counts[1]) * resolution
+    Xs, Ys = np.meshgrid(x, y, indexing="ij")
+    plane = np.column_stack([Xs.ravel(), Ys.ravel(), np.zeros(Xs.size)])
+    for k in range(counts[2]):
+        plane[:, 2] = k * resolution
+        # gen_dist clamps the surface distance itself at the cutoff.
+        surface = index.body_surface_distances(plane, cutoff, center_cutoff=False)
+        field[:, :, k] = np.where(np.isfinite(surface), surface, cutoff).reshape(Xs.shape)
+    return field
+
+
+def _numba_field(positions, radii, lower, upper, resolution, cutoff, num_threads):
+    try:
+        from .scripts.gen_dist import compute_distance_field as gen_dist_field
+    except ImportError:  # pragma: no cover - scripts not packaged
+        from sem.scripts.gen_dist import compute_distance_field as gen_dist_field
+
+    # gen_dist filters and translates the atoms itself; its field is indexed [z, y, x].
+    field = gen_dist_field(positions, radii, *lower, *upper, resolution, cutoff,
+                           num_threads=num_threads)
+    return field.transpose(2, 1, 0)
+
+
+def compute_distance_field(positions, radii, lower, upper, resolution, cutoff, engine="numba",
+                           num_threads=None):
+    """
+    gen_dist distance field of atoms on a box grid, computed in process.
+
+    Args:
+        positions: Mx3 atom positions (Å)
+        radii: M atom radii (Å)
+        lower: (x, y, z) lower box corner (Å)
+        upper: (x, y, z) upper box corner (Å)
+        resolution: Grid spacing (Å)
+        cutoff: Distance cap (Å)
+        engine: "kdtree" or "numba"
+        num_threads: Threads of the "numba" engine (None = all available)
+
+    Returns:
+        (val3d, [Lm, Wm, Hm], [nx, ny, nz]) as from ``readbinGrid`` on the
+        gen_dist output; ``val3d`` is float32 indexed [x, y, z]
+    """
+    if engine not in ("kdtree", "numba"):
+        raise DistanceFieldError(f"Unknown in-process distance engine {engine!r}")
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    box = upper - lower
+    counts = [int(b / resolution) + 1 for b in box]
+    atoms, atom_radii = _select_atoms(positions, radii, lower, upper)
+    if atoms.shape[0] == 0:
+        raise DistanceFieldError("No atoms inside the distance-field box")
+    if atom_radii.max() > _SEARCH_MARGIN:
+        logger.warning(
+            "Atom radii above %.1f Å can be missed by gen_dist's cell search; "
+            "the engines may differ near those atoms.", _SEARCH_MARGIN,
+        )
+
+    if engine == "kdtree":
+        val3d = _kdtree_field(atoms, atom_radii, counts, resolution, cutoff)
+    else:
+        val3d = _numba_field(positions, radii, lower, upper, resolution, cutoff, num_threads)
+
+    # Physical extents exactly as readbinGrid derives them (float32 spacing).
+    delta = np.float32(resolution)
+    extents = [delta * n - delta for n in counts]
+    return val3d, extents, counts
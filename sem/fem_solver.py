@@ -0,0 +1,627 @@
+"""
+Persistent linear solver for repeated SEM solves on a fixed mesh.
+
+A translocation trace solves the same Laplace problem at every z-position;
+only the DG0 conductivity coefficient changes between solves. The mesh,
+function spaces, boundary conditions and matrix sparsity pattern are fixed
+for the lifetime of a mesh, so ``PersistentPoissonSolver`` compiles the forms,
+allocates the PETSc matrix/vectors and creates the KSP once, then reassembles
+the matrix values in place for each solve.
+
+Consecutive positions only differ by a small analyte displacement, so the
+preconditioner built for one solve is usually a good preconditioner for the
+next. ``PreconditionerReusePolicy`` decides when the (hypre/AMG) setup is
+rebuilt and when it is lagged. For the same reason the previous potential (or
+the open-pore potential) is a good Krylov initial guess; ``solve`` accepts one
+and ``interpolate_between_meshes`` carries it over when the mesh is rebuilt.
+
+Only the current through the top boundary is used downstream, so the solve
+can optionally stop once that flux has settled (``CurrentConvergenceTest``)
+instead of driving the residual all the way down to ``ksp_rtol``.
+
+The bilinear form is linear in the conductivity, so when only a few cells
+change between positions the matrix can be updated incrementally,
+``A += a(delta_sig)``, by assembling the delta form over the changed cells
+only. Above a configurable changed-cell fraction a full reassembly is used.
+
+The systems of a trace form a slowly varying sequence. ``RecycleSpace`` keeps
+the last few solutions and either projects the new system onto them for the
+initial guess (Galerkin projection) or hands them to PETSc's deflation
+preconditioner as a deflation space.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Optional
+
+import numpy as np
+import ufl
+import dolfinx.fem as fem
+from dolfinx.fem.petsc import (
+    apply_lifting,
+    assemble_matrix,
+    assemble_vector,
+    create_matrix,
+    set_bc,
+)
+from petsc4py import PETSc
+
+logger = logging.getLogger(__name__)
+
+
+# Options used by the original per-call LinearProblem solve.
+DEFAULT_PETSC_OPTIONS = {
+    "ksp_type": "gmres",
+    "pc_type": "hypre",
+    "ksp_rtol": 1e-10,
+    "ksp_max_it": 40000,
+}
+
+# Named solver configurations. The operator sig * grad(u) . grad(v) is
+# symmetric positive definite, so CG with an algebraic multigrid
+# preconditioner is the natural choice; GMRES + hypre is the historical
+# default and MUMPS LU is a robust direct option for small meshes.
+SOLVER_PRESETS = {
+    "gmres_hypre": dict(DEFAULT_PETSC_OPTIONS),
+    "cg_boomeramg": {
+        "ksp_type": "cg",
+        "pc_type": "hypre",
+        "pc_hypre_type": "boomeramg",
+        "ksp_rtol": 1e-10,
+        "ksp_max_it": 40000,
+    },
+    "cg_gamg": {
+        "ksp_type": "cg",
+        "pc_type": "gamg",
+        "ksp_rtol": 1e-10,
+        "ksp_max_it": 40000,
+    },
+    "mumps_lu": {
+        "ksp_type": "preonly",
+        "pc_type": "lu",
+        "pc_factor_mat_solver_type": "mumps",
+    },
+}
+
+DEFAULT_SOLVER_PRESET = "gmres_hypre"
+
+INITIAL_GUESS_MODES = ("zero", "previous", "open_pore")
+
+STOPPING_MODES = ("residual", "current")
+
+CURRENT_EVALUATORS = ("surface", "residual", "energy")
+
+RECYCLE_MODES = ("off", "projection", "deflation")
+
+
+def resolve_petsc_options(solver_config: Optional[dict]) -> dict:
+    """
+    Build the PETSc options for a ``simulation.solver`` config block.
+
+    The named ``preset`` supplies the base options; entries in
+    ``petsc_options`` are passed through unchanged and override the preset.
+    """
+    solver_config = solver_config or {}
+    preset = solver_config.get("preset") or DEFAULT_SOLVER_PRESET
+    if preset not in SOLVER_PRESETS:
+        raise ValueError(
+            f"Unknown solver preset '{preset}'. Available: {', '.join(SOLVER_PRESETS)}"
+        )
+    options = dict(SOLVER_PRESETS[preset])
+    options.update(solver_config.get("petsc_options") or {})
+    return options
+
+
+def interpolate_between_meshes(u_to, u_from, padding: float = 1e-8):
+    """
+    Interpolate ``u_from`` onto ``u_to`` when the two live on different meshes.
+
+    Used to carry warm-start potentials across mesh rebuilds. Points of the
+    new mesh not covered by the old one are left at zero.
+    """
+    mesh_to = u_to.function_space.mesh
+    tdim = mesh_to.topology.dim
+    cell_map = mesh_to.topology.index_map(tdim)
+    cells = np.arange(cell_map.size_local + cell_map.num_ghosts, dtype=np.int32)
+    interpolation_data = fem.create_interpolation_data(
+        u_to.function_space, u_from.function_space, cells, padding=padding
+    )
+    u_to.interpolate_nonmatching(u_from, cells, interpolation_data)
+    u_to.x.scatter_forward()
+
+
+class PreconditionerReusePolicy:
+    """
+    Decide whether the preconditioner is rebuilt before a solve.
+
+    Args:
+        rebuild_every: Rebuild at least every N solves (1 = every solve,
+            0 = never by count; only iteration growth triggers a rebuild).
+        iteration_growth: Rebuild when the last solve needed more than
+            ``iteration_growth`` times the iterations of the first solve after
+            the previous rebuild. ``None`` disables the check.
+    """
+
+    def __init__(self, rebuild_every: int = 1, iteration_growth: Optional[float] = None):
+        if rebuild_every < 0:
+            raise ValueError("rebuild_every must be >= 0")
+        if iteration_growth is not None and iteration_growth <= 1.0:
+            raise ValueError("iteration_growth must be > 1")
+        self.rebuild_every = int(rebuild_every)
+        self.iteration_growth = float(iteration_growth) if iteration_growth is not None else None
+        self.reset()
+
+    @classmethod
+    def from_config(cls, solver_config: Optional[dict]):
+        """Create a policy from the ``simulation.solver`` config block."""
+        solver_config = solver_config or {}
+        return cls(
+            rebuild_every=int(solver_config.get("pc_rebuild_every", 1)),
+            iteration_growth=solver_config.get("pc_rebuild_iteration_growth", None),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.rebuild_every != 1
+
+    def reset(self):
+        """Force a rebuild before the next solve."""
+        self._force_rebuild = True
+        self._solves_since_rebuild = 0
+        self._reference_iterations = None
+        self._last_iterations = None
+
+    def should_rebuild(self) -> bool:
+        if self._force_rebuild or self.rebuild_every == 1:
+            return True
+        if self.rebuild_every > 1 and self._solves_since_rebuild >= self.rebuild_every:
+            return True
+        if (
+            self.iteration_growth is not None
+            and self._reference_iterations is not None
+            and self._last_iterations is not None
+            and self._last_iterations > self.iteration_growth * max(self._reference_iterations, 1)
+        ):
+            return True
+        return False
+
+    def record(self, iterations: int, rebuilt: bool):
+        """Record the outcome of a solve."""
+        if rebuilt:
+            self._force_rebuild = False
+            self._solves_since_rebuild = 0
+            self._reference_iterations = iterations
+        self._solves_since_rebuild += 1
+        self._last_iterations = iterations
+
+
+class CurrentConvergenceTest:
+    """
+    KSP convergence test that stops once the boundary current has settled.
+
+    The current is a linear functional of the solution, ``I = g . x``, where
+    ``g`` is the assembled flux form. Every ``check_every`` iterations the
+    current iterate is built and the functional evaluated; the solve stops
+    when two successive values agree to ``rtol``. Before that, the KSP
+    rtol/atol/dtol/max_it checks apply as in PETSc's default test: rtol and
+    dtol are relative to the norm of ``b`` (``B b`` for preconditioned
+    norms), or to the initial residual when the initial guess is zero, so a
+    warm start is not held to a stricter tolerance.
+
+    Args:
+        functional: PETSc vector ``g`` with ``I = g . x``.
+        rtol: Relative tolerance on successive current values.
+        check_every: Evaluate the current every N iterations.
+    """
+
+    def __init__(self, functional, rtol: float = 1e-5, check_every: int = 5):
+        self.functional = functional
+        self.rtol = float(rtol)
+        self.check_every = max(int(check_every), 1)
+        self._work = functional.duplicate()
+        self._rnorm0 = None
+        self._previous = None
+        self.stopped_on_current = False
+
+    def _reference_norm(self, ksp, rnorm):
+        """Norm that rtol and dtol are relative to (as ``KSPConvergedDefault``)."""
+        if not ksp.getInitialGuessNonzero():
+            return rnorm
+        b = ksp.getRhs()
+        norm_type = ksp.getNormType()
+        if norm_type == PETSc.KSP.NormType.UNPRECONDITIONED or ksp.getPCSide() == PETSc.PC.Side.RIGHT:
+            return b.norm()
+        ksp.getPC().apply(b, self._work)
+        if norm_type == PETSc.KSP.NormType.NATURAL:
+            return abs(b.dot(self._work)) ** 0.5
+        return self._work.norm()
+
+    def __call__(self, ksp, its, rnorm):
+        reason = PETSc.KSP.ConvergedReason
+        if its == 0:
+            self._rnorm0 = self._reference_norm(ksp, rnorm)
+            self._previous = None
+            self.stopped_on_current = False
+        if not np.isfinite(rnorm):
+            return reason.DIVERGED_NANORINF
+        rtol, atol, dtol, max_it = ksp.getTolerances()
+        if rnorm <= max(rtol * self._rnorm0, atol):
+            return reason.CONVERGED_RTOL if rnorm > atol else reason.CONVERGED_ATOL
+        if its >= max_it:
+            return reason.DIVERGED_ITS
+        if dtol > 0 and rnorm >= dtol * self._rnorm0:
+            return reason.DIVERGED_DTOL
+        if its > 0 and its % self.check_every == 0:
+            value = self.functional.dot(ksp.buildSolution(self._work))
+            if self._previous is not None and abs(value - self._previous) <= self.rtol * abs(value):
+                self.stopped_on_current = True
+                # PETSc has no dedicated reason for a user goal; report it as a
+                # successful fixed-iteration stop.
+                return reason.CONVERGED_ITS
+            self._previous = value
+        return reason.CONVERGED_ITERATING
+
+    def destroy(self):
+        for obj in (self.functional, self._work):
+            try:
+                obj.destroy()
+            except Exception:
+                pass
+
+
+class RecycleSpace:
+    """
+    Recycled subspace built from the most recent solutions.
+
+    Args:
+        size: Number of previous solutions kept (oldest dropped first).
+    """
+
+    def __init__(self, size: int = 8):
+        self.size = max(int(size), 1)
+        self.vectors = []
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def update(self, x):
+        """Append a copy of solution ``x``, dropping the oldest when full."""
+        if len(self.vectors) == self.size:
+            self.vectors.pop(0).destroy()
+        self.vectors.append(x.copy())
+
+    def project(self, A, b, x) -> bool:
+        """
+        Write the Galerkin projection of ``A x = b`` onto the space into ``x``.
+
+        Minimises the energy-norm error over span(vectors) for SPD ``A``; the
+        small projected system is solved in the least-squares sense because
+        consecutive solutions are nearly parallel.
+
+        Returns:
+            True if a guess was written.
+        """
+        m = len(self.vectors)
+        if m == 0:
+            return False
+        work = self.vectors[0].duplicate()
+        G = np.empty((m, m))
+        rhs = np.empty(m)
+        for j, vj in enumerate(self.vectors):
+            A.mult(vj, work)
+            for i in range(m):
+                G[i, j] = self.vectors[i].dot(work)
+            rhs[j] = vj.dot(b)
+        work.destroy()
+        coeffs = np.linalg.lstsq(G, rhs, rcond=1e-12)[0]
+        x.set(0.0)
+        x.maxpy(coeffs, self.vectors)
+        return True
+
+    def as_matrix(self, comm):
+        """Dense (n x m) PETSc matrix whose columns are the stored vectors."""
+        n_local = self.vectors[0].getLocalSize()
+        n_global = self.vectors[0].getSize()
+        W = PETSc.Mat().createDense([(n_local, n_global), (None, len(self.vectors))], comm=comm)
+        W.setUp()
+        columns = W.getDenseArray()
+        for j, vec in enumerate(self.vectors):
+            columns[:, j] = vec.getArray(readonly=True)
+        W.assemble()
+        return W
+
+    def clear(self):
+        for vec in self.vectors:
+            vec.destroy()
+        self.vectors = []
+
+
+class PersistentPoissonSolver:
+    """
+    Assemble-and-solve helper that keeps forms, PETSc objects and the KSP alive.
+
+    Args:
+        a: Bilinear UFL form (depends on the conductivity coefficient).
+        L: Linear UFL form.
+        bcs: Dirichlet boundary conditions.
+        V: Function space of the solution.
+        petsc_options: PETSc options applied under a solver-specific prefix.
+        options_prefix: Base prefix for the PETSc options database.
+        reuse_policy: Preconditioner reuse policy (default: rebuild every solve).
+        current_form: Linear UFL form of the test function whose assembled
+            vector gives the current (enables ``stopping="current"``).
+        current_rtol: Relative tolerance on successive current values.
+        current_check_every: Evaluate the current every N iterations.
+        coefficient: DG0 coefficient ``a`` is linear in; enables incremental
+            assembly over the cells where it changed.
+        incremental_max_fraction: Largest global fraction of changed cells for
+            which the incremental path is used (otherwise full assembly).
+        recycle: "off", "projection" (initial guess projected onto previous
+            solutions) or "deflation" (previous solutions as PCDEFLATION space,
+            wrapping the configured preconditioner; the space is refreshed
+            whenever the preconditioner is rebuilt).
+        recycle_size: Number of previous solutions kept.
+    """
+
+    _instance_count = 0
+
+    def __init__(self, a, L, bcs, V, *, petsc_options: Optional[dict] = None,
+                 options_prefix: str = "sem_",
+                 reuse_policy: Optional[PreconditionerReusePolicy] = None,
+                 current_form=None, current_rtol: float = 1e-5,
+                 current_check_every: int = 5,
+                 coefficient=None, incremental_max_fraction: float = 0.1,
+                 recycle: str = "off", recycle_size: int = 8):
+        build_start = time.time()
+
+        self.V = V
+        self.bcs = list(bcs)
+        self.a_form = fem.form(a)
+        self.L_form = fem.form(L)
+
+        self.A = create_matrix(self.a_form)
+        # assemble_vector allocates a correctly-sized ghosted vector; its
+        # values are overwritten on every solve.
+        self.b = assemble_vector(self.L_form)
+        self.uh = fem.Function(V)
+        self.x = self.uh.x.petsc_vec
+
+        PersistentPoissonSolver._instance_count += 1
+        self.options_prefix = f"{options_prefix}{PersistentPoissonSolver._instance_count}_"
+        self.ksp = PETSc.KSP().create(V.mesh.comm)
+        self.ksp.setOperators(self.A)
+        self.ksp.setOptionsPrefix(self.options_prefix)
+        self.A.setOptionsPrefix(self.options_prefix)
+        if recycle not in RECYCLE_MODES:
+            raise ValueError(f"recycle must be one of {RECYCLE_MODES}")
+        petsc_options = dict(petsc_options or DEFAULT_PETSC_OPTIONS)
+        self.recycle = recycle if petsc_options.get("ksp_type") != "preonly" else "off"
+        if self.recycle == "deflation":
+            # The configured preconditioner becomes the inner PC of PCDEFLATION.
+            for key in [k for k in petsc_options if k.startswith("pc_")]:
+                petsc_options[f"deflation_{key}"] = petsc_options.pop(key)
+            petsc_options["pc_type"] = "deflation"
+        self.set_petsc_options(petsc_options)
+        self.reuse_policy = reuse_policy or PreconditionerReusePolicy()
+        self.recycle_space = RecycleSpace(recycle_size) if self.recycle != "off" else None
+
+        self.is_direct = self.ksp.getType() == PETSc.KSP.Type.PREONLY
+
+        self.coefficient = coefficient
+        self.incremental_max_fraction = float(incremental_max_fraction)
+        self._assembled_coefficient = None
+        if coefficient is not None:
+            # Delta form a(delta_sig) restricted to cell subdomain 1: compiled
+            # once, then bound to each step's changed cells with create_form.
+            self._delta_coefficient = fem.Function(coefficient.function_space)
+            delta_form = ufl.replace(a, {coefficient: self._delta_coefficient})
+            delta_form = ufl.Form([itg.reconstruct(subdomain_id=1) for itg in delta_form.integrals()])
+            self._delta_compiled = fem.compile_form(V.mesh.comm, delta_form)
+            tdim = V.mesh.topology.dim
+            self._num_owned_cells = V.mesh.topology.index_map(tdim).size_local
+            self._num_global_cells = V.mesh.topology.index_map(tdim).size_global
+            self._cell_coefficient_dofs = coefficient.function_space.dofmap.list[:self._num_owned_cells, 0]
+
+        self.current_form = None
+        self.current_test = None
+        if current_form is not None and not self.is_direct:
+            self.current_form = fem.form(current_form)
+            self.current_test = CurrentConvergenceTest(
+                assemble_vector(self.current_form), current_rtol, current_check_every
+            )
+        # Installed only for solves that may stop on the current; the others
+        # keep PETSc's default test.
+        self._current_test_installed = False
+
+        self.setup_time = time.time() - build_start
+        self.num_solves = 0
+        self.last_iterations = 0
+        self.last_converged_reason = 0
+        self.last_pc_reused = False
+        self.num_pc_setups = 0
+        self.last_assembly_time = 0.0
+        self.last_solve_time = 0.0
+        self.last_stopped_on_current = False
+        self.last_assembly_mode = "full"
+        self.last_changed_fraction = 1.0
+        self.last_recycled = False
+        self._deflation_space_set = False
+
+    def set_petsc_options(self, petsc_options: dict):
+        """Push ``petsc_options`` into the options database and refresh the KSP."""
+        opts = PETSc.Options()
+        opts.prefixPush(self.options_prefix)
+        for key, value in petsc_options.items():
+            opts[key] = value
+        opts.prefixPop()
+        self.ksp.setFromOptions()
+        self.A.setFromOptions()
+
+    def assemble_operator(self):
+        """
+        Bring the stiffness matrix up to date with the current coefficient.
+
+        Uses the incremental path when enabled and few cells changed since the
+        last assembly; otherwise reassembles all values in place.
+        """
+        if self.coefficient is not None and self._assembled_coefficient is not None:
+            values = self.coefficient.x.array
+            delta = values - self._assembled_coefficient
+            changed = np.flatnonzero(delta[self._cell_coefficient_dofs] != 0.0).astype(np.int32)
+            # Collective decision: every rank must take the same assembly path.
+            num_changed = self.V.mesh.comm.allreduce(changed.size)
+            fraction = num_changed / max(self._num_global_cells, 1)
+            self.last_changed_fraction = fraction
+            if num_changed == 0:
+                self.last_assembly_mode = "skipped"
+                return
+            if fraction <= self.incremental_max_fraction:
+                self._assemble_delta(delta, changed)
+                self._assembled_coefficient[:] = values
+                self.last_assembly_mode = "incremental"
+                return
+
+        self.A.zeroEntries()
+        assemble_matrix(self.A, self.a_form, bcs=self.bcs)
+        self.A.assemble()
+        self.last_assembly_mode = "full"
+        self.last_changed_fraction = 1.0
+        if self.coefficient is not None:
+            self._assembled_coefficient = self.coefficient.x.array.copy()
+
+    def _assemble_delta(self, delta: np.ndarray, cells: np.ndarray):
+        """Add the element matrices of ``a(delta)`` over ``cells`` into ``A``."""
+        self._delta_coefficient.x.array[:] = delta
+        delta_form = fem.create_form(
+            self._delta_compiled,
+            [self.V, self.V],
+            self.V.mesh,
+            {fem.IntegralType.cell: [(1, cells)]},
+            {self._delta_coefficient: self._delta_coefficient},
+            {},
+        )
+        # Assembly adds into A. The delta skips the Dirichlet rows/columns and
+        # the unit diagonal re-inserted on those rows is unchanged.
+        assemble_matrix(self.A, delta_form, bcs=self.bcs)
+        self.A.assemble()
+
+    def assemble_rhs(self):
+        """Reassemble the right-hand side including Dirichlet lifting."""
+        with self.b.localForm() as b_local:
+            b_local.set(0.0)
+        assemble_vector(self.b, self.L_form)
+        apply_lifting(self.b, [self.a_form], bcs=[self.bcs])
+        self.b.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
+        set_bc(self.b, self.bcs)
+
+    def assemble_current_functional(self):
+        """Reassemble the current functional vector for the present coefficients."""
+        g = self.current_test.functional
+        with g.localForm() as g_local:
+            g_local.set(0.0)
+        assemble_vector(g, self.current_form)
+        g.ghostUpdate(addv=PETSc.InsertMode.ADD, mode=PETSc.ScatterMode.REVERSE)
+
+    def solve(self, initial_guess: Optional[np.ndarray] = None, stop_on_current: bool = True,
+              use_recycle: bool = True, assemble: bool = True):
+        """
+        Assemble the system for the current coefficient values and solve it.
+
+        Args:
+            initial_guess: Local (owned + ghost) values used to start the
+                Krylov iteration. ``None`` starts from zero.
+            stop_on_current: Allow the current-based stopping test (when the
+                solver was built with ``current_form``); False solves to the
+                residual tolerance.
+            use_recycle: Use the recycle space (when configured) for this
+                solve; the solution is added to it either way.
+            assemble: Bring the operator and RHS up to date first; False
+                solves the system as last assembled.
+
+        Returns:
+            The solution ``fem.Function`` (owned by the solver and reused).
+        """
+        assembly_start = time.time()
+        if assemble:
+            self.assemble_operator()
+            self.assemble_rhs()
+        if self.current_test is not None:
+            if stop_on_current:
+                self.assemble_current_functional()
+            if stop_on_current != self._current_test_installed:
+                self.ksp.setConvergenceTest(self.current_test if stop_on_current else None)
+                self._current_test_installed = stop_on_current
+            self.current_test.stopped_on_current = False
+        self.last_assembly_time = time.time() - assembly_start
+
+        # A direct solve with a stale factorization is simply wrong, so lagging
+        # only applies to iterative solvers.
+        rebuild = self.is_direct or self.reuse_policy.should_rebuild()
+        self.ksp.getPC().setReusePreconditioner(not rebuild)
+
+        if initial_guess is not None:
+            self.uh.x.array[:] = initial_guess
+            self.ksp.setInitialGuessNonzero(True)
+        else:
+            self.ksp.setInitialGuessNonzero(False)
+
+        self.last_recycled = False
+        if use_recycle and self.recycle_space is not None and len(self.recycle_space) > 0:
+            if self.recycle == "projection":
+                self.last_recycled = self.recycle_space.project(self.A, self.b, self.x)
+                self.ksp.setInitialGuessNonzero(True)
+            elif rebuild:
+                # PCDEFLATION builds its coarse problem from the space during
+                # PC setup, which a reused preconditioner skips. The space is
+                # therefore only replaced on rebuild solves; lagged solves keep
+                # the space of the last rebuild along with the rest of the PC.
+                W = self.recycle_space.as_matrix(self.V.mesh.comm)
+                self.ksp.getPC().setDeflationSpace(W, False)
+                W.destroy()
+                self._deflation_space_set = True
+        if self.recycle == "deflation":
+            self.last_recycled = self._deflation_space_set
+
+        solve_start = time.time()
+        self.ksp.solve(self.b, self.x)
+        self.uh.x.scatter_forward()
+        self.last_solve_time = time.time() - solve_start
+        if self.recycle_space is not None and self.ksp.getConvergedReason() > 0:
+            self.recycle_space.update(self.x)
+
+        self.last_iterations = self.ksp.getIterationNumber()
+        self.last_converged_reason = self.ksp.getConvergedReason()
+        self.last_pc_reused = not rebuild
+        self.last_stopped_on_current = (
+            self.current_test is not None and self.current_test.stopped_on_current
+        )
+        if rebuild:
+            self.num_pc_setups += 1
+        self.reuse_policy.record(self.last_iterations, rebuild)
+        if self.last_converged_reason < 0:
+            # A lagged preconditioner that failed is not worth keeping. The
+            # converged reason is collective, so every rank resets and the
+            # next PC setup stays collective.
+            self.reuse_policy.reset()
+            if self.V.mesh.comm.rank == 0:
+                logger.warning(
+                    "KSP did not converge (reason %d) after %d iterations",
+                    self.last_converged_reason,
+                    self.last_iterations,
+                )
+        self.num_solves += 1
+        return self.uh
+
+    def destroy(self):
+        """Release PETSc objects held by the solver."""
+        if self.current_test is not None:
+            self.current_test.destroy()
+        if self.recycle_space is not None:
+            self.recycle_space.clear()
+        for obj in (self.ksp, self.A, self.b):
+            try:
+                obj.destroy()
+            except Exception:
+                pass
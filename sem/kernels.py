@@ -0,0 +1,114 @@
+"""
+Numba-compiled kernels for the per-position conductivity update.
+
+``fused_conductivity_update`` replaces the NumPy sequence in
+``VerticalMovementSEM.calculate_analyte_conductivity_modification`` after the
+distance query. That sequence subtracts radii, clamps, applies
+``SimpleConductivityModel`` and takes the minimum with the base conductivity.
+The kernel does this in one parallel pass over the queried points and writes
+into the output array without temporaries. It performs the same float64
+operations in the same order (no fastmath), so the results are bit-identical
+to the NumPy path.
+
+``screened_potential_sum`` evaluates a cutoff-limited Debye-Hückel sum over
+charged atoms binned into a uniform cell list (see
+``conductivity_models.DebyeHuckelPotential``).
+"""
+
+import numpy as np
+from numba import jit, prange
+
+
+@jit(nopython=True, fastmath=False, parallel=True, cache=True)
+def fused_conductivity_update(out, base, rows, distances, indices, radii,
+                              cutoff, min_distance, bulk_conductivity,
+                              min_conductivity, membrane_conductivity,
+                              check_overlap):
+    """
+    Apply the analyte's steric conductivity to ``out`` in place.
+
+    Args:
+        out: N output conductivity, holding the base conductivity on entry
+        base: N base conductivity
+        rows: K indices into ``out`` of the queried points
+        distances: K atom-centre distances (``inf`` beyond the query cutoff),
+            or surface distances when ``indices`` is empty
+        indices: K nearest-atom indices, or an empty array when ``distances``
+            are already surface distances
+        radii: M atom radii (Å)
+        cutoff, min_distance, bulk_conductivity: ``SimpleConductivityModel``
+            parameters
+        min_conductivity: Model conductivity at ``min_distance``
+        membrane_conductivity: Base conductivity at or below which a hard-core
+            point counts as overlapping the membrane
+        check_overlap: Count hard-core points on membrane/pore DOFs
+
+    Returns:
+        Number of overlapping points (0 when ``check_overlap`` is False)
+    """
+    subtract_radii = indices.shape[0] > 0
+    span = cutoff - min_distance
+    overlaps = 0
+    for k in prange(rows.shape[0]):
+        d = distances[k]
+        if d == np.inf:
+            continue
+        if subtract_radii:
+            d = d - radii[indices[k]]
+        if d < 0.0:
+            d = 0.0
+        if d < cutoff:
+            fraction = (d - min_distance) / span
+            if fraction < 0.0:
+                fraction = 0.0
+            elif fraction > 1.0:
+                fraction = 1.0
+            conductivity = min_conductivity + fraction * bulk_conductivity
+        else:
+            conductivity = bulk_conductivity
+        row = rows[k]
+        if check_overlap and d <= min_distance and base[row] <= membrane_conductivity:
+            overlaps += 1
+        if conductivity < out[row]:
+            out[row] = conductivity
+    return overlaps
+
+
+@jit(nopython=True, fastmath=False, parallel=True, cache=True)
+def screened_potential_sum(points, positions, charges, radii, cell_start, lower,
+                           cell_size, dims, cutoff, debye_length, bjerrum_length):
+    """
+    Reduced potential ``l_B * sum_j q_j exp(-r_j / debye) / r_j`` at each point.
+
+    Atoms are sorted by cell; atoms of flat cell ``c`` are
+    ``cell_start[c]:cell_start[c + 1]``. With ``cell_size >= cutoff`` the
+    27 surrounding cells hold every atom within the cutoff. Distances are
+    floored at the atom radius to avoid the point-charge singularity.
+
+    Returns:
+        N array of dimensionless potentials (beta * e * phi)
+    """
+    nx, ny, nz = dims[0], dims[1], dims[2]
+    cutoff_sq = cutoff * cutoff
+    out = np.zeros(points.shape[0])
+    for n in prange(points.shape[0]):
+        px, py, pz = points[n, 0], points[n, 1], points[n, 2]
+        cx = int(np.floor((px - lower[0]) / cell_size))
+        cy = int(np.floor((py - lower[1]) / cell_size))
+        cz = int(np.floor((pz - lower[2]) / cell_size))
+        total = 0.0
+        for ix in range(max(cx - 1, 0), min(cx + 2, nx)):
+            for iy in range(max(cy - 1, 0), min(cy + 2, ny)):
+                for iz in range(max(cz - 1, 0), min(cz + 2, nz)):
+                    cell = (ix * ny + iy) * nz + iz
+                    for a in range(cell_start[cell], cell_start[cell + 1]):
+                        dx = positions[a, 0] - px
+                        dy = positions[a, 1] - py
+                        dz = positions[a, 2] - pz
+                        r_sq = dx * dx + dy * dy + dz * dz
+                        if r_sq >= cutoff_sq:
+                            continue
+                        r = max(np.sqrt(r_sq), radii[a])
+                        total += charges[a] * np.exp(-r / debye_length) / r
+        out[n] = bjerrum_length * total
+    return out
@@ -0,0 +1,281 @@
+"""
+Local-subdomain correction solver for analyte perturbations.
+
+The analyte only changes the conductivity in a compact region, so the
+potential with the analyte differs from the open-pore potential mostly near
+that region. ``LocalCorrectionSolver`` keeps the open-pore solution ``x0``
+everywhere except on the DOFs ``I`` inside the analyte box (analyte extent
+plus the conductivity cutoff plus a halo), where it solves
+
+    A_II d = (b - A x0)_I,        x = x0 + d on I,  x = x0 elsewhere,
+
+i.e. the subdomain problem with the open-pore field as Dirichlet data on the
+halo boundary. The conductivity only changed inside the box, so the right
+hand side is formed from subdomain blocks alone:
+
+    (b - A x0)_I = r0_I + (b - b0)_I - (A_II - A0_II) x0_I
+
+with ``A0``, ``b0`` and ``r0 = b0 - A0 x0`` saved from the open-pore solve.
+Per position the only global work is the (incremental) assembly; matrix
+extraction, the AMG setup and the Krylov solve all act on the subdomain.
+
+The field outside the box is not updated, so the corrected field is only as
+good as the halo is wide. Every solve therefore checks the global relative
+residual ``|b - A x| / |b|`` (one global product) and, above
+``residual_rtol``, finishes the position with the persistent global solver
+started from the corrected field. Accepted positions are cheap; rejected
+ones cost a warm-started global solve instead of a cold one.
+``VerticalMovementSEM`` also compares the current with a full solve every
+``validate_every`` positions.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Optional
+
+import numpy as np
+from petsc4py import PETSc
+
+logger = logging.getLogger(__name__)
+
+
+# Options for the subdomain solve (prefix ``<solver prefix>local_``); rtol and
+# max_it come from the LocalCorrectionSolver arguments unless given here.
+DEFAULT_LOCAL_OPTIONS = {
+    "ksp_type": "cg",
+    "pc_type": "hypre",
+}
+
+
+class LocalCorrectionSolver:
+    """
+    Solve analyte positions as a local correction of the open-pore field.
+
+    Args:
+        solver: ``PersistentPoissonSolver`` owning the operator, RHS and solution.
+        halo: Extra margin (Å) added around the analyte box. Should exceed
+            the local cell size so every cell whose conductivity changed lies
+            inside the subdomain; otherwise the residual check fails and the
+            position falls back to the global solver.
+        rtol: Relative residual tolerance of the subdomain solve.
+        max_iterations: Maximum subdomain Krylov iterations.
+        local_options: PETSc options for the subdomain solve.
+        residual_rtol: Largest global relative residual accepted without a
+            full solve (default: ``rtol``).
+    """
+
+    def __init__(self, solver, *, halo: float = 10.0, rtol: float = 1e-8,
+                 max_iterations: int = 200, local_options: Optional[dict] = None,
+                 residual_rtol: Optional[float] = None):
+        self.solver = solver
+        self.halo = float(halo)
+        self.rtol = float(rtol)
+        self.max_iterations = int(max_iterations)
+        self.residual_rtol = self.rtol if residual_rtol is None else float(residual_rtol)
+
+        V = solver.V
+        index_map = V.dofmap.index_map
+        self._num_owned = index_map.size_local
+        self._global_offset = index_map.local_range[0]
+        self._dof_coords = V.tabulate_dof_coordinates()[:self._num_owned]
+        self._comm = V.mesh.comm
+
+        self.options_prefix = f"{solver.options_prefix}local_"
+        options = {"ksp_rtol": self.rtol, "ksp_max_it": self.max_iterations}
+        options.update(local_options or DEFAULT_LOCAL_OPTIONS)
+        opts = PETSc.Options()
+        opts.prefixPush(self.options_prefix)
+        for key, value in options.items():
+            opts[key] = value
+        opts.prefixPop()
+
+        # Open-pore reference: solution (owned + ghost), and the owned parts
+        # of the RHS and residual; the operator is kept for its subdomain blocks.
+        self.reference = None
+        self._reference_rhs = None
+        self._reference_residual = None
+        self._reference_matrix = None
+        # Subdomain KSP, kept while the subdomain layout stays the same.
+        self._ksp = None
+        self._ksp_sizes = None
+
+        self.last_iterations = 0
+        self.last_local_dofs = 0
+        self.last_local_fraction = 0.0
+        self.last_assembly_time = 0.0
+        self.last_setup_time = 0.0
+        self.last_solve_time = 0.0
+        self.last_converged_reason = 0
+        self.last_residual = 0.0
+        self.last_check_time = 0.0
+        self.last_fallback = False
+        self.num_solves = 0
+        self.num_fallbacks = 0
+
+    def set_reference(self):
+        """
+        Freeze the current operator and solution as the open-pore reference.
+
+        Call right after the open-pore solve; costs one matrix copy and one
+        global residual per mesh.
+        """
+        self.destroy()
+        solver = self.solver
+        self._reference_matrix = solver.A.copy()
+        residual = solver.A.createVecLeft()
+        solver.A.mult(solver.x, residual)
+        residual.aypx(-1.0, solver.b)
+        self._reference_residual = residual.array.copy()
+        residual.destroy()
+        self._reference_rhs = solver.b.array.copy()
+        self.reference = solver.uh.x.array.copy()
+
+    @property
+    def ready(self) -> bool:
+        return self._reference_matrix is not None
+
+    def local_dofs(self, box_min, box_max) -> np.ndarray:
+        """Global indices of owned DOFs inside the (halo-padded) box."""
+        lo = np.asarray(box_min, dtype=float) - self.halo
+        hi = np.asarray(box_max, dtype=float) + self.halo
+        inside = np.all((self._dof_coords >= lo) & (self._dof_coords <= hi), axis=1)
+        return (np.flatnonzero(inside) + self._global_offset).astype(PETSc.IntType)
+
+    def _subdomain_ksp(self, A_local):
+        """The subdomain KSP, recreated only when the subdomain sizes change."""
+        sizes = A_local.getSizes()
+        if self._ksp is None or sizes != self._ksp_sizes:
+            if self._ksp is not None:
+                self._ksp.destroy()
+            self._ksp = PETSc.KSP().create(self._comm)
+            self._ksp.setOptionsPrefix(self.options_prefix)
+            self._ksp.setFromOptions()
+            self._ksp_sizes = sizes
+        self._ksp.setOperators(A_local)
+        return self._ksp
+
+    def solve(self, box_min, box_max, initial_guess: Optional[np.ndarray] = None):
+        """
+        Solve the current system as a correction of the open-pore field.
+
+        Args:
+            box_min, box_max: Corners of the region where the conductivity
+                differs from open pore (analyte extent plus cutoff).
+            initial_guess: Local values to start the subdomain solve from
+                (default: open-pore field).
+
+        Returns:
+            The solver's solution ``fem.Function``: the corrected field, or the
+            global solve started from it when the residual check fails
+            (``last_fallback``).
+        """
+        if not self.ready:
+            raise RuntimeError("LocalCorrectionSolver.set_reference() must be called after the open-pore solve")
+
+        solver = self.solver
+        assembly_start = time.time()
+        solver.assemble_operator()
+        solver.assemble_rhs()
+        self.last_assembly_time = time.time() - assembly_start
+
+        setup_start = time.time()
+        indices = self.local_dofs(box_min, box_max)
+        owned = indices - self._global_offset
+        num_local = self._comm.allreduce(indices.size)
+        num_total = self._comm.allreduce(self._num_owned)
+        self.last_local_dofs = num_local
+        self.last_local_fraction = num_local / max(num_total, 1)
+
+        local_is = PETSc.IS().createGeneral(indices, comm=self._comm)
+        A_local = solver.A.createSubMatrix(local_is, local_is)
+        A0_local = self._reference_matrix.createSubMatrix(local_is, local_is)
+
+        # rhs = (A0_II - A_II) x0_I + r0_I + (b - b0)_I
+        x0_local = A_local.createVecRight()
+        x0_local.array[:] = self.reference[owned]
+        rhs = A_local.createVecLeft()
+        work = A_local.createVecLeft()
+        A0_local.mult(x0_local, rhs)
+        A_local.mult(x0_local, work)
+        rhs.axpy(-1.0, work)
+        work.array[:] = (self._reference_residual[owned] + solver.b.array[owned]
+                         - self._reference_rhs[owned])
+        rhs.axpy(1.0, work)
+
+        correction = A_local.createVecRight()
+        ksp = self._subdomain_ksp(A_local)
+        if initial_guess is not None:
+            correction.array[:] = initial_guess[owned] - self.reference[owned]
+            ksp.setInitialGuessNonzero(True)
+        else:
+            ksp.setInitialGuessNonzero(False)
+        self.last_setup_time = time.time() - setup_start
+
+        solve_start = time.time()
+        ksp.solve(rhs, correction)
+        self.last_solve_time = time.time() - solve_start
+
+        solver.uh.x.array[:] = self.reference
+        solver.uh.x.array[owned] += correction.array
+        solver.uh.x.scatter_forward()
+
+        self.last_iterations = ksp.getIterationNumber()
+        self.last_converged_reason = ksp.getConvergedReason()
+        if self.last_converged_reason < 0 and self._comm.rank == 0:
+            logger.warning(
+                "Local correction did not converge (reason %d) after %d iterations",
+                self.last_converged_reason,
+                self.last_iterations,
+            )
+
+        for obj in (x0_local, rhs, work, correction, A0_local, A_local, local_is):
+            obj.destroy()
+
+        check_start = time.time()
+        self.last_residual = self.relative_residual()
+        self.last_check_time = time.time() - check_start
+        self.last_fallback = not self.last_residual <= self.residual_rtol
+        self.num_solves += 1
+        if self.last_fallback:
+            self.num_fallbacks += 1
+            if self._comm.rank == 0:
+                logger.info(
+                    "Local correction residual %.2e above %.1e; finishing with a global solve",
+                    self.last_residual,
+                    self.residual_rtol,
+                )
+            # The system is already assembled; the corrected field is the guess.
+            solver.solve(initial_guess=solver.uh.x.array.copy(), stop_on_current=False,
+                         use_recycle=False, assemble=False)
+        return solver.uh
+
+    def relative_residual(self) -> float:
+        """
+        Global relative residual ``|b - A x| / |b|`` of the current solution.
+
+        One global product, so much cheaper than a global solve.
+        """
+        solver = self.solver
+        residual = solver.A.createVecLeft()
+        solver.A.mult(solver.x, residual)
+        residual.aypx(-1.0, solver.b)
+        value = residual.norm() / max(solver.b.norm(), 1e-300)
+        residual.destroy()
+        return value
+
+    def destroy(self):
+        """Release the reference operator and the subdomain solver."""
+        for obj in (self._ksp, self._reference_matrix):
+            if obj is not None:
+                try:
+                    obj.destroy()
+                except Exception:
+                    pass
+        self._ksp = None
+        self._ksp_sizes = None
+        self._reference_matrix = None
+        self.reference = None
+        self._reference_rhs = None
+        self._reference_residual = None
@@ -9,19 +9,79 @@ import sys
 import os
 import subprocess
 import time
+import warnings
 from pathlib import Path
 from typing import Optional
 from scipy.spatial import KDTree
 from scipy.interpolate import RegularGridInterpolator
 from abc import ABC, abstractmethod
 
+try:
+    from mpi4py import MPI
+except ImportError:  # serial use without mpi4py
+    MPI = None
+
 from .utils import readbinGrid, condfrac
 from .van_der_waals import VanDerWaalsRadii
 from .conductivity_models import SimpleConductivityModel
+from .potential_grid import cached_screened_potential_grid, screened_potential_grid
+from .distance_field import DISTANCE_ENGINES, DistanceFieldError, compute_distance_field
 from .structure_preparation import prepare_structure, PreparedStructure
 
 logger = logging.getLogger(__name__)
 
+def _screened_potential_interpolator(X, Y, Z, positions, charges, radii,
+                                     debye_length, bjerrum_length, cutoff=None,
+                                     cache_dir=None, cache_prefix="biological_pore",
+                                     comm=None):
+    """
+    Tabulate the screened potential of charged atoms on the conductivity grid.
+
+    The grid is built by FFT convolution (``potential_grid``); with
+    ``cache_dir`` it is stored there and reused on later runs.
+
+    Returns:
+        RegularGridInterpolator of the reduced potential (0 outside the grid)
+    """
+    axes = (X[:, 0, 0], Y[0, :, 0], Z[0, 0, :])
+    if cache_dir is not None:
+        phi = cached_screened_potential_grid(
+            cache_dir, cache_prefix, axes, positions, charges, radii,
+            debye_length, bjerrum_length, cutoff, comm=comm,
+        )
+    else:
+        phi = screened_potential_grid(
+            axes, positions, charges, radii, debye_length, bjerrum_length, cutoff,
+        )
+    logger.info(
+        f"Pore screened potential: {int(np.count_nonzero(charges))} charged atoms, "
+        f"range [{phi.min():.3f}, {phi.max():.3f}]"
+    )
+    return RegularGridInterpolator(axes, phi, bounds_error=False, fill_value=0.0)
+
+# Atoms the PQR→XYZ step of the gen_dist pipeline keeps (pdb2xyz.py for PDB input).
+_PQR_DISTANCE_SELECTION = 'not resname HOH WAT TIP3 SOL NA CL K MG CA ZN'
+
+def _distance_field_atoms(universe, from_pqr):
+    """
+    Positions and radii that the XYZ step of the gen_dist pipeline writes.
+
+    PQR input keeps its radii; PDB input goes through pdb2xyz.py's selection
+    and radius rules, so the in-process field matches the subprocess one.
+
+    Returns:
+        (positions, radii) arrays
+    """
+    if from_pqr:
+        atoms = universe.select_atoms(_PQR_DISTANCE_SELECTION)
+        return atoms.positions, atoms.radii
+    try:
+        from .scripts.pdb2xyz import get_radius_info, select_pore_atoms
+    except ImportError:  # pragma: no cover - scripts not packaged
+        from sem.scripts.pdb2xyz import get_radius_info, select_pore_atoms
+    atoms = select_pore_atoms(universe)
+    return atoms.positions, np.asarray(get_radius_info(atoms), dtype=float)
+
 def _conductivity_from_distance(distance_map, bulk_conductivity, membrane_conductivity):
     """
     Convert a gen_dist-style distance field into conductivity.
@@ -72,7 +132,46 @@ class BasePore(ABC):
         """Return representative grid spacing in Å if defined."""
         return None
 
+def _analytic_conductivity(pore):
+    """
+    Grid-free conductivity evaluator for an axisymmetric analytic pore.
+
+    Returns a callable with the interpolator interface (``f(points)``, points
+    Nx3) that evaluates the closed-form distance to the membrane at each
+    point, so no 3D grid is built.
+    """
+    def evaluate(points):
+        points = np.asarray(points)
+        R = np.hypot(points[:, 0], points[:, 1])
+        return pore._conductivity(R, points[:, 2])
+    return evaluate
+
+
+def _grid_interpolator(pore):
+    """Tabulate ``pore._conductivity`` on the pore's meshgrid and wrap it in an interpolator."""
+    R = np.sqrt(pore.X**2 + pore.Y**2)
+    conductivity_grid = pore._conductivity(R, pore.Z)
+
+    # Extract edges
+    x_range = np.unique(pore.X[:, 0, 0])
+    y_range = np.unique(pore.Y[0, :, 0])
+    z_range = np.unique(pore.Z[0, 0, :])
+
+    return RegularGridInterpolator(
+        (x_range, y_range, z_range), conductivity_grid,
+        bounds_error=False, fill_value=pore.bulk_conductivity
+    )
+
+
 class CylindricalPore(BasePore):
+    """
+    Cylindrical pore with an optional chamfered (rounded) entrance.
+
+    With ``X, Y, Z`` meshgrids the conductivity is tabulated and
+    interpolated; with ``X = Y = Z = None`` it is evaluated analytically at
+    the query points (no grid).
+    """
+
     def __init__(self, X, Y, Z, pore_radius, membrane_half_thickness, 
                  corner_radius=None, chamfer_depth=None, 
                  bulk_conductivity=10.5, membrane_conductivity=0.0001):
@@ -86,10 +185,10 @@ class CylindricalPore(BasePore):
         self.bulk_conductivity = bulk_conductivity
         self.membrane_conductivity = membrane_conductivity
         self._interpolator = None  # Lazy
-        self._local_pore_radius = None
 
-    def _compute_local_pore_radius(self):
-        base_radius = np.full_like(self.Z, self.pore_radius, dtype=float)
+    def _compute_local_pore_radius(self, Z=None):
+        Z = self.Z if Z is None else Z
+        base_radius = np.full_like(Z, self.pore_radius)
         if self.corner_radius is None or self.corner_radius <= 0:
             return base_radius
 
@@ -98,9 +197,9 @@ class CylindricalPore(BasePore):
             return base_radius
 
         edge_radius = self.pore_radius + self.corner_radius
-        z_edge_dist = np.maximum(self.membrane_half_thickness - np.abs(self.Z), 0.0)
+        z_edge_dist = np.maximum(self.membrane_half_thickness - np.abs(Z), 0.0)
         in_chamfer_zone = z_edge_dist < chamfer_depth
-        chamfer_progress = np.zeros_like(self.Z, dtype=float)
+        chamfer_progress = np.zeros_like(Z)
         chamfer_progress[in_chamfer_zone] = np.clip(
             z_edge_dist[in_chamfer_zone] / chamfer_depth, 0.0, 1.0
         )
@@ -111,37 +210,36 @@ class CylindricalPore(BasePore):
             base_radius,
         )
         return local_radius
+
+    def _conductivity(self, R, Z):
+        local_pore_radius = self._compute_local_pore_radius(Z)
+        distance_map = _distance_to_membrane(
+            R,
+            np.abs(Z),
+            local_pore_radius,
+            self.membrane_half_thickness,
+        )
+        return _conductivity_from_distance(
+            distance_map,
+            self.bulk_conductivity,
+            self.membrane_conductivity,
+        )
     
     def get_conductivity_interpolator(self):
         if self._interpolator is None:
-            R = np.sqrt(self.X**2 + self.Y**2)
-            local_pore_radius = self._compute_local_pore_radius()
-            self._local_pore_radius = local_pore_radius
-
-            distance_map = _distance_to_membrane(
-                R,
-                np.abs(self.Z),
-                local_pore_radius,
-                self.membrane_half_thickness,
-            )
-            conductivity_grid = _conductivity_from_distance(
-                distance_map,
-                self.bulk_conductivity,
-                self.membrane_conductivity,
-            )
-            
-            # Extract edges
-            x_range = np.unique(self.X[:, 0, 0])
-            y_range = np.unique(self.Y[0, :, 0])
-            z_range = np.unique(self.Z[0, 0, :])
-            
-            self._interpolator = RegularGridInterpolator(
-                (x_range, y_range, z_range), conductivity_grid,
-                bounds_error=False, fill_value=self.bulk_conductivity
-            )
+            if self.X is None:
+                self._interpolator = _analytic_conductivity(self)
+            else:
+                self._interpolator = _grid_interpolator(self)
         return self._interpolator
 
 class DoubleConePore(BasePore):
+    """
+    Double-cone pore, narrowest (``inner_radius``) at z=0 and widest at the faces.
+
+    Grid-free (analytic) when ``X = Y = Z = None``, as for ``CylindricalPore``.
+    """
+
     def __init__(self, X, Y, Z, inner_radius, outer_radius, membrane_half_thickness, 
                  bulk_conductivity=10.5, membrane_conductivity=0.0001):
         self.X = X
@@ -153,42 +251,36 @@ class DoubleConePore(BasePore):
         self.bulk_conductivity = bulk_conductivity
         self.membrane_conductivity = membrane_conductivity
         self._interpolator = None  # Lazy
+
+    def _conductivity(self, R, Z):
+        abs_z = np.abs(Z)
+        z_fraction = np.clip(
+            abs_z / self.membrane_half_thickness,
+            0.0,
+            1.0,
+        )
+        local_pore_radius = self.inner_radius + (self.outer_radius - self.inner_radius) * z_fraction
+
+        distance_map = _distance_to_membrane(
+            R,
+            abs_z,
+            local_pore_radius,
+            self.membrane_half_thickness,
+        )
+        return _conductivity_from_distance(
+            distance_map,
+            self.bulk_conductivity,
+            self.membrane_conductivity,
+        )
     
     def get_conductivity_interpolator(self):
         if self._interpolator is None:
-            R = np.sqrt(self.X**2 + self.Y**2)
-            abs_z = np.abs(self.Z)
             if self.membrane_half_thickness <= 0:
                 raise ValueError("Double-cone pores require a non-zero membrane thickness.")
-
-            z_fraction = np.clip(
-                abs_z / self.membrane_half_thickness,
-                0.0,
-                1.0,
-            )
-            local_pore_radius = self.inner_radius + (self.outer_radius - self.inner_radius) * z_fraction
-
-            distance_map = _distance_to_membrane(
-                R,
-                abs_z,
-                local_pore_radius,
-                self.membrane_half_thickness,
-            )
-            conductivity_grid = _conductivity_from_distance(
-                distance_map,
-                self.bulk_conductivity,
-                self.membrane_conductivity,
-            )
-            
-            # Extract edges
-            x_range = np.unique(self.X[:, 0, 0])
-            y_range = np.unique(self.Y[0, :, 0])
-            z_range = np.unique(self.Z[0, 0, :])
-            
-            self._interpolator = RegularGridInterpolator(
-                (x_range, y_range, z_range), conductivity_grid,
-                bounds_error=False, fill_value=self.bulk_conductivity
-            )
+            if self.X is None:
+                self._interpolator = _analytic_conductivity(self)
+            else:
+                self._interpolator = _grid_interpolator(self)
         return self._interpolator
 
 class ConicalPore(BasePore):
@@ -197,7 +289,7 @@ class ConicalPore(BasePore):
     Asymmetric about z=0: ``bottom_radius`` at z=-membrane_half_thickness,
     ``top_radius`` at z=+membrane_half_thickness, linearly interpolated in
     between. If top_radius == bottom_radius the pore degenerates to a
-    cylinder.
+    cylinder. Grid-free (analytic) when ``X = Y = Z = None``.
     """
 
     def __init__(self, X, Y, Z, top_radius, bottom_radius, membrane_half_thickness,
@@ -215,42 +307,35 @@ class ConicalPore(BasePore):
         self.bulk_conductivity = bulk_conductivity
         self.membrane_conductivity = membrane_conductivity
         self._interpolator = None
-        self._local_pore_radius = None
-
-    def get_conductivity_interpolator(self):
-        if self._interpolator is None:
-            R = np.sqrt(self.X**2 + self.Y**2)
-
-            # Asymmetric linear interpolation along z (NOT abs(Z) like double_cone).
-            # t = 0 at the bottom face, t = 1 at the top face.
-            t = np.clip(
-                (self.Z + self.membrane_half_thickness) / (2.0 * self.membrane_half_thickness),
-                0.0,
-                1.0,
-            )
-            local_pore_radius = self.bottom_radius + (self.top_radius - self.bottom_radius) * t
-            self._local_pore_radius = local_pore_radius
 
-            distance_map = _distance_to_membrane(
-                R,
-                np.abs(self.Z),
-                local_pore_radius,
-                self.membrane_half_thickness,
-            )
-            conductivity_grid = _conductivity_from_distance(
-                distance_map,
-                self.bulk_conductivity,
-                self.membrane_conductivity,
-            )
+    def _conductivity(self, R, Z):
+        # Asymmetric linear interpolation along z (NOT abs(Z) like double_cone).
+        # t = 0 at the bottom face, t = 1 at the top face.
+        t = np.clip(
+            (Z + self.membrane_half_thickness) / (2.0 * self.membrane_half_thickness),
+            0.0,
+            1.0,
+        )
+        local_pore_radius = self.bottom_radius + (self.top_radius - self.bottom_radius) * t
 
-            x_range = np.unique(self.X[:, 0, 0])
-            y_range = np.unique(self.Y[0, :, 0])
-            z_range = np.unique(self.Z[0, 0, :])
+        distance_map = _distance_to_membrane(
+            R,
+            np.abs(Z),
+            local_pore_radius,
+            self.membrane_half_thickness,
+        )
+        return _conductivity_from_distance(
+            distance_map,
+            self.bulk_conductivity,
+            self.membrane_conductivity,
+        )
 
-            self._interpolator = RegularGridInterpolator(
-                (x_range, y_range, z_range), conductivity_grid,
-                bounds_error=False, fill_value=self.bulk_conductivity
-            )
+    def get_conductivity_interpolator(self):
+        if self._interpolator is None:
+            if self.X is None:
+                self._interpolator = _analytic_conductivity(self)
+            else:
+                self._interpolator = _grid_interpolator(self)
         return self._interpolator
 
 
@@ -325,15 +410,42 @@ class BinFilePore(BasePore):
     def get_distance_interpolator(self):
         return self.distance_interp
 
+
+def _resolve_distance_engine(distance_engine=None, use_direct_distance_calculation=None):
+    """
+    Distance engine name for ``BiologicalPore``, "numba" by default.
+
+    ``use_direct_distance_calculation`` predates named engines: True meant the
+    in-process field, False the gen_dist subprocess. It is deprecated and only
+    used when ``distance_engine`` is not given.
+    """
+    if use_direct_distance_calculation is not None:
+        warnings.warn(
+            "use_direct_distance_calculation is deprecated; pass "
+            "distance_engine='numba' or distance_engine='subprocess' instead",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        if distance_engine is None:
+            distance_engine = "numba" if use_direct_distance_calculation else "subprocess"
+    if distance_engine is None:
+        distance_engine = "numba"
+    distance_engine = str(distance_engine).lower()
+    if distance_engine not in DISTANCE_ENGINES:
+        raise ValueError(f"distance_engine must be one of {DISTANCE_ENGINES}, got {distance_engine!r}")
+    return distance_engine
+
+
 class BiologicalPore(BasePore):
     def __init__(self, X, Y, Z, pore_pdb, membrane_half_thickness, 
                  bulk_conductivity=10.5, cutoff=5.0, 
                  use_vdw_radii=True, default_radius=1.5,
                  membrane_conductivity=0.0001, membrane_z_offset=0.0,
                  use_charges=False, debye_length=2.15, bjerrum_length=7.15,
+                 charge_cutoff=None, charge_potential_cache=True,
                  resolution=1.0, cleanup_temp_files=True, box_dimensions=None,
                  temp_file_prefix="biological_pore",
-                 use_direct_distance_calculation=False,
+                 use_direct_distance_calculation=None, distance_engine=None, distance_threads=None,
                  use_pdb2pqr=False, force_field='CHARMM', ph=7.0):
         try:
             import MDAnalysis as mda
@@ -356,8 +468,10 @@ class BiologicalPore(BasePore):
         self.dimensions = None
         self.grid_shape = None
         
+        distance_engine = _resolve_distance_engine(distance_engine, use_direct_distance_calculation)
+
         logger.info(f"Creating biological pore from {pore_pdb}")
-        logger.info(f"Method: {'Direct distance calculation' if use_direct_distance_calculation else 'Subprocess PDB→XYZ→BIN'}")
+        logger.info(f"Method: {'Subprocess PDB→XYZ→BIN' if distance_engine == 'subprocess' else f'In-process distance field ({distance_engine})'}")
         
         prepared_pore: Optional[PreparedStructure] = None
         pore_file = pore_pdb
@@ -434,6 +548,17 @@ class BiologicalPore(BasePore):
         self.pore_positions = pore_positions
         self.pore_radii = pore_radii
         self.pore_tree = KDTree(pore_positions) if len(pore_positions) > 0 else None
+
+        if use_charges and np.any(pore_charges) and X is not None:
+            # Cached next to the distance-field files (working directory).
+            self.phi_interp = _screened_potential_interpolator(
+                X, Y, Z, pore_positions, pore_charges, pore_radii,
+                debye_length, bjerrum_length, charge_cutoff,
+                cache_dir=Path.cwd() if charge_potential_cache else None,
+                cache_prefix=temp_file_prefix,
+                # Every rank builds the pore; rank 0 owns the cache file.
+                comm=MPI.COMM_WORLD if MPI is not None else None,
+            )
         
         if membrane_half_thickness == 0.0:
             logger.info("Zero membrane thickness - creating interpolator using distance field")
@@ -458,121 +583,28 @@ class BiologicalPore(BasePore):
             self.dimensions = [Lm, Wm, Hm]
             self.grid_shape = [nx, ny, nz]
             
-            if use_direct_distance_calculation:
-                # Direct distance calculation approach
-                logger.info("Using direct distance calculation from MDAnalysis...")
-                
-                # Create coordinate grids
-                x_grid = np.linspace(-Lm/2., Lm/2., num=nx)
-                y_grid = np.linspace(-Wm/2., Wm/2., num=ny)
-                z_grid = np.linspace(-Hm/2., Hm/2., num=nz)
-                
-                logger.info("Creating coordinate grid...")
-                X_val3d, Y_val3d, Z_val3d = np.meshgrid(x_grid, y_grid, z_grid, indexing='ij')
-                grid_coords = np.column_stack([X_val3d.ravel(), Y_val3d.ravel(), Z_val3d.ravel()])
-                
-                logger.info(f"Computing distance field for {len(grid_coords):,} grid points using gen_dist.py-style algorithm...")
-
-                # Match gen_dist.py parameters exactly
-                SEARCH_LENGTH = 2  # Same as gen_dist.py
-                max_search_radius = cutoff  # User's modification
-                
-                # Apply translation to match gen_dist.py workflow
-                # gen_dist.py translates atoms by subtracting lower bounds
-                center_coords = np.array([center_x, center_y, center_z])
-                translated_pore_positions = pore_positions - center_coords
-                
-                # Set up spatial hashing like gen_dist.py
-                cell_size = cutoff / SEARCH_LENGTH
-                box_x, box_y, box_z = Lm, Wm, Hm
-                cell_num_x = int(box_x * SEARCH_LENGTH / cutoff)
-                cell_num_y = int(box_y * SEARCH_LENGTH / cutoff) 
-                cell_num_z = int(box_z * SEARCH_LENGTH / cutoff)
-                
-                logger.info(f"Spatial hash parameters:")
-                logger.info(f"  SEARCH_LENGTH: {SEARCH_LENGTH}")
-                logger.info(f"  cell_size: {cell_size:.3f}")
-                logger.info(f"  cells: {cell_num_x} x {cell_num_y} x {cell_num_z}")
-                
-                def get_cell_index(x, y, z):
-                    """Get cell index for spatial hashing (matches gen_dist.py)"""
-                    cell_x = min(int(x / cell_size), cell_num_x - 1) if cell_num_x > 0 else 0
-                    cell_y = min(int(y / cell_size), cell_num_y - 1) if cell_num_y > 0 else 0
-                    cell_z = min(int(z / cell_size), cell_num_z - 1) if cell_num_z > 0 else 0
-                    return cell_x + cell_num_x * cell_y + cell_num_x * cell_num_y * cell_z
-                
-                # Build spatial hash (same as gen_dist.py)
-                logger.info("Building spatial hash...")
-                cell_atoms = {}
-                for i, pos in enumerate(translated_pore_positions):
-                    cell_idx = get_cell_index(pos[0], pos[1], pos[2])
-                    if cell_idx not in cell_atoms:
-                        cell_atoms[cell_idx] = []
-                    cell_atoms[cell_idx].append(i)
-                
-                logger.info(f"Created {len(cell_atoms)} non-empty cells")
-                
-                # Process grid points using same logic as gen_dist.py
-                val3d_flat = np.full(len(grid_coords), cutoff, dtype=np.float32)
-                
-                for grid_idx, grid_coord in enumerate(grid_coords):
-                    # Translate grid coordinate to match gen_dist.py coordinate system
-                    translated_coord = grid_coord  # Already centered around origin
-                    
-                    # Find which cell this grid point belongs to
-                    cell_loc_x = min(int(translated_coord[0] / cell_size), cell_num_x - 1) if cell_num_x > 0 else 0
-                    cell_loc_y = min(int(translated_coord[1] / cell_size), cell_num_y - 1) if cell_num_y > 0 else 0
-                    cell_loc_z = min(int(translated_coord[2] / cell_size), cell_num_z - 1) if cell_num_z > 0 else 0
-                    
-                    # Search neighboring cells (same range as gen_dist.py)
-                    start_x = max(0, cell_loc_x - SEARCH_LENGTH)
-                    end_x = min(cell_num_x, cell_loc_x + SEARCH_LENGTH + 1)
-                    start_y = max(0, cell_loc_y - SEARCH_LENGTH)
-                    end_y = min(cell_num_y, cell_loc_y + SEARCH_LENGTH + 1)
-                    start_z = max(0, cell_loc_z - SEARCH_LENGTH)
-                    end_z = min(cell_num_z, cell_loc_z + SEARCH_LENGTH + 1)
-                    
-                    min_dist = cutoff
-                    
-                    # Search all neighboring cells
-                    for z in range(start_z, end_z):
-                        for y in range(start_y, end_y):
-                            for x in range(start_x, end_x):
-                                cell_hash = x + cell_num_x * y + cell_num_x * cell_num_y * z
-                                
-                                if cell_hash in cell_atoms:
-                                    for atom_idx in cell_atoms[cell_hash]:
-                                        atom_pos = translated_pore_positions[atom_idx]
-                                        atom_radius = pore_radii[atom_idx]
-                                        
-                                        # Calculate distance (same as gen_dist.py)
-                                        dx = atom_pos[0] - translated_coord[0]
-                                        dy = atom_pos[1] - translated_coord[1]
-                                        dz = atom_pos[2] - translated_coord[2]
-                                        
-                                        dist_to_center = np.sqrt(dx*dx + dy*dy + dz*dz)
-                                        dist_to_surface = dist_to_center - atom_radius
-                                        
-                                        min_dist = min(min_dist, dist_to_surface)
-                    
-                    # Store result (ensure non-negative, same as gen_dist.py)
-                    val3d_flat[grid_idx] = max(min_dist, 0.0)
-                    
-                    if grid_idx % 100000 == 0 and grid_idx > 0:
-                        logger.debug(f"  Processed {grid_idx:,} / {len(grid_coords):,} points")
-                
-                # Reshape to 3D (same order as gen_dist.py)
-                val3d = val3d_flat.reshape((nx, ny, nz))
-                
-                # Apply cutoff clamping like gen_dist.py
-                val3d = np.minimum(val3d, cutoff).astype(np.float32)
-                
-                logger.info(f"Direct distance calculation complete!")
-                logger.info(f"Distance field range: [{np.min(val3d):.3f}, {np.max(val3d):.3f}] Å")
-                logger.info(f"Distance field shape: {val3d.shape}")
-                logger.info(f"Using gen_dist.py-compatible algorithm")
+            val3d = None
+            if distance_engine != "subprocess":
+                # In-process engine: same atoms, grid and values as pdb2xyz.py + gen_dist.py, no files
+                logger.info(f"Computing distance field in process ({distance_engine} engine)...")
+                start = time.time()
+                try:
+                    field_positions, field_radii = _distance_field_atoms(pore_universe, use_pdb2pqr)
+                    val3d, [Lm, Wm, Hm], [nx, ny, nz] = compute_distance_field(
+                        field_positions, field_radii,
+                        (x_min, y_min, z_min), (x_max, y_max, z_max),
+                        resolution, cutoff, engine=distance_engine, num_threads=distance_threads,
+                    )
+                    logger.info(f"Distance field {val3d.shape} in {time.time() - start:.2f} s")
+                    logger.info(f"Distance field range: [{np.min(val3d):.3f}, {np.max(val3d):.3f}] Å")
+                except (ImportError, DistanceFieldError) as e:
+                    # Only a missing engine or a field it cannot compute falls
+                    # back; anything else is a bug and propagates.
+                    logger.warning(f"In-process distance field ({distance_engine}) unavailable ({e}); "
+                                   f"falling back to the pdb2xyz.py/gen_dist.py subprocesses")
+                    val3d = None
                 
-            else:
+            if val3d is None:
                 # Subprocess approach for val3d creation (PDB → XYZ → BIN)
                 logger.info("Using subprocess PDB→XYZ→BIN approach...")
                 
@@ -626,20 +658,16 @@ class BiologicalPore(BasePore):
                         # Alternative: Use in-memory PQR to XYZ conversion instead of script
                         logger.info("Using alternative PQR to XYZ conversion")
                         universe = mda.Universe(str(prepared_pore.pqr_file))
-                        selection = 'not resname HOH WAT TIP3 SOL NA CL K MG CA ZN'
-                        atoms = universe.select_atoms(selection)
-                        
-                        positions = atoms.positions
-                        radii = atoms.radii  # Radii from B-factor
+                        positions, radii = _distance_field_atoms(universe, from_pqr=True)
                         
                         with open(xyz_file, 'w') as f:
-                            for i in range(len(atoms)):
+                            for i in range(len(positions)):
                                 x, y, z = positions[i]
                                 r = radii[i]
                                 line = f"{x:.3f} {y:.3f} {z:.3f} {r:.3f}"
                                 f.write(line + '\n')
                         
-                        logger.info(f"Converted PQR to XYZ: {len(atoms)} atoms")
+                        logger.info(f"Converted PQR to XYZ: {len(positions)} atoms")
                     else:
                         # Original: Use pdb2xyz script on PDB
                         pdb2xyz_cmd = [sys.executable, str(pdb2xyz_script), str(pore_pdb), str(xyz_file)]
@@ -658,6 +686,8 @@ class BiologicalPore(BasePore):
                         str(x_min), str(y_min), str(z_min),
                         str(resolution), str(cutoff), str(bin_file)
                     ]
+                    if distance_threads is not None:
+                        gen_dist_cmd.append(str(int(distance_threads)))
                     result = subprocess.run(gen_dist_cmd, capture_output=True, text=True, timeout=600)
                     
                     if result.returncode != 0:
@@ -704,7 +734,7 @@ class BiologicalPore(BasePore):
             R = np.sqrt(X**2 + Y**2)
             
             # Initialize with bulk conductivity
-            base_conductivity = np.ones(X.shape) * bulk_conductivity
+            base_conductivity = np.full(X.shape, bulk_conductivity, dtype=X.dtype)
             
             # Calculate displaced Z coordinates for membrane positioning
             Z_displaced = Z - membrane_z_offset
@@ -778,7 +808,7 @@ class BiologicalPore(BasePore):
                 grid_coords = np.column_stack([X.ravel(), Y.ravel(), Z.ravel()])
                 
                 # Initialize with bulk conductivity
-                conductivity_map = np.full(len(grid_coords), bulk_conductivity)
+                conductivity_map = np.full(len(grid_coords), bulk_conductivity, dtype=X.dtype)
                 
                 # Only modify conductivity within the allowed pore region (not in membrane)
                 pore_region_flat = ~membrane_mask.ravel()
@@ -0,0 +1,213 @@
+"""
+Grid-based screened-Coulomb (Debye-Hückel) potential of many point charges.
+
+``screened_potential_grid`` spreads the charges onto a regular grid with
+cloud-in-cell weights and convolves them with the screened Coulomb kernel
+``l_B exp(-r / lambda_D) / r`` by FFT. The kernel is truncated at a cutoff,
+and the charge grid is padded by the kernel half-width, so the linear
+(``valid``) convolution has no periodic images and includes atoms up to one
+cutoff outside the grid. Cost is O(N log N) in grid points and linear in
+charges, against O(N * M) for a direct sum over M charges.
+
+``cached_screened_potential_grid`` stores the result as ``.npz`` keyed by a
+hash of every input, so repeated runs on the same pore and grid load it
+instead of recomputing. Under MPI only rank 0 reads, computes and writes
+the file; the grid is broadcast to the other ranks.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.signal import fftconvolve
+
+logger = logging.getLogger(__name__)
+
+# Bump when the discretisation changes so stale cache files are not reused.
+_CACHE_VERSION = 1
+
+
+def _grid_spacing(axes):
+    spacing = np.array([axis[1] - axis[0] if axis.size > 1 else 1.0 for axis in axes])
+    for axis, h in zip(axes, spacing):
+        if axis.size > 2 and not np.allclose(np.diff(axis), h, rtol=1e-6, atol=0.0):
+            raise ValueError("screened_potential_grid requires uniformly spaced axes")
+    return spacing
+
+
+def spread_charges(axes, positions, charges, pad):
+    """
+    Cloud-in-cell assignment of point charges to a padded grid.
+
+    Args:
+        axes: Three 1D uniformly spaced grid axes (Å)
+        positions: Mx3 charge positions (Å)
+        charges: M charges (e)
+        pad: Cells of padding added on each side of every axis
+
+    Returns:
+        Array of shape ``len(axis) + 2 * pad`` per axis holding the charge per
+        grid node; charges beyond the padded grid are dropped
+    """
+    spacing = _grid_spacing(axes)
+    shape = np.array([axis.size for axis in axes]) + 2 * np.asarray(pad)
+    lower = np.array([axis[0] for axis in axes]) - np.asarray(pad) * spacing
+    rho = np.zeros(tuple(shape))
+
+    f = (np.asarray(positions, dtype=float) - lower) / spacing
+    i0 = np.floor(f).astype(np.intp)
+    t = f - i0
+    charges = np.asarray(charges, dtype=float)
+    for corner in range(8):
+        offset = np.array([(corner >> 2) & 1, (corner >> 1) & 1, corner & 1])
+        idx = i0 + offset
+        weight = np.prod(np.where(offset == 1, t, 1.0 - t), axis=1)
+        inside = np.all((idx >= 0) & (idx < shape), axis=1)
+        np.add.at(rho, tuple(idx[inside].T), charges[inside] * weight[inside])
+    return rho
+
+
+def screened_coulomb_kernel(spacing, debye_length, bjerrum_length, cutoff, core_radius):
+    """
+    Truncated screened Coulomb kernel sampled on grid offsets.
+
+    Args:
+        spacing: Grid spacing per axis (Å)
+        debye_length: Debye screening length (Å)
+        bjerrum_length: Bjerrum length (Å)
+        cutoff: Kernel truncation radius (Å)
+        core_radius: Distance floor that removes the point-charge singularity (Å)
+
+    Returns:
+        (kernel, half_width) with kernel shape ``2 * half_width + 1`` per axis
+    """
+    half_width = np.ceil(cutoff / np.asarray(spacing)).astype(int)
+    offsets = [h * np.arange(-m, m + 1) for h, m in zip(spacing, half_width)]
+    DX, DY, DZ = np.meshgrid(*offsets, indexing="ij")
+    r = np.sqrt(DX**2 + DY**2 + DZ**2)
+    kernel = np.zeros(r.shape)
+    within = r < cutoff
+    r_eff = np.maximum(r[within], core_radius)
+    kernel[within] = bjerrum_length * np.exp(-r_eff / debye_length) / r_eff
+    return kernel, half_width
+
+
+def screened_potential_grid(axes, positions, charges, radii, debye_length=2.15,
+                            bjerrum_length=7.15, cutoff=None):
+    """
+    Reduced screened potential of point charges on a regular grid, by FFT.
+
+    Args:
+        axes: (x, y, z) uniformly spaced grid axes (Å)
+        positions: Mx3 charge positions (Å)
+        charges: M charges (e); neutral atoms are ignored
+        radii: M atom radii (Å); their median over charged atoms is the
+            distance floor of the kernel
+        debye_length: Debye screening length (Å)
+        bjerrum_length: Bjerrum length (Å)
+        cutoff: Kernel cutoff (Å); defaults to 4 Debye lengths
+
+    Returns:
+        float32 array of shape ``(len(x), len(y), len(z))`` with the
+        dimensionless potential ``beta * e * phi``
+    """
+    axes = [np.asarray(axis, dtype=float) for axis in axes]
+    cutoff = float(cutoff) if cutoff is not None else 4.0 * float(debye_length)
+    charges = np.asarray(charges, dtype=float)
+    charged = charges != 0
+    shape = tuple(axis.size for axis in axes)
+    if not np.any(charged):
+        return np.zeros(shape, dtype=np.float32)
+
+    radii = np.broadcast_to(np.asarray(radii, dtype=float), charges.shape)
+    spacing = _grid_spacing(axes)
+    kernel, half_width = screened_coulomb_kernel(
+        spacing, debye_length, bjerrum_length, cutoff, float(np.median(radii[charged]))
+    )
+    rho = spread_charges(axes, np.asarray(positions)[charged], charges[charged], half_width)
+    # "valid" convolution of the padded charge grid returns exactly the
+    # original grid and never wraps around.
+    return fftconvolve(rho, kernel, mode="valid").astype(np.float32)
+
+
+def _cache_key(axes, positions, charges, radii, debye_length, bjerrum_length, cutoff):
+    digest = hashlib.sha1()
+    digest.update(np.int64(_CACHE_VERSION).tobytes())
+    for array in (*axes, positions, charges, radii):
+        digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+    digest.update(np.array([debye_length, bjerrum_length, cutoff], dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def cached_screened_potential_grid(cache_dir, prefix, axes, positions, charges, radii,
+                                   debye_length=2.15, bjerrum_length=7.15, cutoff=None,
+                                   comm=None):
+    """
+    ``screened_potential_grid`` with an on-disk cache.
+
+    The cache file is ``<cache_dir>/<prefix>_phi_<hash>.npz``, where the hash
+    covers the grid axes, charge positions, charges, radii and parameters.
+    It is written under a per-process temporary name and then renamed, so
+    concurrent runs sharing the directory never read a partial file.
+
+    Args:
+        comm: Optional MPI communicator. The call is then collective: rank 0
+            loads or computes the grid and broadcasts it.
+
+    Returns:
+        float32 potential grid as for ``screened_potential_grid``
+    """
+    if comm is None or comm.Get_size() == 1:
+        return _load_or_compute(cache_dir, prefix, axes, positions, charges, radii,
+                                debye_length, bjerrum_length, cutoff)
+    phi, header = None, None
+    if comm.Get_rank() == 0:
+        try:
+            phi = _load_or_compute(cache_dir, prefix, axes, positions, charges, radii,
+                                   debye_length, bjerrum_length, cutoff)
+            header = phi.shape
+        except Exception as exc:
+            # Re-raised on every rank so none is left waiting in Bcast.
+            header = exc
+    header = comm.bcast(header, root=0)
+    if isinstance(header, Exception):
+        raise header
+    if phi is None:
+        phi = np.empty(header, dtype=np.float32)
+    comm.Bcast(phi, root=0)
+    return phi
+
+
+def _load_or_compute(cache_dir, prefix, axes, positions, charges, radii,
+                     debye_length, bjerrum_length, cutoff):
+    cutoff = float(cutoff) if cutoff is not None else 4.0 * float(debye_length)
+    positions = np.asarray(positions, dtype=float)
+    charges = np.asarray(charges, dtype=float)
+    radii = np.broadcast_to(np.asarray(radii, dtype=float), charges.shape)
+    key = _cache_key(axes, positions, charges, radii, debye_length, bjerrum_length, cutoff)
+    path = Path(cache_dir) / f"{prefix}_phi_{key[:16]}.npz"
+
+    if path.exists():
+        try:
+            with np.load(path) as data:
+                if str(data["key"]) == key:
+                    logger.info(f"Loaded cached screened potential from {path}")
+                    return np.ascontiguousarray(data["phi"], dtype=np.float32)
+        except Exception as exc:
+            logger.warning(f"Ignoring unreadable potential cache {path}: {exc}")
+
+    start = time.time()
+    phi = screened_potential_grid(axes, positions, charges, radii,
+                                  debye_length, bjerrum_length, cutoff)
+    logger.info(f"Screened potential grid {phi.shape} by FFT in {time.time() - start:.2f} s")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez(tmp, phi=phi, key=np.array(key))
+        tmp.replace(path)
+    except OSError as exc:
+        logger.warning(f"Could not write potential cache {path}: {exc}")
+    return phi
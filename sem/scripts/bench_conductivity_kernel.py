@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark the fused Numba conductivity kernel against the NumPy path.
+
+Both paths start from the same KD-tree query results for a synthetic
+analyte in a box of DG0 DOFs. They apply the radius correction,
+``SimpleConductivityModel`` and the minimum with the base conductivity. The
+script checks that the results are bit-identical and reports the best time
+of each path.
+
+Example:
+    python -m sem.scripts.bench_conductivity_kernel --dofs 1e6 5e6 20e6 --atoms 20000
+"""
+
+import argparse
+import time
+
+import numpy as np
+from numba import get_num_threads
+from scipy.spatial import KDTree
+
+try:
+    from ..conductivity_models import SimpleConductivityModel
+    from ..kernels import fused_conductivity_update
+except ImportError:  # pragma: no cover - relative import fallback
+    from sem.conductivity_models import SimpleConductivityModel
+    from sem.kernels import fused_conductivity_update
+
+
+def numpy_update(base, rows, distances, indices, radii, model, membrane_conductivity):
+    """NumPy sequence used by ``calculate_analyte_conductivity_modification``."""
+    conductivity = base.copy()
+    distances = distances.copy()
+    near = ~np.isinf(distances)
+    distances[near] = np.maximum(distances[near] - radii[indices[near]], 0)
+    all_distances = np.full(base.shape[0], np.inf)
+    all_distances[rows] = distances
+    valid_mask = ~np.isinf(all_distances)
+    analyte_cond = model(all_distances[valid_mask])
+    hard_core = all_distances[valid_mask] <= model.min_distance
+    overlaps = int(np.count_nonzero(hard_core & (base[valid_mask] <= membrane_conductivity)))
+    conductivity[valid_mask] = np.minimum(conductivity[valid_mask], analyte_cond)
+    return conductivity, overlaps
+
+
+def fused_update(base, rows, distances, indices, radii, model, membrane_conductivity):
+    conductivity = base.copy()
+    overlaps = fused_conductivity_update(
+        conductivity, base, rows, distances, indices, radii,
+        model.cutoff, model.min_distance, model.bulk_conductivity,
+        0.0000001 * model.bulk_conductivity, membrane_conductivity, True,
+    )
+    return conductivity, overlaps
+
+
+def make_problem(num_dofs, num_atoms, box=300.0, analyte_size=50.0, cutoff=5.0, seed=0):
+    """Random DOFs in a cubic box, a compact random analyte at its centre."""
+    rng = np.random.default_rng(seed)
+    coords = rng.random((num_dofs, 3)) * box
+    base = np.where(np.abs(coords[:, 2] - box / 2) < 20.0, 1e-4, 11.2) * rng.uniform(0.5, 1.0, num_dofs)
+    atoms = (rng.random((num_atoms, 3)) - 0.5) * analyte_size + box / 2
+    radii = rng.uniform(1.2, 2.0, num_atoms)
+
+    lo, hi = atoms.min(axis=0) - cutoff, atoms.max(axis=0) + cutoff
+    rows = np.flatnonzero(np.all((coords >= lo) & (coords <= hi), axis=1))
+    distances, indices = KDTree(atoms).query(coords[rows], distance_upper_bound=cutoff)
+    return base, rows, distances, indices, radii
+
+
+def _best_of(func, repeats):
+    best, result = np.inf, None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--dofs", nargs="+", type=float, default=[1e6, 5e6, 20e6],
+                        help="Numbers of conductivity DOFs (default: 1M 5M 20M).")
+    parser.add_argument("--atoms", type=int, default=20000,
+                        help="Analyte atoms (default: 20000).")
+    parser.add_argument("--cutoff", type=float, default=5.0,
+                        help="Conductivity cutoff (Å, default: 5.0).")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="Repetitions per timing; the best is reported (default: 5).")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    model = SimpleConductivityModel(bulk_conductivity=11.2, cutoff=args.cutoff)
+    membrane_conductivity = 1e-4
+    print(f"Numba threads: {get_num_threads()}")
+    print(f"{'dofs':>10} {'queried':>9} {'numpy [s]':>10} {'fused [s]':>10} {'speedup':>8} {'identical':>9}")
+    for dofs in args.dofs:
+        problem = make_problem(int(dofs), args.atoms, cutoff=args.cutoff)
+        fused_update(*problem, model, membrane_conductivity)  # compile outside the timing
+        t_numpy, (ref, ref_overlaps) = _best_of(
+            lambda: numpy_update(*problem, model, membrane_conductivity), args.repeats)
+        t_fused, (out, overlaps) = _best_of(
+            lambda: fused_update(*problem, model, membrane_conductivity), args.repeats)
+        identical = np.array_equal(ref, out) and ref_overlaps == overlaps
+        print(f"{int(dofs):>10d} {problem[1].size:>9d} {t_numpy:>10.4f} {t_fused:>10.4f} "
+              f"{t_numpy / t_fused:>8.1f} {str(identical):>9}")
+        if not identical:
+            raise SystemExit("Fused kernel result differs from the NumPy path")
+
+
+if __name__ == "__main__":
+    main()
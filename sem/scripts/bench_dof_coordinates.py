@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark DG0 DOF coordinate tabulation (``sem.utils.get_dof_coordinates``).
+
+Compares the former per-cell Python loop over ``dofmap.list.links`` with the
+vectorized scatter for adjacency-list and 2D-array dofmaps, on randomly
+permuted one-dof-per-cell dofmaps of 1M-20M cells. With ``--mesh`` the full
+function is also timed on DOLFINx box meshes, including the memoized call.
+
+Example:
+    python -m sem.scripts.bench_dof_coordinates --cells 1e6 5e6 20e6
+    python -m sem.scripts.bench_dof_coordinates --cells 1e6 --mesh
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import dolfinx
+import dolfinx.fem as fem
+import dolfinx.mesh as dmesh
+from dolfinx.graph import adjacencylist
+from mpi4py import MPI
+
+try:
+    from ..utils import _single_dof_per_cell, get_dof_coordinates
+except ImportError:  # pragma: no cover - relative import fallback
+    from sem.utils import _single_dof_per_cell, get_dof_coordinates
+
+
+def _legacy_scatter(cell_dofs, cell_midpoints, num_dofs):
+    """Per-cell loop used before vectorization (reference timing)."""
+    coords = np.zeros((num_dofs, cell_midpoints.shape[1]), dtype=cell_midpoints.dtype)
+    for cell in range(cell_midpoints.shape[0]):
+        dofs = cell_dofs.links(cell)
+        coords[dofs[0]] = cell_midpoints[cell]
+    return coords
+
+
+def _vectorized_scatter(cell_dofs, cell_midpoints, num_dofs):
+    coords = np.zeros((num_dofs, cell_midpoints.shape[1]), dtype=cell_midpoints.dtype)
+    coords[_single_dof_per_cell(cell_dofs, cell_midpoints.shape[0])] = cell_midpoints
+    return coords
+
+
+def _best_of(func, repeats):
+    best = np.inf
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_scatter(num_cells, legacy_max_cells, repeats, seed=0):
+    """Time legacy and vectorized scatters on a permuted DG0 dofmap."""
+    rng = np.random.default_rng(seed)
+    dofs = rng.permutation(num_cells).astype(np.int32)
+    midpoints = rng.random((num_cells, 3))
+    offsets = np.arange(num_cells + 1, dtype=np.int32)
+    adjacency = adjacencylist(dofs, offsets)
+    array2d = dofs.reshape(-1, 1)
+
+    t_adj, coords_adj = _best_of(lambda: _vectorized_scatter(adjacency, midpoints, num_cells), repeats)
+    t_arr, coords_arr = _best_of(lambda: _vectorized_scatter(array2d, midpoints, num_cells), repeats)
+    if not np.array_equal(coords_adj, coords_arr):
+        raise AssertionError("adjacency and array dofmaps give different coordinates")
+
+    t_legacy = np.nan
+    if num_cells <= legacy_max_cells:
+        t_legacy, coords_legacy = _best_of(lambda: _legacy_scatter(adjacency, midpoints, num_cells), 1)
+        if not np.array_equal(coords_legacy, coords_adj):
+            raise AssertionError("vectorized scatter differs from the per-cell loop")
+    return t_legacy, t_adj, t_arr
+
+
+def bench_mesh(num_cells, repeats):
+    """Time get_dof_coordinates on a tetrahedral box mesh with ~num_cells cells."""
+    n = max(int(round((num_cells / 6.0) ** (1.0 / 3.0))), 1)
+    mesh = dmesh.create_box(MPI.COMM_WORLD, [np.zeros(3), np.ones(3)], [n, n, n],
+                            dmesh.CellType.tetrahedron)
+    V = fem.functionspace(mesh, ("DG", 0))
+    actual_cells = mesh.topology.index_map(3).size_local
+
+    start = time.perf_counter()
+    get_dof_coordinates(mesh, V)
+    t_first = time.perf_counter() - start
+    t_memo, _ = _best_of(lambda: get_dof_coordinates(mesh, V), repeats)
+    return actual_cells, t_first, t_memo
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--cells", nargs="+", type=float,
+                        default=[1e6, 2e6, 5e6, 10e6, 20e6],
+                        help="Cell counts to benchmark (default: 1M 2M 5M 10M 20M).")
+    parser.add_argument("--legacy-max-cells", type=float, default=5e6,
+                        help="Skip the slow per-cell loop above this many cells (default: 5M).")
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="Repetitions per timing; the best is reported (default: 3).")
+    parser.add_argument("--mesh", action="store_true",
+                        help="Also time get_dof_coordinates on DOLFINx box meshes.")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    print(f"DOLFINx {dolfinx.__version__}")
+    print(f"{'cells':>12} {'loop [s]':>10} {'adjacency [s]':>14} {'array [s]':>10} {'speedup':>8}")
+    for cells in args.cells:
+        num_cells = int(cells)
+        t_legacy, t_adj, t_arr = bench_scatter(num_cells, args.legacy_max_cells, args.repeats)
+        speedup = t_legacy / t_adj if np.isfinite(t_legacy) else np.nan
+        print(f"{num_cells:>12d} {t_legacy:>10.3f} {t_adj:>14.4f} {t_arr:>10.4f} {speedup:>8.1f}")
+
+    if args.mesh:
+        print()
+        print(f"{'mesh cells':>12} {'first call [s]':>15} {'memoized [s]':>13}")
+        for cells in args.cells:
+            actual_cells, t_first, t_memo = bench_mesh(int(cells), args.repeats)
+            print(f"{actual_cells:>12d} {t_first:>15.3f} {t_memo:>13.2e}")
+
+
+if __name__ == "__main__":
+    main()
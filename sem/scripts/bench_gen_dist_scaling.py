@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Measure how the gen_dist distance-field kernel scales with the thread count.
+
+The pore atoms come from one of three sources:
+
+- an XYZ file (``x y z radius`` rows, as written by ``pdb2xyz.py``);
+- a PDB file, read with pdb2xyz.py's atom selection and radius rules
+  (requires MDAnalysis);
+- a synthetic 7AHL-sized heptamer (cap plus stem barrel, about 16k atoms).
+
+The box is the atom extent plus ``--margin``. For each resolution, the
+script times ``gen_dist.compute_distance_field`` for 1 .. N threads and
+reports the speedup and parallel efficiency relative to one thread. Each
+field is checked against the single-thread one.
+
+The first call includes JIT compilation, or loading the compiled kernels
+from numba's on-disk cache; it is reported separately. Run the script
+twice to see the cached start-up.
+
+Example:
+    python -m sem.scripts.bench_gen_dist_scaling --pdb 7ahl.pdb --resolution 1.0 0.5
+    NUMBA_NUM_THREADS=16 python -m sem.scripts.bench_gen_dist_scaling --xyz 7ahl.xyz --threads 1 2 4 8 16
+"""
+
+import argparse
+import time
+
+import numba
+import numpy as np
+
+try:
+    from .gen_dist import compute_distance_field
+except ImportError:  # pragma: no cover - relative import fallback
+    from sem.scripts.gen_dist import compute_distance_field
+
+
+def synthetic_heptamer(seed=0):
+    """Atoms of a 7AHL-sized pore: a 100 Å wide cap over a 52 Å long, 26 Å wide stem."""
+    rng = np.random.default_rng(seed)
+    n_cap, n_stem = 11000, 5000
+    theta = rng.random(n_cap) * 2 * np.pi
+    radius = rng.uniform(8.0, 50.0, n_cap)
+    cap = np.column_stack([radius * np.cos(theta), radius * np.sin(theta),
+                           rng.uniform(0.0, 50.0, n_cap)])
+    theta = rng.random(n_stem) * 2 * np.pi
+    radius = rng.uniform(7.0, 13.0, n_stem)
+    stem = np.column_stack([radius * np.cos(theta), radius * np.sin(theta),
+                            rng.uniform(-52.0, 0.0, n_stem)])
+    positions = np.vstack([cap, stem])
+    radii = rng.choice([1.1, 1.52, 1.55, 1.7, 1.8], positions.shape[0])
+    return positions, radii
+
+
+def load_pdb(path):
+    """Positions and radii as pdb2xyz.py would write them."""
+    import MDAnalysis as mda
+
+    try:
+        from .pdb2xyz import get_radius_info, select_pore_atoms
+    except ImportError:  # pragma: no cover - relative import fallback
+        from sem.scripts.pdb2xyz import get_radius_info, select_pore_atoms
+    atoms = select_pore_atoms(mda.Universe(path))
+    return atoms.positions.astype(float), np.asarray(get_radius_info(atoms), dtype=float)
+
+
+def _timed(func, repeat):
+    best, result = np.inf, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--xyz", default=None, help="XYZ file with x y z radius rows.")
+    source.add_argument("--pdb", default=None, help="Pore PDB file (e.g. 7AHL).")
+    parser.add_argument("--resolution", nargs="+", type=float, default=[1.0, 0.5],
+                        help="Grid spacings (Å, default: 1.0 0.5).")
+    parser.add_argument("--cutoff", type=float, default=5.0,
+                        help="Distance cutoff (Å, default: 5.0).")
+    parser.add_argument("--margin", type=float, default=10.0,
+                        help="Box margin around the atoms (Å, default: 10).")
+    parser.add_argument("--threads", nargs="+", type=int, default=None,
+                        help="Thread counts (default: 1 .. NUMBA_NUM_THREADS).")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed runs per thread count; the best is reported (default: 3).")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    if args.xyz:
+        data = np.loadtxt(args.xyz, ndmin=2)
+        positions, radii, source = data[:, :3], data[:, 3], args.xyz
+    elif args.pdb:
+        (positions, radii), source = load_pdb(args.pdb), args.pdb
+    else:
+        (positions, radii), source = synthetic_heptamer(), "synthetic heptamer"
+
+    max_threads = numba.config.NUMBA_NUM_THREADS
+    threads = sorted(set(args.threads or range(1, max_threads + 1)))
+    if threads[-1] > max_threads:
+        raise SystemExit(f"Only {max_threads} numba threads available; set NUMBA_NUM_THREADS")
+    lower = positions.min(axis=0) - args.margin
+    upper = positions.max(axis=0) + args.margin
+    print(f"{source}: {positions.shape[0]} atoms, box {np.round(upper - lower, 1)} Å, "
+          f"up to {max_threads} numba threads")
+
+    for resolution in args.resolution:
+        def run(num_threads):
+            return compute_distance_field(positions, radii, *lower, *upper, resolution,
+                                          args.cutoff, num_threads=num_threads)
+
+        start = time.perf_counter()
+        run(1)
+        first_call = time.perf_counter() - start
+        reference, t_one = _timed(lambda: run(1), args.repeat)
+        print(f"\nResolution {resolution} Å, grid {reference.shape[::-1]}: first call "
+              f"{first_call:.2f} s (JIT or cache load), "
+              f"threading layer {numba.threading_layer()}")
+        print(f"{'threads':>8} {'time [s]':>9} {'speedup':>8} {'efficiency':>11}")
+        for num_threads in threads:
+            field, elapsed = (reference, t_one) if num_threads == 1 else _timed(
+                lambda: run(num_threads), args.repeat)
+            if not np.array_equal(field, reference):
+                raise SystemExit(f"{num_threads}-thread field differs from the 1-thread field")
+            speedup = t_one / elapsed
+            print(f"{num_threads:>8d} {elapsed:>9.2f} {speedup:>8.2f} {speedup / num_threads:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark the local-subdomain correction against the persistent global solve.
+
+A box mesh holds a membrane slab with a cylindrical pore; a low-conductivity
+sphere (the analyte) is translated along the pore axis. At every position the
+same conductivity is solved twice:
+
+* globally by ``PersistentPoissonSolver`` (CG + hypre, started from the
+  open-pore field, preconditioner rebuilt per position), and
+* by ``LocalCorrectionSolver`` on the analyte box plus each halo.
+
+Assembly is identical for both and excluded; the global time is the KSP solve
+(including the AMG setup), the local time is subdomain extraction, the
+subdomain solve, the global residual check and, for positions whose residual
+is above ``--residual-rtol``, the warm-started global solve that finishes them.
+Also reported: the subdomain size, the residual of the corrected field,
+whether the position fell back, and the relative current difference to the
+global solve.
+
+Example:
+    python -m sem.scripts.bench_local_correction --cells 64 --halo 5 10 20
+    mpirun -n 4 python -m sem.scripts.bench_local_correction --cells 96 --residual-rtol 1e-5
+"""
+
+import argparse
+
+import numpy as np
+
+import dolfinx
+import dolfinx.fem as fem
+import dolfinx.mesh as dmesh
+import ufl
+from mpi4py import MPI
+from petsc4py import PETSc
+
+try:
+    from ..fem_solver import PersistentPoissonSolver
+    from ..local_correction import LocalCorrectionSolver
+except ImportError:  # pragma: no cover - relative import fallback
+    from sem.fem_solver import PersistentPoissonSolver
+    from sem.local_correction import LocalCorrectionSolver
+
+BULK_CONDUCTIVITY = 11.2
+MEMBRANE_CONDUCTIVITY = 1e-6
+GLOBAL_OPTIONS = {"ksp_type": "cg", "pc_type": "hypre", "ksp_rtol": 1e-8, "ksp_max_it": 2000}
+
+
+class _PoreModel:
+    """Membrane slab with a cylindrical pore in a cubic box (lengths in Å)."""
+
+    def __init__(self, comm, cells, size, membrane, pore_radius, voltage):
+        half = size / 2.0
+        self.mesh = dmesh.create_box(comm, [np.full(3, -half), np.full(3, half)],
+                                     [cells, cells, cells], dmesh.CellType.tetrahedron)
+        self.V = fem.functionspace(self.mesh, ("Lagrange", 1))
+        self.Q = fem.functionspace(self.mesh, ("DG", 0))
+        self.voltage = voltage
+        fdim = self.mesh.topology.dim - 1
+        top = dmesh.locate_entities_boundary(self.mesh, fdim, lambda x: np.isclose(x[2], half))
+        bot = dmesh.locate_entities_boundary(self.mesh, fdim, lambda x: np.isclose(x[2], -half))
+        self.bcs = [
+            fem.dirichletbc(PETSc.ScalarType(voltage), fem.locate_dofs_topological(self.V, fdim, top), self.V),
+            fem.dirichletbc(PETSc.ScalarType(0.0), fem.locate_dofs_topological(self.V, fdim, bot), self.V),
+        ]
+        self.centroids = self.Q.tabulate_dof_coordinates()
+        radial = np.hypot(self.centroids[:, 0], self.centroids[:, 1])
+        self.open_pore = np.full(self.centroids.shape[0], BULK_CONDUCTIVITY)
+        self.open_pore[(np.abs(self.centroids[:, 2]) < membrane / 2) & (radial > pore_radius)] = (
+            MEMBRANE_CONDUCTIVITY
+        )
+
+        self.sig = fem.Function(self.Q)
+        self.sig.x.array[:] = self.open_pore
+        u, v = ufl.TrialFunction(self.V), ufl.TestFunction(self.V)
+        self.a = self.sig * ufl.dot(ufl.grad(u), ufl.grad(v)) * ufl.dx
+        self.L = fem.Constant(self.mesh, PETSc.ScalarType(0.0)) * v * ufl.dx
+
+    def solver(self, prefix):
+        return PersistentPoissonSolver(self.a, self.L, self.bcs, self.V, petsc_options=GLOBAL_OPTIONS,
+                                       options_prefix=prefix, coefficient=self.sig)
+
+    def place_analyte(self, z, radius, conductivity):
+        """Open-pore conductivity with a sphere at (0, 0, z); returns its box."""
+        sig = self.open_pore.copy()
+        inside = np.linalg.norm(self.centroids - np.array([0.0, 0.0, z]), axis=1) < radius
+        sig[inside] = conductivity
+        self.sig.x.array[:] = sig
+        center = np.array([0.0, 0.0, z])
+        return center - radius, center + radius
+
+    def current(self, uh):
+        """Current from the dissipated power, sigma |grad u|^2 / V."""
+        form = fem.form(self.sig * ufl.dot(ufl.grad(uh), ufl.grad(uh)) * ufl.dx)
+        power = self.mesh.comm.allreduce(fem.assemble_scalar(form), op=MPI.SUM)
+        return power / self.voltage
+
+
+def bench(args):
+    comm = MPI.COMM_WORLD
+    model = _PoreModel(comm, args.cells, args.size, args.membrane, args.pore_radius, args.voltage)
+    global_solver = model.solver("bench_global_")
+    global_solver.solve()
+    open_pore = global_solver.uh.x.array.copy()
+
+    local_solvers = {}
+    for halo in args.halo:
+        base = model.solver(f"bench_local_{len(local_solvers)}_")
+        base.solve()
+        local = LocalCorrectionSolver(base, halo=halo, rtol=1e-8, residual_rtol=args.residual_rtol)
+        local.set_reference()
+        local_solvers[halo] = local
+
+    rows = []
+    limit = args.size / 2 - args.analyte_radius - max(args.halo)
+    for z in np.linspace(-limit, limit, args.positions):
+        box = model.place_analyte(z, args.analyte_radius, args.analyte_conductivity)
+        global_solver.solve(initial_guess=open_pore)
+        t_global = global_solver.last_solve_time
+        current = model.current(global_solver.uh)
+        for halo, local in local_solvers.items():
+            uh = local.solve(*box)
+            t_local = local.last_setup_time + local.last_solve_time + local.last_check_time
+            if local.last_fallback:
+                t_local += local.solver.last_solve_time
+            rel_diff = abs(model.current(uh) - current) / max(abs(current), 1e-300)
+            rows.append((z, halo, global_solver.last_iterations, t_global, local.last_local_fraction,
+                         local.last_iterations, t_local, rel_diff, local.last_residual,
+                         local.last_fallback))
+    return global_solver.A.getSize()[0], rows
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--cells", type=int, default=48,
+                        help="Mesh divisions per side (default: 48).")
+    parser.add_argument("--size", type=float, default=200.0,
+                        help="Box edge length in Å (default: 200).")
+    parser.add_argument("--membrane", type=float, default=40.0,
+                        help="Membrane thickness in Å (default: 40).")
+    parser.add_argument("--pore-radius", type=float, default=15.0,
+                        help="Pore radius in Å (default: 15).")
+    parser.add_argument("--analyte-radius", type=float, default=12.0,
+                        help="Analyte sphere radius in Å (default: 12).")
+    parser.add_argument("--analyte-conductivity", type=float, default=0.1 * BULK_CONDUCTIVITY,
+                        help="Conductivity inside the analyte (default: 10%% of bulk).")
+    parser.add_argument("--voltage", type=float, default=0.1,
+                        help="Applied voltage in V (default: 0.1).")
+    parser.add_argument("--halo", type=float, nargs="+", default=[5.0, 10.0, 20.0],
+                        help="Halo widths in Å to benchmark (default: 5 10 20).")
+    parser.add_argument("--residual-rtol", type=float, default=1e-8,
+                        help="Global relative residual accepted without a global solve (default: 1e-8).")
+    parser.add_argument("--positions", type=int, default=9,
+                        help="Analyte positions along the pore axis (default: 9).")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    num_dofs, rows = bench(args)
+    if MPI.COMM_WORLD.rank != 0:
+        return
+    print(f"DOLFINx {dolfinx.__version__}, {MPI.COMM_WORLD.size} rank(s), {num_dofs} DOFs")
+    print(f"{'z [Å]':>8} {'halo':>6} {'global its':>10} {'global [s]':>10} {'local %':>8} "
+          f"{'local its':>9} {'local [s]':>10} {'speedup':>8} {'dI/I':>9} {'residual':>9} {'fallback':>8}")
+    for z, halo, g_its, t_global, fraction, l_its, t_local, rel_diff, residual, fallback in rows:
+        print(f"{z:>8.1f} {halo:>6.1f} {g_its:>10d} {t_global:>10.4f} {fraction*100:>8.2f} "
+              f"{l_its:>9d} {t_local:>10.4f} {t_global / t_local:>8.1f} {rel_diff:>9.2e} {residual:>9.2e} "
+              f"{'yes' if fallback else 'no':>8}")
+
+    print()
+    print(f"{'halo':>6} {'global [s]':>10} {'local [s]':>10} {'speedup':>8} {'max dI/I':>9} {'fallbacks':>9}")
+    table = np.array([row[1:] for row in rows], dtype=float)
+    for halo in args.halo:
+        sel = table[table[:, 0] == halo]
+        t_global, t_local = sel[:, 2].sum(), sel[:, 5].sum()
+        print(f"{halo:>6.1f} {t_global:>10.3f} {t_local:>10.3f} {t_global / t_local:>8.1f} "
+              f"{sel[:, 6].max():>9.2e} {int(sel[:, 8].sum()):>9d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Compare grid-interpolated and analytic (grid-free) base conductivity.
+
+For the cylindrical, conical and double-cone pores the script:
+
+1. Builds the meshgrid-based interpolator, as for
+   ``pore_evaluation: grid``, and times it.
+2. Evaluates it at random DOF coordinates.
+3. Evaluates the same points with the closed-form evaluator
+   (``pore_evaluation: analytic``).
+
+It reports build and evaluation times, tracemalloc peaks, and the largest
+difference relative to the bulk conductivity. On grid nodes the two paths
+agree exactly, so any difference comes from the grid's linear
+interpolation.
+
+Example:
+    python -m sem.scripts.bench_pore_evaluation --box 300 300 200 --resolution 0.5 --dofs 5e6
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+try:
+    from ..pore_geometry import ConicalPore, CylindricalPore, DoubleConePore
+except ImportError:  # pragma: no cover - relative import fallback
+    from sem.pore_geometry import ConicalPore, CylindricalPore, DoubleConePore
+
+
+def _pores(X, Y, Z, bulk):
+    common = dict(membrane_half_thickness=15.0, bulk_conductivity=bulk,
+                  membrane_conductivity=1e-7 * bulk)
+    return {
+        "cylindrical": CylindricalPore(X, Y, Z, pore_radius=10.0, corner_radius=3.0, **common),
+        "conical": ConicalPore(X, Y, Z, top_radius=15.0, bottom_radius=5.0, **common),
+        "double_cone": DoubleConePore(X, Y, Z, inner_radius=5.0, outer_radius=20.0, **common),
+    }
+
+
+def _measure(func):
+    tracemalloc.reset_peak()
+    start_mem = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start, (tracemalloc.get_traced_memory()[1] - start_mem) / 1e6
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--box", nargs=3, type=float, default=[150.0, 150.0, 120.0],
+                        help="Box edge lengths (Å, default: 150 150 120).")
+    parser.add_argument("--resolution", type=float, default=0.5,
+                        help="Base grid spacing (Å, default: 0.5).")
+    parser.add_argument("--dofs", type=float, default=2e6,
+                        help="Query points (default: 2M).")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    bulk = 11.2
+    half = np.asarray(args.box) / 2
+    axes = [np.linspace(-h, h, int(round(2 * h / args.resolution)) + 1) for h in half]
+    rng = np.random.default_rng(0)
+    points = (rng.random((int(args.dofs), 3)) * 2 - 1) * half
+    nodes = np.column_stack([rng.choice(axis, 10000) for axis in axes])
+
+    tracemalloc.start()
+    (X, Y, Z), t_mesh, mb_mesh = _measure(lambda: np.meshgrid(*axes, indexing="ij"))
+    print(f"Grid {X.shape}: meshgrid {t_mesh:.2f} s / {mb_mesh:.0f} MB")
+    print(f"{'pore':>12} {'grid build':>15} {'grid eval':>10} {'analytic eval':>19} "
+          f"{'max diff':>9} {'node diff':>10}")
+    grid_pores = _pores(X, Y, Z, bulk)
+    analytic_pores = _pores(None, None, None, bulk)
+    for name, pore in grid_pores.items():
+        interp, t_build, mb_build = _measure(pore.get_conductivity_interpolator)
+        grid_values, t_grid, _ = _measure(lambda: interp(points))
+        analytic = analytic_pores[name].get_conductivity_interpolator()
+        exact, t_exact, mb_exact = _measure(lambda: analytic(points))
+        diff = np.max(np.abs(grid_values - exact)) / bulk
+        node_diff = np.max(np.abs(interp(nodes) - analytic(nodes))) / bulk
+        print(f"{name:>12} {t_build:>6.2f}s/{mb_build:>5.0f}MB {t_grid:>9.2f}s "
+              f"{t_exact:>9.2f}s/{mb_exact:>5.0f}MB {diff:>9.2e} {node_diff:>10.2e}")
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark the FFT screened-potential grid against the direct cutoff sum.
+
+Charges come from a PQR file (``x y z`` coordinates, charge and radius
+columns) or a synthetic barrel of partially charged atoms. The script
+builds the pore potential on a regular grid with
+``potential_grid.screened_potential_grid`` (FFT) and with
+``DebyeHuckelPotential`` (cell-list direct sum). It reports both timings and
+the FFT error at grid points more than ``--exclude`` Å from any atom centre.
+It then times a second, cached call.
+
+Example:
+    python -m sem.scripts.bench_pore_potential --atoms 30000 --spacing 1.0 0.5
+    python -m sem.scripts.bench_pore_potential --pqr pore.pqr --spacing 1.0
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+try:
+    from ..conductivity_models import DebyeHuckelPotential
+    from ..potential_grid import cached_screened_potential_grid, screened_potential_grid
+except ImportError:  # pragma: no cover - relative import fallback
+    from sem.conductivity_models import DebyeHuckelPotential
+    from sem.potential_grid import cached_screened_potential_grid, screened_potential_grid
+
+
+def synthetic_barrel(num_atoms, inner=12.0, outer=40.0, height=100.0, seed=0):
+    """Atoms in a hollow cylinder; half neutral, the rest partial or unit charges."""
+    rng = np.random.default_rng(seed)
+    theta = rng.random(num_atoms) * 2 * np.pi
+    radius = rng.uniform(inner, outer, num_atoms)
+    z = rng.uniform(-height / 2, height / 2, num_atoms)
+    positions = np.column_stack([radius * np.cos(theta), radius * np.sin(theta), z])
+    charges = rng.choice([0.0, 1.0, -1.0, 0.3, -0.3], num_atoms, p=[0.5, 0.05, 0.05, 0.2, 0.2])
+    radii = rng.uniform(1.2, 2.0, num_atoms)
+    return positions, charges, radii
+
+
+def load_pqr(path):
+    """Positions, charges and radii from the ATOM/HETATM records of a PQR file."""
+    rows = []
+    with open(path) as handle:
+        for line in handle:
+            if line.startswith(("ATOM", "HETATM")):
+                fields = line.split()
+                rows.append([float(v) for v in fields[-5:]])
+    data = np.array(rows)
+    return data[:, :3], data[:, 3], data[:, 4]
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--pqr", default=None,
+                        help="PQR file of the pore (default: synthetic barrel).")
+    parser.add_argument("--atoms", type=int, default=30000,
+                        help="Synthetic barrel atoms (default: 30000).")
+    parser.add_argument("--spacing", nargs="+", type=float, default=[1.0, 0.5],
+                        help="Grid spacings to benchmark (Å, default: 1.0 0.5).")
+    parser.add_argument("--margin", type=float, default=10.0,
+                        help="Grid margin around the atoms (Å, default: 10).")
+    parser.add_argument("--debye", type=float, default=2.15,
+                        help="Debye length (Å, default: 2.15).")
+    parser.add_argument("--exclude", type=float, default=2.0,
+                        help="Skip points this close to an atom centre in the error (Å, default: 2).")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    positions, charges, radii = (load_pqr(args.pqr) if args.pqr
+                                 else synthetic_barrel(args.atoms))
+    lo = positions.min(axis=0) - args.margin
+    hi = positions.max(axis=0) + args.margin
+    tree = cKDTree(positions)
+    direct = DebyeHuckelPotential(positions, charges, radii, debye_length=args.debye)
+    print(f"Atoms: {positions.shape[0]} ({np.count_nonzero(charges)} charged), "
+          f"cutoff {direct.cutoff:.2f} Å")
+    print(f"{'spacing':>8} {'points':>11} {'fft [s]':>8} {'direct [s]':>11} {'cached [s]':>11} "
+          f"{'mean err':>9} {'p99 err':>8} {'mean |phi|':>10}")
+
+    for h in args.spacing:
+        axes = [np.arange(lo[k], hi[k] + h / 2, h) for k in range(3)]
+        start = time.perf_counter()
+        phi = screened_potential_grid(axes, positions, charges, radii, debye_length=args.debye)
+        t_fft = time.perf_counter() - start
+
+        X, Y, Z = np.meshgrid(*axes, indexing="ij")
+        points = np.column_stack([X.ravel(), Y.ravel(), Z.ravel()])
+        start = time.perf_counter()
+        reference = direct(points)
+        t_direct = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cached_screened_potential_grid(cache_dir, "bench", axes, positions, charges, radii,
+                                           debye_length=args.debye)
+            start = time.perf_counter()
+            cached = cached_screened_potential_grid(cache_dir, "bench", axes, positions, charges,
+                                                    radii, debye_length=args.debye)
+            t_cached = time.perf_counter() - start
+        if not np.array_equal(cached, phi):
+            raise SystemExit("Cached potential differs from the computed grid")
+
+        distance, _ = tree.query(points)
+        mask = (distance > args.exclude) & (distance < direct.cutoff)
+        err = np.abs(phi.ravel().astype(float) - reference)[mask]
+        print(f"{h:>8.2f} {points.shape[0]:>11d} {t_fft:>8.2f} {t_direct:>11.2f} {t_cached:>11.3f} "
+              f"{err.mean():>9.4f} {np.quantile(err, 0.99):>8.4f} {np.abs(reference[mask]).mean():>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Measure peak memory and time of the base-grid path in double and single precision.
+
+For each precision the script repeats what ``VerticalMovementSEM`` does
+before the first solve, on a cylindrical pore:
+
+1. Build the ``X, Y, Z`` meshgrids of the base grid.
+2. Build the pore conductivity grid and its interpolator.
+3. Interpolate it at random DOF coordinates.
+4. Run one analyte update (KD-tree query, steric model, minimum with the
+   base conductivity) on those DOFs.
+
+Peak memory is the tracemalloc peak of NumPy allocations per stage. The
+script also reports the largest difference of the single-precision result
+from double, relative to the bulk conductivity.
+
+Example:
+    python -m sem.scripts.bench_precision --box 150 150 120 --resolution 0.5 --dofs 5e6
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from scipy.spatial import KDTree
+
+try:
+    from ..conductivity_models import SimpleConductivityModel
+    from ..pore_geometry import CylindricalPore
+    from ..utils import precision_dtype
+except ImportError:  # pragma: no cover - relative import fallback
+    from sem.conductivity_models import SimpleConductivityModel
+    from sem.pore_geometry import CylindricalPore
+    from sem.utils import precision_dtype
+
+
+def _measure(func):
+    """Run ``func`` and return (result, seconds, peak MB above the start)."""
+    tracemalloc.reset_peak()
+    start_mem = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] - start_mem
+    return result, elapsed, peak / 1e6
+
+
+def run(precision, box, resolution, dofs, atoms, radii, bulk, seed=0):
+    dtype = precision_dtype(precision)
+    half = np.asarray(box, dtype=float) / 2
+    axes = [np.linspace(-h, h, int(round(2 * h / resolution)) + 1).astype(dtype) for h in half]
+    stats = {}
+
+    (X, Y, Z), stats["meshgrid"], stats["meshgrid_mb"] = _measure(
+        lambda: np.meshgrid(*axes, indexing="ij"))
+    pore = CylindricalPore(X, Y, Z, pore_radius=10.0, membrane_half_thickness=15.0,
+                           bulk_conductivity=bulk, membrane_conductivity=1e-7 * bulk)
+    interp, stats["pore_grid"], stats["pore_grid_mb"] = _measure(pore.get_conductivity_interpolator)
+
+    rng = np.random.default_rng(seed)
+    coords = (rng.random((dofs, 3)) * 2 - 1).astype(dtype) * (half - resolution).astype(dtype)
+    base, stats["interpolate"], stats["interpolate_mb"] = _measure(
+        lambda: interp(coords).astype(dtype))
+
+    model = SimpleConductivityModel(bulk_conductivity=bulk)
+
+    def update():
+        conductivity = base.copy()
+        distances, indices = KDTree(atoms).query(coords, distance_upper_bound=model.cutoff)
+        all_distances = np.full(coords.shape[0], np.inf, dtype=conductivity.dtype)
+        near = np.isfinite(distances)
+        all_distances[near] = np.maximum(distances[near] - radii[indices[near]], 0)
+        valid = np.isfinite(all_distances)
+        conductivity[valid] = np.minimum(conductivity[valid], model(all_distances[valid]))
+        return conductivity
+
+    result, stats["update"], stats["update_mb"] = _measure(update)
+    stats["grid_mb"] = (X.nbytes + Y.nbytes + Z.nbytes + interp.values.nbytes) / 1e6
+    stats["dof_mb"] = (coords.nbytes + base.nbytes) / 1e6
+    return result, stats
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--box", nargs=3, type=float, default=[150.0, 150.0, 120.0],
+                        help="Box edge lengths (Å, default: 150 150 120).")
+    parser.add_argument("--resolution", type=float, default=0.5,
+                        help="Base grid spacing (Å, default: 0.5).")
+    parser.add_argument("--dofs", type=float, default=2e6,
+                        help="Conductivity DOFs (default: 2M).")
+    parser.add_argument("--atoms", type=int, default=5000,
+                        help="Analyte atoms near the pore (default: 5000).")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    bulk = 11.2
+    rng = np.random.default_rng(1)
+    atoms = (rng.random((args.atoms, 3)) - 0.5) * 30.0
+    radii = rng.uniform(1.2, 2.0, args.atoms)
+
+    tracemalloc.start()
+    results = {}
+    print(f"{'precision':>9} {'grid MB':>8} {'DOF MB':>7} {'meshgrid':>13} {'pore grid':>13} "
+          f"{'interpolate':>13} {'update':>13}")
+    for precision in ("double", "single"):
+        results[precision], stats = run(precision, args.box, args.resolution, int(args.dofs),
+                                        atoms, radii, bulk)
+        cells = "".join(f" {stats[k]:>6.2f}s/{stats[k + '_mb']:>5.0f}MB"
+                        for k in ("meshgrid", "pore_grid", "interpolate", "update"))
+        print(f"{precision:>9} {stats['grid_mb']:>8.0f} {stats['dof_mb']:>7.0f}{cells}")
+    tracemalloc.stop()
+
+    diff = np.abs(results["single"].astype(float) - results["double"]) / bulk
+    print(f"Max |single - double| / bulk conductivity: {diff.max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
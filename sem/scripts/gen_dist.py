@@ -3,115 +3,127 @@
 Python implementation of gen_dist for generating distance fields from XYZ files.
 Equivalent to the C version for cross-platform compatibility.
 
-Usage: python gen_dist.py <xyz_file> <MinX> <MinY> <MinZ> <MaxX> <MaxY> <MaxZ> <Resolution> <cutoff> <OutputFile>
+Usage: python gen_dist.py <xyz_file> <MinX> <MinY> <MinZ> <MaxX> <MaxY> <MaxZ> <Resolution> <cutoff> <OutputFile> [NumThreads]
+
+The field is computed by a prange-parallel numba kernel on NumThreads
+threads (default: all, see NUMBA_NUM_THREADS). Compiled kernels are cached
+on disk, so only the first run pays for JIT compilation.
 """
 
+import io
+import os
 import sys
+import warnings
 import numpy as np
-import time
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
-import multiprocessing
-from numba import jit, prange, types
-from numba.typed import List
 
-class Atom:
-    """Atom structure - kept as simple Python class for interface compatibility"""
-    def __init__(self, x, y, z, radius):
-        self.x = float(x)
-        self.y = float(y) 
-        self.z = float(z)
-        self.radius = float(radius)
-        self.hVal = 0
+# numba's on-disk cache records the module name, so kernels compiled when this
+# file runs as a script cannot be loaded as sem.scripts.gen_dist and vice
+# versa. Script runs keep their own cache directory.
+if __name__ == "__main__":
+    os.environ["NUMBA_CACHE_DIR"] = str(
+        Path(os.environ.get("NUMBA_CACHE_DIR") or Path(__file__).resolve().parent / "__pycache__")
+        / "gen_dist_script"
+    )
+
+import numba
+from numba import jit, prange
 
-# Numba-compiled functions for critical path optimization
-@jit(nopython=True, fastmath=False, parallel=False)
-def compute_cell_index(x, y, z, cell_size, cell_num_x, cell_num_y, cell_num_z):
-    """Compute cell index - exact same logic as original, but compiled"""
-    cell_x = min(int(x / cell_size), cell_num_x - 1)
-    cell_y = min(int(y / cell_size), cell_num_y - 1) 
-    cell_z = min(int(z / cell_size), cell_num_z - 1)
+@jit(nopython=True, fastmath=False, cache=True)
+def compute_point_distance_numba(
+    grid_coord_x, grid_coord_y, grid_coord_z, cutoff,
+    cell_size, cell_num_x, cell_num_y, cell_num_z, SEARCH_LENGTH,
+    atom_positions, atom_radii, cell_starts, cell_ends
+):
+    """Distance from one grid point to the nearest atom surface - exact same logic as original"""
+    # Exact same cell calculation logic as original
+    cell_loc_z = min(int(grid_coord_z / cell_size), cell_num_z - 1)
+    cell_loc_z = max(0, cell_loc_z)
+    start_z = max(0, cell_loc_z - SEARCH_LENGTH)
+    end_z = min(cell_num_z, cell_loc_z + SEARCH_LENGTH + 1)
+    
+    cell_loc_y = min(int(grid_coord_y / cell_size), cell_num_y - 1)
+    cell_loc_y = max(0, cell_loc_y)
+    start_y = max(0, cell_loc_y - SEARCH_LENGTH)
+    end_y = min(cell_num_y, cell_loc_y + SEARCH_LENGTH + 1)
+    
+    cell_loc_x = min(int(grid_coord_x / cell_size), cell_num_x - 1)
+    cell_loc_x = max(0, cell_loc_x)
+    start_x = max(0, cell_loc_x - SEARCH_LENGTH)
+    end_x = min(cell_num_x, cell_loc_x + SEARCH_LENGTH + 1)
+    
+    min_dist = cutoff
     
-    cell_x = max(0, cell_x)
-    cell_y = max(0, cell_y)
-    cell_z = max(0, cell_z)
+    # Triple nested loop - exact same as original
+    for z in range(start_z, end_z):
+        for y in range(start_y, end_y):
+            for x in range(start_x, end_x):
+                # Same hash calculation
+                cell_hash = x + cell_num_x * y + cell_num_x * cell_num_y * z
+                
+                # Check if this cell has atoms
+                if cell_hash < len(cell_starts) and cell_starts[cell_hash] >= 0:
+                    start_atom = cell_starts[cell_hash]
+                    end_atom = cell_ends[cell_hash]
+                    
+                    # Check each atom in cell - exact same calculation
+                    for atom_idx in range(start_atom, end_atom):
+                        atom_x = atom_positions[atom_idx, 0]
+                        atom_y = atom_positions[atom_idx, 1]
+                        atom_z = atom_positions[atom_idx, 2]
+                        atom_radius = atom_radii[atom_idx]
+                        
+                        # Exact same distance calculation
+                        dx = atom_x - grid_coord_x
+                        dy = atom_y - grid_coord_y
+                        dz = atom_z - grid_coord_z
+                        
+                        dist_to_center = np.sqrt(dx*dx + dy*dy + dz*dz)
+                        dist_to_surface = dist_to_center - atom_radius
+                        
+                        if dist_to_surface < min_dist:
+                            min_dist = dist_to_surface
     
-    return cell_x + cell_num_x * cell_y + cell_num_x * cell_num_y * cell_z
+    # Exact same clamping as original
+    return max(min_dist, 0.0)
 
-@jit(nopython=True, fastmath=False)
-def compute_distance_slice_numba(
-    grid_point_num_x, grid_point_num_y, resolution, cutoff,
+@jit(nopython=True, nogil=True, fastmath=False, parallel=True, cache=True)
+def compute_distance_field_numba(
+    grid_point_num_x, grid_point_num_y, grid_point_num_z, resolution, cutoff,
     cell_size, cell_num_x, cell_num_y, cell_num_z, SEARCH_LENGTH,
-    z_start, z_end,
-    atom_positions, atom_radii, atom_hash_values, cell_starts, cell_ends
+    atom_positions, atom_radii, cell_starts, cell_ends
 ):
     """
-    Numba-compiled slice computation that maintains EXACT same logic as original.
-    No approximations or algorithmic changes - just compiled for speed.
+    Whole distance field on numba's thread pool, indexed [z, y, x].
+    Each (z, y) grid row is independent, so rows are split across threads
+    and the values do not depend on the thread count.
     """
-    slice_size = z_end - z_start
-    result = np.full((slice_size, grid_point_num_y, grid_point_num_x), cutoff, dtype=np.float32)
+    result = np.empty((grid_point_num_z, grid_point_num_y, grid_point_num_x), dtype=np.float32)
     
-    for grid_z_idx in range(z_start, z_end):
+    for row in prange(grid_point_num_z * grid_point_num_y):
+        grid_z_idx = row // grid_point_num_y
+        grid_y_idx = row % grid_point_num_y
         grid_coord_z = grid_z_idx * resolution
-        
-        # Exact same cell calculation logic as original
-        cell_loc_z = min(int(grid_coord_z / cell_size), cell_num_z - 1)
-        cell_loc_z = max(0, cell_loc_z)
-        start_z = max(0, cell_loc_z - SEARCH_LENGTH)
-        end_z = min(cell_num_z, cell_loc_z + SEARCH_LENGTH + 1)
-        
-        for grid_y_idx in range(grid_point_num_y):
-            grid_coord_y = grid_y_idx * resolution
-            cell_loc_y = min(int(grid_coord_y / cell_size), cell_num_y - 1)
-            cell_loc_y = max(0, cell_loc_y)
-            start_y = max(0, cell_loc_y - SEARCH_LENGTH)
-            end_y = min(cell_num_y, cell_loc_y + SEARCH_LENGTH + 1)
-            
-            for grid_x_idx in range(grid_point_num_x):
-                grid_coord_x = grid_x_idx * resolution
-                cell_loc_x = min(int(grid_coord_x / cell_size), cell_num_x - 1)
-                cell_loc_x = max(0, cell_loc_x)
-                start_x = max(0, cell_loc_x - SEARCH_LENGTH)
-                end_x = min(cell_num_x, cell_loc_x + SEARCH_LENGTH + 1)
-                
-                min_dist = cutoff
-                
-                # Triple nested loop - exact same as original
-                for z in range(start_z, end_z):
-                    for y in range(start_y, end_y):
-                        for x in range(start_x, end_x):
-                            # Same hash calculation
-                            cell_hash = x + cell_num_x * y + cell_num_x * cell_num_y * z
-                            
-                            # Check if this cell has atoms
-                            if cell_hash < len(cell_starts) and cell_starts[cell_hash] >= 0:
-                                start_atom = cell_starts[cell_hash]
-                                end_atom = cell_ends[cell_hash]
-                                
-                                # Check each atom in cell - exact same calculation
-                                for atom_idx in range(start_atom, end_atom):
-                                    atom_x = atom_positions[atom_idx, 0]
-                                    atom_y = atom_positions[atom_idx, 1]
-                                    atom_z = atom_positions[atom_idx, 2]
-                                    atom_radius = atom_radii[atom_idx]
-                                    
-                                    # Exact same distance calculation
-                                    dx = atom_x - grid_coord_x
-                                    dy = atom_y - grid_coord_y
-                                    dz = atom_z - grid_coord_z
-                                    
-                                    dist_to_center = np.sqrt(dx*dx + dy*dy + dz*dz)
-                                    dist_to_surface = dist_to_center - atom_radius
-                                    
-                                    if dist_to_surface < min_dist:
-                                        min_dist = dist_to_surface
-                
-                # Store result - exact same logic
-                result[grid_z_idx - z_start, grid_y_idx, grid_x_idx] = max(min_dist, 0.0)
+        grid_coord_y = grid_y_idx * resolution
+        for grid_x_idx in range(grid_point_num_x):
+            grid_coord_x = grid_x_idx * resolution
+            result[grid_z_idx, grid_y_idx, grid_x_idx] = compute_point_distance_numba(
+                grid_coord_x, grid_coord_y, grid_coord_z, cutoff,
+                cell_size, cell_num_x, cell_num_y, cell_num_z, SEARCH_LENGTH,
+                atom_positions, atom_radii, cell_starts, cell_ends
+            )
     
     return result
 
+def resolve_num_threads(num_threads=None):
+    """
+    Number of numba threads to use: all available by default, otherwise
+    num_threads capped at numba's thread-pool size (NUMBA_NUM_THREADS).
+    """
+    if num_threads is None:
+        return numba.config.NUMBA_NUM_THREADS
+    return max(1, min(int(num_threads), numba.config.NUMBA_NUM_THREADS))
+
 class PrecisionOptimizedGenerator:
     """
     Optimized generator that maintains exact mathematical precision.
@@ -139,158 +151,134 @@ class PrecisionOptimizedGenerator:
         # Minimal output like original
         pass
     
-    def _convert_to_numba_format(self, atoms):
-        """Convert atoms to numba-friendly arrays while preserving exact data"""
-        n_atoms = len(atoms)
-        
-        # Pre-allocate arrays
-        atom_positions = np.zeros((n_atoms, 3), dtype=np.float64)  # Use float64 for precision
-        atom_radii = np.zeros(n_atoms, dtype=np.float64)
-        atom_hash_values = np.zeros(n_atoms, dtype=np.int32)
-        
-        # Fill arrays with exact same data
-        for i, atom in enumerate(atoms):
-            atom_positions[i, 0] = atom.x
-            atom_positions[i, 1] = atom.y
-            atom_positions[i, 2] = atom.z
-            atom_radii[i] = atom.radius
-            atom_hash_values[i] = atom.hVal
-        
-        return atom_positions, atom_radii, atom_hash_values
-    
-    def _setup_spatial_hash_optimized(self, atoms):
-        """Optimized spatial hash setup maintaining exact same logic"""
-        # Minimal output - no debug prints
-        
-        # Assign hash values - exact same logic as original
-        for atom in atoms:
-            atom.hVal = compute_cell_index(
-                atom.x, atom.y, atom.z, self.cell_size, 
-                self.cell_num_x, self.cell_num_y, self.cell_num_z
-            )
+    def _setup_spatial_hash(self, positions, radii):
+        """
+        Spatial hash of translated atom arrays - exact same cells and atom
+        order as the original per-atom hashing, vectorized.
         
-        # Sort by hash value - exact same as original
-        atoms.sort(key=lambda a: a.hVal)
+        Returns:
+            (atom_positions, atom_radii, cell_starts, cell_ends): atoms sorted
+            by cell hash, and for every cell the [start, end) range of its
+            atoms (-1 for empty cells)
+        """
+        cell_num = np.array([self.cell_num_x, self.cell_num_y, self.cell_num_z])
         
-        # Convert to numba format after sorting
-        atom_positions, atom_radii, atom_hash_values = self._convert_to_numba_format(atoms)
+        # Same cell index as the original: truncate, then clamp into the grid
+        cells = np.maximum(np.minimum((positions / self.cell_size).astype(np.int64), cell_num - 1), 0)
+        hashes = cells[:, 0] + cell_num[0] * cells[:, 1] + cell_num[0] * cell_num[1] * cells[:, 2]
         
-        # Create cell lookup tables
-        max_hash = self.cell_num_x * self.cell_num_y * self.cell_num_z
-        cell_starts = np.full(max_hash, -1, dtype=np.int32)
-        cell_ends = np.full(max_hash, -1, dtype=np.int32)
+        # Stable sort keeps file order within a cell, like the original list sort
+        order = np.argsort(hashes, kind="stable")
+        sorted_hashes = hashes[order]
         
-        if len(atoms) > 0:
-            current_hash = atom_hash_values[0]
-            start_idx = 0
-            
-            for i in range(len(atoms)):
-                if atom_hash_values[i] != current_hash:
-                    cell_starts[current_hash] = start_idx
-                    cell_ends[current_hash] = i
-                    current_hash = atom_hash_values[i]
-                    start_idx = i
-            
-            # Handle last group
-            cell_starts[current_hash] = start_idx
-            cell_ends[current_hash] = len(atoms)
+        # Cell lookup tables from the sorted hashes
+        all_cells = np.arange(self.cell_num_x * self.cell_num_y * self.cell_num_z)
+        cell_starts = np.searchsorted(sorted_hashes, all_cells, side="left").astype(np.int32)
+        cell_ends = np.searchsorted(sorted_hashes, all_cells, side="right").astype(np.int32)
+        empty = cell_starts == cell_ends
+        cell_starts[empty] = -1
+        cell_ends[empty] = -1
         
+        atom_positions = np.ascontiguousarray(positions[order], dtype=np.float64)
+        atom_radii = np.ascontiguousarray(radii[order], dtype=np.float64)
         return atom_positions, atom_radii, cell_starts, cell_ends
     
-    def _compute_distance_slice_optimized(self, atom_data, z_start, z_end):
-        """Optimized slice computation maintaining exact precision"""
-        atom_positions, atom_radii, cell_starts, cell_ends = atom_data
+    def generate_distance_field(self, positions, radii, num_threads=None):
+        """
+        Generate distance field with speed optimization but exact precision
         
-        return compute_distance_slice_numba(
-            self.grid_point_num_x, self.grid_point_num_y, self.resolution, self.cutoff,
-            self.cell_size, self.cell_num_x, self.cell_num_y, self.cell_num_z, self.SEARCH_LENGTH,
-            z_start, z_end,
-            atom_positions, atom_radii, np.arange(len(atom_radii)), cell_starts, cell_ends
+        Args:
+            positions: Mx3 atom positions, translated to the box origin
+            radii: M atom radii
+            num_threads: Kernel threads (default: all numba threads)
+            
+        Returns:
+            float32 distance field indexed [z, y, x]
+        """
+        atom_data = self._setup_spatial_hash(
+            np.asarray(positions, dtype=np.float64), np.asarray(radii, dtype=np.float64)
         )
+        return self._generate_from_hash(atom_data, num_threads)
     
-    def generate_distance_field(self, atoms, num_threads=None):
-        """Generate distance field with speed optimization but exact precision"""
-        if num_threads is None:
-            num_threads = min(12, multiprocessing.cpu_count())  # Use more threads
-        
-        # Setup spatial hash with optimization
-        atom_data = self._setup_spatial_hash_optimized(atoms)
-        
-        # Use more aggressive chunking for better parallelization
-        chunk_size = max(2, self.grid_point_num_z // (num_threads * 3))
-        chunks = []
-        for i in range(0, self.grid_point_num_z, chunk_size):
-            chunks.append((i, min(i + chunk_size, self.grid_point_num_z)))
+    def _generate_from_hash(self, atom_data, num_threads=None):
+        atom_positions, atom_radii, cell_starts, cell_ends = atom_data
         
-        start_time = time.time()
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
-            futures = []
-            for z_start, z_end in chunks:
-                future = executor.submit(self._compute_distance_slice_optimized, atom_data, z_start, z_end)
-                futures.append((future, z_start, z_end))
-            
-            # Pre-allocate result array
-            distance_field = np.zeros((self.grid_point_num_z, self.grid_point_num_y, self.grid_point_num_x), 
-                                    dtype=np.float32)
-            
-            # Collect results efficiently
-            for future, z_start, z_end in futures:
-                result = future.result()
-                distance_field[z_start:z_end] = result
+        # Rows of the grid are shared out by numba's prange over num_threads threads
+        previous_threads = numba.get_num_threads()
+        numba.set_num_threads(resolve_num_threads(num_threads))
+        try:
+            distance_field = compute_distance_field_numba(
+                self.grid_point_num_x, self.grid_point_num_y, self.grid_point_num_z,
+                self.resolution, self.cutoff,
+                self.cell_size, self.cell_num_x, self.cell_num_y, self.cell_num_z, self.SEARCH_LENGTH,
+                atom_positions, atom_radii, cell_starts, cell_ends
+            )
+        finally:
+            numba.set_num_threads(previous_threads)
         
         return distance_field
 
-# Keep all the existing I/O functions exactly the same
+# I/O functions - same file formats and atom rules as the original, on arrays
+def _parse_xyz(filename):
+    """x, y, z and radius columns of an XYZ file as an Mx4 float64 array"""
+    with open(filename, 'r') as f:
+        text = f.read()
+    
+    # Fast path: whole-file parse when every line is plain numeric data
+    if '#' not in text:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)  # empty input
+                return np.loadtxt(io.StringIO(text), usecols=(0, 1, 2, 3), ndmin=2, dtype=np.float64)
+        except ValueError:
+            pass
+    
+    # Comments, short or unparsable lines: same per-line rules as the original
+    rows = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        parts = line.split()
+        if len(parts) >= 4:
+            try:
+                rows.append([float(v) for v in parts[:4]])
+            except ValueError:
+                continue
+    return np.array(rows, dtype=np.float64).reshape(-1, 4)
+
+def select_box_atoms(positions, radii, x_lower, y_lower, z_lower, x_upper, y_upper, z_upper):
+    """
+    Atoms gen_dist keeps: not above the upper corner and strictly above the
+    lower one (lower < p <= upper on every axis)
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), positions.shape[:1])
+    lower = np.array([x_lower, y_lower, z_lower], dtype=np.float64)
+    upper = np.array([x_upper, y_upper, z_upper], dtype=np.float64)
+    
+    keep = np.all(positions <= upper, axis=1) & np.all(positions - lower > 0, axis=1)
+    return positions[keep], radii[keep]
+
 def load_xyz_atoms(filename, x_lower, y_lower, z_lower, x_upper, y_upper, z_upper):
-    """Load atoms - exact same logic as original"""
-    atoms = []
+    """
+    Load atoms - exact same logic as original
     
+    Returns:
+        (positions, radii): Mx3 positions and M radii of the atoms in the box
+    """
     try:
-        with open(filename, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                try:
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        x, y, z, r = map(float, parts[:4])
-                        
-                        if x > x_upper or y > y_upper or z > z_upper:
-                            continue
-                        
-                        translated_x = x - x_lower
-                        translated_y = y - y_lower  
-                        translated_z = z - z_lower
-                        
-                        if translated_x > 0 and translated_y > 0 and translated_z > 0:
-                            atom = Atom(x, y, z, r)
-                            atoms.append(atom)
-                            
-                except ValueError as e:
-                    continue
-    
+        data = _parse_xyz(filename)
     except FileNotFoundError:
         print(f"ERROR: Cannot open file {filename}")
         sys.exit(1)
     
-    return atoms
+    return select_box_atoms(data[:, :3], data[:, 3], x_lower, y_lower, z_lower,
+                            x_upper, y_upper, z_upper)
 
-def apply_translation(atoms, x_lower, y_lower, z_lower):
+def apply_translation(positions, x_lower, y_lower, z_lower):
     """Apply translation - exact same logic as original"""
-    translated_atoms = []
-    
-    for atom in atoms:
-        new_atom = Atom(
-            atom.x - x_lower,
-            atom.y - y_lower,
-            atom.z - z_lower,
-            atom.radius
-        )
-        translated_atoms.append(new_atom)
-    
-    return translated_atoms
+    return positions - np.array([x_lower, y_lower, z_lower], dtype=np.float64)
 
 def write_binary_file(distance_field, origin, resolution, filename):
     """Write binary file - exact same format as original"""
@@ -307,14 +295,37 @@ def write_binary_file(distance_field, origin, resolution, filename):
             f.write(np.array(origin, dtype=np.float32).tobytes())
             f.write(np.array([resolution], dtype=np.float32).tobytes())
             
-            for z in range(grid_shape[0]):
-                slice_data = distance_field[z, :, :].astype(np.float32)
-                f.write(slice_data.tobytes())
+            # z slices one after another, each [y, x] in C order
+            f.write(np.ascontiguousarray(distance_field, dtype=np.float32).tobytes())
         
     except Exception as e:
         print(f"ERROR: Failed to write {filename}: {e}")
         sys.exit(1)
 
+def compute_distance_field(positions, radii, x_lower, y_lower, z_lower,
+                           x_upper, y_upper, z_upper, resolution, cutoff, *, num_threads=None):
+    """
+    In-process equivalent of generate_binary_distance_field for atom arrays.
+
+    Applies the same atom filter and translation as load_xyz_atoms and
+    apply_translation, runs the same kernels and returns the distance field
+    that would be written to the binary file, indexed [z, y, x], without
+    touching disk.
+    """
+    positions, radii = select_box_atoms(positions, radii, x_lower, y_lower, z_lower,
+                                        x_upper, y_upper, z_upper)
+    if positions.shape[0] == 0:
+        raise ValueError("No atoms inside the distance-field box")
+    
+    box_x = x_upper - x_lower
+    box_y = y_upper - y_lower
+    box_z = z_upper - z_lower
+    generator = PrecisionOptimizedGenerator(resolution, cutoff + 2, box_x, box_y, box_z)
+    distance_field = generator.generate_distance_field(
+        apply_translation(positions, x_lower, y_lower, z_lower), radii, num_threads=num_threads
+    )
+    return np.minimum(distance_field, cutoff)
+
 def generate_binary_distance_field(
     xyz_file,
     x_lower,
@@ -340,15 +351,15 @@ def generate_binary_distance_field(
     box_y = y_upper - y_lower
     box_z = z_upper - z_lower
 
-    atoms = load_xyz_atoms(xyz_file, x_lower, y_lower, z_lower, x_upper, y_upper, z_upper)
+    positions, radii = load_xyz_atoms(xyz_file, x_lower, y_lower, z_lower, x_upper, y_upper, z_upper)
 
-    if not atoms:
+    if positions.shape[0] == 0:
         raise ValueError(f"No atoms loaded from {xyz_file}")
     
-    translated_atoms = apply_translation(atoms, x_lower, y_lower, z_lower)
+    translated_positions = apply_translation(positions, x_lower, y_lower, z_lower)
     
     generator = PrecisionOptimizedGenerator(resolution, cutoff + 2, box_x, box_y, box_z)
-    distance_field = generator.generate_distance_field(translated_atoms, num_threads=num_threads)
+    distance_field = generator.generate_distance_field(translated_positions, radii, num_threads=num_threads)
     
     distance_field = np.minimum(distance_field, cutoff)
     
@@ -373,8 +384,8 @@ def generate_binary_distance_field(
 
 def main():
     """Main function - minimal output like original"""
-    if len(sys.argv) != 11:
-        print("Usage: python precision_optimized_gen_dist.py <xyz_file> <MinX> <MinY> <MinZ> <MaxX> <MaxY> <MaxZ> <Resolution> <cutoff> <OutputFile>")
+    if len(sys.argv) not in (11, 12):
+        print("Usage: python precision_optimized_gen_dist.py <xyz_file> <MinX> <MinY> <MinZ> <MaxX> <MaxY> <MaxZ> <Resolution> <cutoff> <OutputFile> [NumThreads]")
         sys.exit(1)
     
     xyz_file = sys.argv[1]
@@ -387,6 +398,7 @@ def main():
     resolution = float(sys.argv[8])
     cutoff = float(sys.argv[9])
     output_file = sys.argv[10]
+    num_threads = int(sys.argv[11]) if len(sys.argv) == 12 else None
     
     try:
         generate_binary_distance_field(
@@ -400,6 +412,7 @@ def main():
             resolution,
             cutoff,
             output_file,
+            num_threads=num_threads,
         )
     except ValueError as exc:
         print(f"ERROR: {exc}")
@@ -19,9 +19,6 @@ import sys
 import numpy as np
 import logging
 
-# Set up logging to suppress some MDAnalysis warnings but keep important info
-logging.basicConfig(level=logging.WARNING)
-
 try:
     import MDAnalysis as mda
     from MDAnalysis.core.selection import SelectionError
@@ -43,6 +40,31 @@ except ImportError:
             print("Make sure van_der_waals.py is available or install the sem package")
             sys.exit(1)
 
+# Common water residue names: HOH, WAT, TIP3, SOL
+# Common ion names: NA, CL, K, MG, CA, ZN, etc.
+PORE_SELECTION = (
+    "not (resname HOH or resname WAT or resname TIP3 or resname SOL or "
+    "resname NA or resname CL or resname K or resname MG or resname CA or "
+    "resname ZN or resname FE or resname BR or resname I)"
+)
+
+def select_pore_atoms(universe):
+    """
+    Select pore atoms, excluding water and ions
+    
+    Args:
+        universe: MDAnalysis Universe of the pore
+        
+    Returns:
+        MDAnalysis atom selection
+    """
+    try:
+        return universe.select_atoms(PORE_SELECTION)
+    except SelectionError:
+        print("Warning: Selection failed, trying simpler selection...")
+        # Fallback to protein selection if the above fails
+        return universe.select_atoms("protein")
+
 def extract_pore_coordinates(pdb_file, output_file="pore.xyz"):
     """
     Extract coordinates and radius from PDB file, excluding water and ions
@@ -60,20 +82,7 @@ def extract_pore_coordinates(pdb_file, output_file="pore.xyz"):
         u = mda.Universe(pdb_file)
         
         # Select atoms excluding water and ions
-        # Common water residue names: HOH, WAT, TIP3, SOL
-        # Common ion names: NA, CL, K, MG, CA, ZN, etc.
-        selection_string = (
-            "not (resname HOH or resname WAT or resname TIP3 or resname SOL or "
-            "resname NA or resname CL or resname K or resname MG or resname CA or "
-            "resname ZN or resname FE or resname BR or resname I)"
-        )
-        
-        try:
-            sel_pore = u.select_atoms(selection_string)
-        except SelectionError:
-            print("Warning: Selection failed, trying simpler selection...")
-            # Fallback to protein selection if the above fails
-            sel_pore = u.select_atoms("protein")
+        sel_pore = select_pore_atoms(u)
         
         num_atoms = len(sel_pore)
         print(f"Pore atoms: {num_atoms}")
@@ -158,6 +167,9 @@ def write_output(coordinates, radius, output_file):
 def main():
     """Main function to handle command line arguments"""
     
+    # Set up logging to suppress some MDAnalysis warnings but keep important info
+    logging.basicConfig(level=logging.WARNING)
+    
     if len(sys.argv) < 2:
         print("Usage: python pdb2xyz.py pore.pdb [output.xyz]")
         print("Example: python pdb2xyz.py protein.pdb protein.xyz")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Check the in-process distance engines against the gen_dist subprocess.
+
+The script runs ``gen_dist.py`` in a subprocess on an XYZ file and reads
+its ``.bin`` output with ``readbinGrid``. It then computes the same field
+with each engine of ``sem.distance_field.compute_distance_field``, using
+atoms read from the same XYZ file. It reports grid shapes, extents, the
+largest value difference and timings. The exit status is non-zero if any
+engine differs by more than ``--atol``.
+
+Without ``--xyz`` a synthetic pore is used: a barrel of atoms with
+element-like radii and a membrane slab. Several box/resolution/cutoff cases
+are checked, including an asymmetric box.
+
+Example:
+    python -m sem.scripts.verify_distance_engines
+    python -m sem.scripts.verify_distance_engines --xyz 7ahl.xyz --box -60 60 -60 60 -80 40 --resolution 1.0
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+try:
+    from ..distance_field import compute_distance_field
+    from ..utils import readbinGrid
+except ImportError:  # pragma: no cover - relative import fallback
+    from sem.distance_field import compute_distance_field
+    from sem.utils import readbinGrid
+
+GEN_DIST = Path(__file__).with_name("gen_dist.py")
+
+# (x_min, x_max, y_min, y_max, z_min, z_max), resolution, cutoff
+_DEFAULT_CASES = [
+    ((-30.0, 30.0, -30.0, 30.0, -30.0, 30.0), 1.0, 5.0),
+    ((-25.0, 35.0, -30.0, 28.0, -40.0, 22.0), 0.7, 4.1),
+    ((-20.0, 20.0, -20.0, 20.0, -15.0, 15.0), 0.5, 3.0),
+]
+
+
+def synthetic_pore_xyz(path, seed=0):
+    """Write a barrel with a membrane slab as ``x y z radius`` rows."""
+    rng = np.random.default_rng(seed)
+    n = 6000
+    theta = rng.random(n) * 2 * np.pi
+    radius = rng.uniform(8.0, 16.0, n)
+    barrel = np.column_stack([radius * np.cos(theta), radius * np.sin(theta),
+                              rng.uniform(-25.0, 25.0, n)])
+    slab = rng.uniform(-35.0, 35.0, (4000, 3))
+    slab[:, 2] = rng.uniform(-8.0, 8.0, 4000)
+    slab = slab[np.hypot(slab[:, 0], slab[:, 1]) > 17.0]
+    atoms = np.vstack([barrel, slab])
+    radii = rng.choice([1.1, 1.55, 1.7, 1.52, 1.8], atoms.shape[0])
+    np.savetxt(path, np.column_stack([atoms, radii]), fmt="%.3f")
+
+
+def run_gen_dist(xyz_file, bounds, resolution, cutoff, workdir):
+    x_min, x_max, y_min, y_max, z_min, z_max = bounds
+    bin_file = Path(workdir) / "field.bin"
+    cmd = [sys.executable, str(GEN_DIST), str(xyz_file),
+           str(x_max), str(y_max), str(z_max), str(x_min), str(y_min), str(z_min),
+           str(resolution), str(cutoff), str(bin_file)]
+    start = time.perf_counter()
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"gen_dist.py failed: {result.stderr}")
+    val3d, extents, counts = readbinGrid(str(bin_file), mask_radius=-1)
+    return val3d, extents, counts, elapsed
+
+
+def check_case(xyz_file, bounds, resolution, cutoff, atol, workdir):
+    data = np.loadtxt(xyz_file, ndmin=2)
+    positions, radii = data[:, :3], data[:, 3]
+    x_min, x_max, y_min, y_max, z_min, z_max = bounds
+    reference, ref_extents, ref_counts, t_ref = run_gen_dist(
+        xyz_file, bounds, resolution, cutoff, workdir)
+    print(f"box {bounds} res {resolution} cutoff {cutoff}: grid {tuple(ref_counts)}, "
+          f"gen_dist subprocess {t_ref:.2f} s")
+
+    ok = True
+    for engine in ("kdtree", "numba"):
+        start = time.perf_counter()
+        val3d, extents, counts = compute_distance_field(
+            positions, radii, (x_min, y_min, z_min), (x_max, y_max, z_max),
+            resolution, cutoff, engine=engine)
+        elapsed = time.perf_counter() - start
+        same_grid = list(counts) == list(ref_counts) and np.allclose(extents, ref_extents)
+        diff = float(np.max(np.abs(val3d - reference))) if same_grid else np.inf
+        passed = same_grid and diff <= atol
+        ok &= passed
+        print(f"  {engine:>7}: {elapsed:6.2f} s, max |diff| {diff:.2e} "
+              f"{'OK' if passed else 'MISMATCH'}")
+    return ok
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--xyz", default=None,
+                        help="XYZ file with x y z radius rows (default: synthetic pore).")
+    parser.add_argument("--box", nargs=6, type=float, default=None,
+                        metavar=("XMIN", "XMAX", "YMIN", "YMAX", "ZMIN", "ZMAX"),
+                        help="Box bounds for a single case (default: built-in cases).")
+    parser.add_argument("--resolution", type=float, default=1.0,
+                        help="Grid spacing with --box (Å, default: 1.0).")
+    parser.add_argument("--cutoff", type=float, default=5.0,
+                        help="Distance cutoff with --box (Å, default: 5.0).")
+    parser.add_argument("--atol", type=float, default=1e-5,
+                        help="Allowed absolute difference (Å, default: 1e-5).")
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    cases = ([(tuple(args.box), args.resolution, args.cutoff)] if args.box
+             else _DEFAULT_CASES)
+    with tempfile.TemporaryDirectory() as workdir:
+        xyz_file = args.xyz
+        if xyz_file is None:
+            xyz_file = Path(workdir) / "synthetic_pore.xyz"
+            synthetic_pore_xyz(xyz_file)
+        ok = all([check_case(xyz_file, bounds, res, cutoff, args.atol, workdir)
+                  for bounds, res, cutoff in cases])
+    if not ok:
+        raise SystemExit("Distance engines disagree with gen_dist")
+    print("All engines match gen_dist.")
+
+
+if __name__ == "__main__":
+    main()
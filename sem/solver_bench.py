@@ -0,0 +1,221 @@
+"""
+Benchmark linear solver presets on a configured SEM problem.
+
+Each preset from ``fem_solver.SOLVER_PRESETS`` is timed on the open-pore
+problem and on the first analyte position of the trace. The preset's options
+are applied on top of the configured ``petsc_options``, so unrelated user
+options (monitors, AMG tuning, ...) stay in effect. Presets with a diverged
+solve or whose currents disagree with the reference preset are rejected, and
+the fastest remaining preset can be written back to the configuration file.
+
+``benchmark_current_evaluators`` compares the surface-flux, residual and
+energy current evaluators on the same solutions.
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .fem_solver import CURRENT_EVALUATORS, DEFAULT_SOLVER_PRESET, SOLVER_PRESETS
+
+logger = logging.getLogger(__name__)
+
+
+def _timed_solve(sem, conductivity):
+    """
+    Solve from a zero initial guess.
+
+    Returns:
+        (current, seconds, iterations, converged reason)
+    """
+    start = time.time()
+    current = sem.solve_for_current(conductivity=conductivity, warm_start=False, stop_on_current=False)
+    elapsed = time.time() - start
+    return current, elapsed, sem.fem_solver.last_iterations, sem.fem_solver.last_converged_reason
+
+
+def _preset_options(preset, petsc_options=None):
+    """
+    PETSc options for benchmarking ``preset`` under a user configuration.
+
+    Args:
+        preset: Name from ``fem_solver.SOLVER_PRESETS``
+        petsc_options: The configured ``simulation.solver.petsc_options``
+
+    Returns:
+        The user's options with the preset's entries on top
+    """
+    if preset not in SOLVER_PRESETS:
+        raise ValueError(
+            f"Unknown solver preset '{preset}'. Available: {', '.join(SOLVER_PRESETS)}"
+        )
+    options = dict(petsc_options or {})
+    options.update(SOLVER_PRESETS[preset])
+    return options
+
+
+def benchmark_solver_presets(sem, presets: Optional[Iterable[str]] = None,
+                             rtol: float = 1e-6):
+    """
+    Time solver presets on the open-pore problem and the first analyte position.
+
+    Args:
+        sem: Configured ``VerticalMovementSEM`` instance
+        presets: Preset names to compare (default: all presets)
+        rtol: Relative current tolerance against the reference preset
+
+    Returns:
+        results: List of dicts (one per preset) with timings, iterations,
+            currents and an ``ok`` flag
+    """
+    presets = list(presets) if presets else list(SOLVER_PRESETS)
+    z_first = sem.z_start
+    sem._maybe_rebuild_mesh_for_position(z_first)
+
+    # Conductivity fields are computed once; only the solve is timed.
+    sem._load_base_conductivity()
+    open_conductivity = sem.sig.x.array.copy()
+    sem.get_conductivity_at_position(z_first)
+    position_conductivity = sem.sig.x.array.copy()
+
+    original_preset = sem.solver_config.get("preset")
+    original_options = sem.solver_config.get("petsc_options")
+
+    results = []
+    reference = None
+    for preset in presets:
+        entry = {"preset": preset, "ok": False}
+        try:
+            setup_start = time.time()
+            sem.set_solver_preset(preset, _preset_options(preset, original_options))
+            entry["setup_time"] = time.time() - setup_start
+
+            open_current, open_time, open_its, open_reason = _timed_solve(sem, open_conductivity)
+            pos_current, pos_time, pos_its, pos_reason = _timed_solve(sem, position_conductivity)
+        except Exception as exc:
+            entry["error"] = str(exc)
+            if sem.rank == 0:
+                logger.warning("Solver preset '%s' failed: %s", preset, exc)
+            results.append(entry)
+            continue
+
+        entry.update({
+            "open_pore_time": open_time,
+            "position_time": pos_time,
+            "total_time": entry["setup_time"] + open_time + pos_time,
+            "open_pore_iterations": open_its,
+            "position_iterations": pos_its,
+            "open_pore_current": open_current,
+            "position_current": pos_current,
+            "open_pore_reason": open_reason,
+            "position_reason": pos_reason,
+        })
+
+        # Both solves must converge; the deviation covers both currents.
+        converged = open_reason >= 0 and pos_reason >= 0
+        entry["converged"] = converged
+        if reference is None and converged:
+            reference = (open_current, pos_current)
+        if reference is not None:
+            deviation = max(
+                abs(open_current - reference[0]) / max(abs(reference[0]), 1e-300),
+                abs(pos_current - reference[1]) / max(abs(reference[1]), 1e-300),
+            )
+            entry["deviation"] = deviation
+            entry["ok"] = converged and deviation <= rtol
+        results.append(entry)
+
+        if sem.rank == 0:
+            logger.info(
+                "Preset %-13s setup %.3fs, open pore %.3fs (%d its), "
+                "first position %.3fs (%d its), deviation %.1e",
+                preset, entry["setup_time"], open_time, open_its,
+                pos_time, pos_its, entry.get("deviation", np.nan),
+            )
+
+    sem.set_solver_preset(original_preset or DEFAULT_SOLVER_PRESET, original_options)
+    return results
+
+
+def benchmark_current_evaluators(sem, repeats: int = 5):
+    """
+    Compare current evaluators on the open-pore and first-position solutions.
+
+    Args:
+        sem: Configured ``VerticalMovementSEM`` instance
+        repeats: Evaluations per timing (after a warm-up call that compiles the forms)
+
+    Returns:
+        results: List of dicts with evaluator, problem, current, relative
+            difference to the surface flux and seconds per evaluation
+    """
+    z_first = sem.z_start
+    sem._maybe_rebuild_mesh_for_position(z_first)
+
+    results = []
+    problems = [("open_pore", None), ("first_position", z_first)]
+    for problem, z_pos in problems:
+        if z_pos is None:
+            sem._load_base_conductivity()
+        else:
+            sem.get_conductivity_at_position(z_pos)
+        sem.solve_for_current(warm_start=False, stop_on_current=False)
+
+        surface = None
+        for evaluator in CURRENT_EVALUATORS:
+            sem.compute_current(evaluator)  # compile forms outside the timing
+            start = time.time()
+            for _ in range(repeats):
+                current = sem.compute_current(evaluator)
+            elapsed = (time.time() - start) / max(repeats, 1)
+            if evaluator == "surface":
+                surface = current
+            rel_diff = abs(current - surface) / max(abs(surface), 1e-300)
+            results.append({
+                "evaluator": evaluator,
+                "problem": problem,
+                "current": current,
+                "relative_difference": rel_diff,
+                "time": elapsed,
+            })
+            if sem.rank == 0:
+                logger.info(
+                    "%-15s %-9s current %.6e (rel. diff to surface %.2e), %.4f s/eval",
+                    problem, evaluator, current, rel_diff, elapsed,
+                )
+    return results
+
+
+def select_fastest(results):
+    """Return the fastest preset whose currents matched the reference, or None."""
+    valid = [r for r in results if r.get("ok")]
+    if not valid:
+        return None
+    return min(valid, key=lambda r: r["total_time"])["preset"]
+
+
+def write_preset_to_config(config_path, preset):
+    """
+    Store ``preset`` under ``simulation.solver.preset`` in a JSON config file.
+
+    ``petsc_options`` override the preset at run time, so entries the preset
+    sets are removed from them; the configured run then uses the options that
+    were benchmarked. Other options and the rest of the file are kept.
+    """
+    config_path = Path(config_path)
+    with open(config_path, "r") as f:
+        config = json.load(f)
+    solver_cfg = config.setdefault("simulation", {}).get("solver") or {}
+    solver_cfg["preset"] = preset
+    petsc_options = solver_cfg.get("petsc_options")
+    if petsc_options:
+        solver_cfg["petsc_options"] = {
+            key: value for key, value in petsc_options.items() if key not in SOLVER_PRESETS[preset]
+        }
+    config["simulation"]["solver"] = solver_cfg
+    with open(config_path, "w") as f:
+        json.dump(config, f, indent=2)
@@ -4,6 +4,7 @@ Contains helper functions converted to DOLFINx.
 """
 
 import os
+import weakref
 import numpy as np
 import logging
 import dolfinx
@@ -12,6 +13,20 @@ import dolfinx.mesh as dmesh
 
 logger = logging.getLogger(__name__)
 
+# Storage precision for grids, distance fields, DOF coordinates and
+# per-position conductivity arrays. The PETSc solve always runs in double.
+PRECISION_DTYPES = {"double": np.float64, "single": np.float32}
+
+
+def precision_dtype(precision):
+    """Return the NumPy dtype for a precision name ('double' or 'single')."""
+    try:
+        return PRECISION_DTYPES[str(precision).lower()]
+    except KeyError:
+        raise ValueError(
+            f"precision must be one of {tuple(PRECISION_DTYPES)}, got {precision!r}"
+        ) from None
+
 def condfrac(invec):
     """
     Convert values to conductivity fractions (from original code).
@@ -141,11 +156,44 @@ def _is_dg0_space(V):
     return "discontinuous" in family_str or family_str in ("dg", "dgp0", "dp")
 
 
-def get_dof_coordinates(mesh_obj, V):
+# Memo of DOF coordinates: mesh -> {function space -> {dtype -> coordinates}}.
+# Weak keys let entries disappear with the mesh, so a rebuilt mesh is never
+# served stale coordinates.
+_dof_coordinate_cache = weakref.WeakKeyDictionary()
+
+
+def _raise_not_dg0():
+    raise ValueError("DG0 space is expected to have exactly one dof per cell")
+
+
+def _single_dof_per_cell(cell_dofs, num_cells):
     """
-    Return dof coordinates for a function space.
-    Handles DG0 by using cell midpoints and the dofmap ordering.
+    Return the dof of each cell as a 1D array for a one-dof-per-cell dofmap.
+
+    Accepts both the 2D array returned by newer DOLFINx versions and the
+    adjacency list (``array``/``offsets``) of older ones.
     """
+    if hasattr(cell_dofs, "links"):
+        offsets = _safe_attr(cell_dofs, "offsets")
+        array = _safe_attr(cell_dofs, "array")
+        if offsets is None or array is None:
+            # No flat view exposed: fall back to per-cell links.
+            links = [cell_dofs.links(cell) for cell in range(num_cells)]
+            if any(len(dofs) != 1 for dofs in links):
+                _raise_not_dg0()
+            return np.array([dofs[0] for dofs in links], dtype=np.int64)
+        offsets = np.asarray(offsets)
+        if np.any(np.diff(offsets[:num_cells + 1]) != 1):
+            _raise_not_dg0()
+        return np.asarray(array)[offsets[:num_cells]]
+
+    cell_dofs = np.asarray(cell_dofs)
+    if cell_dofs.ndim != 2 or cell_dofs.shape[1] != 1:
+        _raise_not_dg0()
+    return cell_dofs[:num_cells, 0]
+
+
+def _tabulate_dof_coordinates(mesh_obj, V):
     if not _is_dg0_space(V):
         return V.tabulate_dof_coordinates()
 
@@ -155,37 +203,58 @@ def get_dof_coordinates(mesh_obj, V):
     cells = np.arange(num_cells, dtype=np.int32)
     cell_midpoints = dmesh.compute_midpoints(mesh_obj, tdim, cells)
 
-    dofmap = V.dofmap
-    dof_index_map = dofmap.index_map
+    dof_index_map = V.dofmap.index_map
     num_dofs = dof_index_map.size_local + dof_index_map.num_ghosts
     coords = np.zeros((num_dofs, mesh_obj.geometry.dim), dtype=cell_midpoints.dtype)
+    coords[_single_dof_per_cell(V.dofmap.list, num_cells)] = cell_midpoints
+    return coords
 
-    cell_dofs = dofmap.list
-    if hasattr(cell_dofs, "links"):
-        for cell in range(num_cells):
-            dofs = cell_dofs.links(cell)
-            if len(dofs) != 1:
-                raise ValueError("DG0 space is expected to have exactly one dof per cell")
-            coords[dofs[0]] = cell_midpoints[cell]
-    else:
-        cell_dofs = np.asarray(cell_dofs)
-        if cell_dofs.ndim != 2 or cell_dofs.shape[1] != 1:
-            raise ValueError("DG0 space is expected to have exactly one dof per cell")
-        coords[cell_dofs[:, 0]] = cell_midpoints
 
+def get_dof_coordinates(mesh_obj, V, dtype=None):
+    """
+    Return dof coordinates for a function space.
+    Handles DG0 by using cell midpoints and the dofmap ordering.
+
+    Results are memoized per (mesh, function space, dtype); the returned
+    array is read-only and shared between callers. ``dtype=None`` gives the
+    coordinates in the mesh geometry's dtype. A cast request tabulates from
+    the native copy when one is memoized and otherwise keeps only the cast
+    copy, so a float32-only run does not also hold the float64 array.
+    """
+    key = None if dtype is None else np.dtype(dtype)
+    try:
+        per_mesh = _dof_coordinate_cache.setdefault(mesh_obj, weakref.WeakKeyDictionary())
+        entries = per_mesh.setdefault(V, {})
+    except TypeError:
+        # Objects without weak reference support are not memoized.
+        entries = {}
+    coords = entries.get(key)
+    if coords is not None:
+        return coords
+
+    native = entries.get(None)
+    if native is not None and native.dtype == key:
+        return native
+    coords = native if native is not None else _tabulate_dof_coordinates(mesh_obj, V)
+    if key is not None and coords.dtype != key:
+        coords = coords.astype(key)
+    coords.setflags(write=False)
+    entries[key] = coords
     return coords
 
 
-def loadFunc(mesh_obj, V, sig_func, interpfunction, bulk_conductivity):
+def loadFunc(mesh_obj, V, sig_func, interpfunction, bulk_conductivity, dof_coordinates=None):
     """
     Load function values using interpolation (DOLFINx version).
     Enhanced with better error handling and debugging.
+
+    ``dof_coordinates`` may be passed when the caller already has them.
     """
     try:
         logger.info("Starting loadFunc (DOLFINx version)...")
         
         # Get DOF coordinates (DOLFINx way)
-        x = get_dof_coordinates(mesh_obj, V)
+        x = dof_coordinates if dof_coordinates is not None else get_dof_coordinates(mesh_obj, V)
         logger.info(f"DOF coordinates shape: {x.shape}")
         
         # Evaluate interpolation function at DOF coordinates
@@ -0,0 +1,51 @@
+"""Adaptive z-sampling refinement and gap filling."""
+
+import numpy as np
+
+from sem.adaptive_sampling import AdaptiveZSampler, fill_unsampled
+
+
+def _run(sampler, trace):
+    order = []
+    for index in sampler:
+        order.append(index)
+        sampler.record(index, trace[index])
+    return order
+
+
+def test_flat_trace_stays_coarse():
+    sampler = AdaptiveZSampler(41, coarse_stride=8, current_tol=0.01)
+    order = _run(sampler, np.ones(41))
+    assert order == [0, 8, 16, 24, 32, 40]
+    assert sampler.num_passes == 0
+
+
+def test_step_is_bracketed_by_neighbouring_samples():
+    trace = np.where(np.arange(65) < 27, 1.0, 0.5)
+    sampler = AdaptiveZSampler(65, coarse_stride=16, current_tol=0.01)
+    order = _run(sampler, trace)
+    sampled = sampler.sampled_indices
+    assert {26, 27} <= set(sampled)
+    assert len(order) == len(set(order)) < 65
+    # Away from the step the trace is flat, so the coarse samples suffice.
+    assert not {5, 40, 60} & set(sampled)
+
+
+def test_curvature_refines_a_kink_the_current_tolerance_misses():
+    z = np.arange(33, dtype=float)
+    trace = 1.0 - 0.001 * np.abs(z - 13.0)
+    coarse = AdaptiveZSampler(33, coarse_stride=8, current_tol=0.05)
+    _run(coarse, trace)
+    bending = AdaptiveZSampler(33, coarse_stride=8, current_tol=0.05, curvature_tol=1e-4)
+    _run(bending, trace)
+    assert coarse.sampled_indices.size == 5
+    assert 13 in bending.sampled_indices
+
+
+def test_fill_unsampled_interpolates_and_keeps_skipped_gaps():
+    values = np.array([0.0, np.nan, 2.0, np.nan, np.nan, np.nan, 6.0, np.nan, np.nan])
+    mask = np.array([True, False, True, False, False, False, True, False, True])
+    values[8] = np.nan  # sampled but skipped (e.g. analyte overlap)
+    filled = fill_unsampled(values, mask)
+    np.testing.assert_allclose(filled[:7], [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    assert np.isnan(filled[7]) and np.isnan(filled[8])
@@ -0,0 +1,116 @@
+"""Analyte spatial index, box culling and stamp against brute-force distances."""
+
+import numpy as np
+import pytest
+
+from sem.analyte_index import AnalyteIndex, AnalyteStamp, ZSortedPointIndex
+
+
+def _rotation(seed):
+    q, r = np.linalg.qr(np.random.default_rng(seed).normal(size=(3, 3)))
+    q *= np.sign(np.diag(r))
+    if np.linalg.det(q) < 0:
+        q[:, 0] = -q[:, 0]
+    return q
+
+
+def _analyte(num_atoms=150, radii_levels=(1.2, 1.55, 1.7, 1.8), seed=0):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(-8.0, 8.0, size=(num_atoms, 3))
+    radii = rng.choice(np.asarray(radii_levels, dtype=float), num_atoms)
+    return positions, radii
+
+
+def _brute_surface(points, positions, radii, cutoff, center_cutoff=True):
+    d = np.linalg.norm(points[:, None, :] - positions[None, :, :], axis=2)
+    surface = np.maximum((d - radii[None, :]).min(axis=1), 0.0)
+    if center_cutoff:
+        surface[d.min(axis=1) >= cutoff] = np.inf
+    surface[surface >= cutoff] = np.inf
+    return surface
+
+
+@pytest.mark.parametrize("center_cutoff", [True, False])
+@pytest.mark.parametrize("num_levels", [4, 40])
+def test_surface_distances_match_brute_force(num_levels, center_cutoff):
+    # 4 radius levels use the per-level trees, 40 the k-nearest search.
+    levels = np.linspace(1.0, 2.2, num_levels)
+    positions, radii = _analyte(radii_levels=levels)
+    center = positions.mean(axis=0)
+    index = AnalyteIndex(positions, center, radii)
+    rotation, origin = _rotation(1), np.array([2.0, -1.0, 30.0])
+    world = (positions - center) @ rotation.T + origin
+    points = origin + np.random.default_rng(2).uniform(-14.0, 14.0, size=(2000, 3))
+
+    cutoff = 4.0
+    surface = index.surface_distances(points, rotation, origin, cutoff, center_cutoff)
+    expected = _brute_surface(points, world, radii, cutoff, center_cutoff)
+    np.testing.assert_allclose(surface, expected, rtol=0, atol=1e-12)
+
+
+def test_exact_mode_modifies_the_nearest_centre_region():
+    positions, radii = _analyte()
+    index = AnalyteIndex(positions, np.zeros(3), radii)
+    points = np.random.default_rng(8).uniform(-14.0, 14.0, size=(3000, 3))
+    cutoff = 4.0
+    centre, _ = index.query(points, np.eye(3), np.zeros(3), distance_upper_bound=cutoff)
+    surface = index.surface_distances(points, np.eye(3), np.zeros(3), cutoff)
+    np.testing.assert_array_equal(np.isfinite(surface), np.isfinite(centre))
+
+
+def test_query_matches_world_frame_tree():
+    positions, radii = _analyte()
+    index = AnalyteIndex(positions, positions.mean(axis=0), radii)
+    rotation, origin = _rotation(3), np.array([0.0, 0.0, -12.5])
+    world = (positions - index.center) @ rotation.T + origin
+    points = origin + np.random.default_rng(4).uniform(-12.0, 12.0, size=(500, 3))
+
+    distances, indices = index.query(points, rotation, origin, distance_upper_bound=3.0)
+    brute = np.linalg.norm(points[:, None, :] - world[None, :, :], axis=2)
+    expected = brute.min(axis=1)
+    near = expected < 3.0
+    np.testing.assert_array_equal(np.isfinite(distances), near)
+    np.testing.assert_allclose(distances[near], expected[near], atol=1e-12)
+    np.testing.assert_array_equal(indices[near], brute[near].argmin(axis=1))
+
+
+def test_z_sorted_candidates_match_mask():
+    points = np.random.default_rng(5).uniform(-20.0, 20.0, size=(5000, 3))
+    index = ZSortedPointIndex(points)
+    box_min, box_max = np.array([-5.0, -3.0, 2.0]), np.array([6.0, 4.0, 9.5])
+    inside = np.all((points >= box_min) & (points <= box_max), axis=1)
+    np.testing.assert_array_equal(index.candidates(box_min, box_max), np.flatnonzero(inside))
+    assert len(index) == points.shape[0]
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_stamp_reproduces_distances_at_grid_nodes(exact):
+    positions, radii = _analyte(num_atoms=60)
+    index = AnalyteIndex(positions, positions.mean(axis=0), radii)
+    cutoff = 4.0
+    stamp = AnalyteStamp(index, radii, cutoff, resolution=0.5, exact=exact)
+
+    rng = np.random.default_rng(6)
+    nodes = np.column_stack([rng.integers(1, n - 1, 800) for n in stamp.shape])
+    body = stamp.lower + stamp.resolution * nodes
+    rotation, origin = _rotation(7), np.array([1.0, 2.0, 3.0])
+    world = body @ rotation.T + origin
+    sampled = stamp.sample(world, rotation, origin)
+
+    if exact:
+        expected = index.body_surface_distances(body, cutoff)
+    else:
+        distances, indices = index.tree.query(body, distance_upper_bound=cutoff)
+        expected = np.full(body.shape[0], np.inf)
+        near = np.isfinite(distances)
+        expected[near] = np.maximum(distances[near] - radii[indices[near]], 0.0)
+    expected[~np.isfinite(expected)] = cutoff
+    np.testing.assert_allclose(sampled, expected, atol=1e-9)
+
+
+def test_stamp_outside_grid_is_cutoff():
+    positions, radii = _analyte(num_atoms=20)
+    index = AnalyteIndex(positions, positions.mean(axis=0), radii)
+    stamp = AnalyteStamp(index, radii, 3.0, resolution=1.0)
+    far = np.array([[500.0, 0.0, 0.0], [0.0, -500.0, 0.0]])
+    np.testing.assert_array_equal(stamp.sample(far, np.eye(3), np.zeros(3)), [3.0, 3.0])
@@ -0,0 +1,55 @@
+"""Per-mesh cache of the open-pore conductivity in ``VerticalMovementSEM``."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("dolfinx")
+
+from sem.vertical_movement_sem import VerticalMovementSEM  # noqa: E402
+
+
+def _open_pore(tmp_path):
+    return VerticalMovementSEM(
+        moving_pdb=None,
+        prepare_analyte=False,
+        pore_type="cylindrical",
+        pore_radius=10.0,
+        membrane_thickness=10.0,
+        box_dimensions={"x": (-20.0, 20.0), "y": (-20.0, 20.0), "z": (-20.0, 20.0)},
+        grid_resolution=2.0,
+        output_prefix=str(tmp_path / "cache"),
+    )
+
+
+def _counts(sem):
+    stats = sem._conductivity_cache_stats
+    return stats["hits"], stats["misses"]
+
+
+def test_base_conductivity_is_computed_once_per_mesh(tmp_path):
+    sem = _open_pore(tmp_path)
+    assert sem._base_conductivity_cache is None
+
+    coords, values = sem._get_base_conductivity()
+    assert _counts(sem) == (0, 1)
+    assert not coords.flags.writeable and not values.flags.writeable
+    assert coords.shape[0] == values.shape[0] == sem.sig.x.array.shape[0]
+
+    # Repeated calls on the same mesh hit the cache and return the same arrays.
+    for _ in range(3):
+        again = sem._get_base_conductivity()
+        assert again[0] is coords and again[1] is values
+    sem._load_base_conductivity()
+    np.testing.assert_array_equal(sem.sig.x.array, values)
+    assert _counts(sem) == (4, 1)
+
+    # A new mesh misses the cache and tabulates its own DOFs.
+    sem.grid_resolution = 4.0
+    sem.setup_dolfinx()
+    new_coords, new_values = sem._get_base_conductivity()
+    assert _counts(sem) == (4, 2)
+    assert new_coords is not coords
+    assert new_coords.shape[0] < coords.shape[0]
+    assert new_coords.shape[0] == new_values.shape[0] == sem.sig.x.array.shape[0]
+    assert sem._get_base_conductivity()[1] is new_values
+    assert _counts(sem) == (5, 2)
@@ -0,0 +1,61 @@
+"""``calculate_analyte_conductivity_modification`` in single and double precision."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("dolfinx")
+
+from sem.analyte_index import ZSortedPointIndex  # noqa: E402
+from sem.conductivity_models import SimpleConductivityModel  # noqa: E402
+from sem.vertical_movement_sem import VerticalMovementSEM  # noqa: E402
+
+
+def _sem(kernel):
+    """Just the state the conductivity update reads; no mesh or solver."""
+    sem = object.__new__(VerticalMovementSEM)
+    sem.cutoff = 4.1
+    sem.surface_distance = "nearest_center"
+    sem.stamp_enabled = False
+    sem.conductivity_kernel = kernel
+    sem.conductivity_model = SimpleConductivityModel(bulk_conductivity=11.2, cutoff=4.1)
+    sem._fused_kernel = None
+    sem.membrane_conductivity = 1e-6
+    sem.prevent_analyte_overlap = False
+    return sem
+
+
+@pytest.mark.parametrize("kernel", ["numpy", "numba"])
+def test_single_precision_rounds_the_double_result_once(kernel):
+    rng = np.random.default_rng(0)
+    # float32-representable inputs, so both runs see the same coordinates.
+    coords = rng.uniform(-20.0, 20.0, size=(20000, 3)).astype(np.float32)
+    base = np.full(coords.shape[0], 11.2, dtype=np.float32)
+    base[rng.random(coords.shape[0]) < 0.1] = 2.5
+    atoms = rng.uniform(-6.0, 6.0, size=(50, 3))
+    radii = rng.choice([1.2, 1.55, 1.7, 1.8], 50)
+    sem = _sem(kernel)
+
+    results = {}
+    for dtype in (np.float64, np.float32):
+        c = coords.astype(dtype)
+        results[dtype] = sem.calculate_analyte_conductivity_modification(
+            c, atoms, radii, base.astype(dtype), point_index=ZSortedPointIndex(c),
+        )
+    double, single = results[np.float64], results[np.float32]
+    assert single.dtype == np.float32
+    assert np.count_nonzero(double != base) > 100
+    np.testing.assert_array_equal(single, double.astype(np.float32))
+
+
+def test_fused_and_numpy_paths_agree_in_single_precision():
+    rng = np.random.default_rng(1)
+    coords = rng.uniform(-15.0, 15.0, size=(10000, 3)).astype(np.float32)
+    base = np.full(coords.shape[0], 11.2, dtype=np.float32)
+    atoms = rng.uniform(-5.0, 5.0, size=(30, 3))
+    radii = rng.choice([1.2, 1.7], 30)
+    index = ZSortedPointIndex(coords)
+    numpy_path = _sem("numpy").calculate_analyte_conductivity_modification(
+        coords, atoms, radii, base, point_index=index)
+    fused_path = _sem("numba").calculate_analyte_conductivity_modification(
+        coords, atoms, radii, base, point_index=index)
+    np.testing.assert_array_equal(fused_path, numpy_path)
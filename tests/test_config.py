@@ -0,0 +1,29 @@
+"""Validation of the ``simulation.solver`` config block."""
+
+import pytest
+
+from sem.config import _validate_solver_config
+
+
+@pytest.mark.parametrize("local_cfg", [
+    {"enabled": "yes"},
+    {"enabled": 1},
+    {"validate_every": 2.5},
+    {"validate_every": True},
+    {"validate_every": -1},
+    {"validate_every": "25"},
+    {"residual_rtol": 0.0},
+    {"halo": -1.0},
+])
+def test_invalid_local_correction_is_rejected(local_cfg):
+    assert not _validate_solver_config({"local_correction": local_cfg})
+
+
+def test_local_correction_is_normalized():
+    solver_cfg = {"local_correction": {"enabled": True, "validate_every": 0, "halo": 5, "rtol": 1e-6}}
+    assert _validate_solver_config(solver_cfg)
+    local_cfg = solver_cfg["local_correction"]
+    assert local_cfg["validate_every"] == 0
+    assert local_cfg["halo"] == 5.0
+    # The residual check defaults to the subdomain tolerance.
+    assert local_cfg["residual_rtol"] == 1e-6
@@ -0,0 +1,64 @@
+"""
+Agreement of the current evaluators of ``VerticalMovementSEM``.
+
+For a converged discrete solution the reaction on the top Dirichlet DOFs and
+the dissipated power divided by the voltage are the same number; the
+top-surface flux differs from them only by the discretisation error of the
+boundary gradient.
+"""
+
+import pytest
+
+pytest.importorskip("dolfinx")
+
+from sem.vertical_movement_sem import VerticalMovementSEM  # noqa: E402
+
+SOLVER = {"preset": "cg_boomeramg", "petsc_options": {"ksp_rtol": 1e-12}}
+
+
+def _open_pore(tmp_path, **kwargs):
+    """Open-pore SEM on a small box around a cylindrical pore (lengths in Å)."""
+    params = dict(
+        moving_pdb=None,
+        prepare_analyte=False,
+        pore_type="cylindrical",
+        pore_radius=10.0,
+        membrane_thickness=10.0,
+        box_dimensions={"x": (-20.0, 20.0), "y": (-20.0, 20.0), "z": (-20.0, 20.0)},
+        grid_resolution=2.0,
+        output_prefix=str(tmp_path / "evaluators"),
+        solver=SOLVER,
+    )
+    params.update(kwargs)
+    return VerticalMovementSEM(**params)
+
+
+def test_current_evaluators_agree_on_a_cylindrical_pore(tmp_path):
+    sem = _open_pore(tmp_path)
+    sem.calculate_open_pore_current()
+    assert sem.fem_solver.last_converged_reason > 0
+
+    surface = sem.compute_current("surface")
+    residual = sem.compute_current("residual")
+    energy = sem.compute_current("energy")
+    assert energy > 0.0
+    assert residual == pytest.approx(energy, rel=1e-6)
+    assert surface == pytest.approx(energy, rel=5e-2)
+    # The default evaluator is the surface flux.
+    assert sem.compute_current() == surface
+
+
+def test_configured_evaluator_is_used_by_default(tmp_path):
+    sem = _open_pore(tmp_path, solver={**SOLVER, "current_evaluator": "Energy"})
+    assert sem.current_evaluator == "energy"
+    open_current = sem.calculate_open_pore_current()
+    assert open_current == pytest.approx(sem.compute_current("energy"))
+
+
+def test_unknown_evaluator_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="current_evaluator"):
+        _open_pore(tmp_path, solver={**SOLVER, "current_evaluator": "bogus"})
+
+    sem = _open_pore(tmp_path)
+    with pytest.raises(ValueError, match="Unknown current evaluator 'bogus'"):
+        sem.compute_current("bogus")
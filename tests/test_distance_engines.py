@@ -0,0 +1,80 @@
+"""In-process distance engines against the gen_dist.py subprocess."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+pytest.importorskip("numba")
+
+from sem.distance_field import DistanceFieldError, compute_distance_field  # noqa: E402
+
+GEN_DIST = Path(__file__).resolve().parents[1] / "sem" / "scripts" / "gen_dist.py"
+
+# (lower, upper, resolution, cutoff); the second box cuts through the atoms.
+BOXES = [
+    ((-12.0, -12.0, -12.0), (12.0, 12.0, 12.0), 1.0, 4.0),
+    ((-6.0, -10.0, -3.0), (9.5, 7.0, 10.0), 0.7, 3.0),
+]
+
+
+@pytest.fixture(scope="module")
+def xyz_file(tmp_path_factory):
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(-9.0, 9.0, size=(400, 3))
+    radii = rng.choice([1.1, 1.52, 1.55, 1.7, 1.8], 400)
+    path = tmp_path_factory.mktemp("atoms") / "atoms.xyz"
+    np.savetxt(path, np.column_stack([positions, radii]), fmt="%.6f")
+    return path
+
+
+def _gen_dist(xyz_file, lower, upper, resolution, cutoff, workdir):
+    """Run gen_dist.py and return its field indexed [x, y, z]."""
+    out = workdir / "field.bin"
+    # gen_dist takes the upper corner first.
+    cmd = [sys.executable, str(GEN_DIST), str(xyz_file), *map(str, upper), *map(str, lower),
+           str(resolution), str(cutoff), str(out)]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stdout + result.stderr
+    raw = np.fromfile(out, dtype=np.float32)
+    nx, ny, nz = (int(n) for n in raw[:3])
+    return raw[7:].reshape(nz, ny, nx).transpose(2, 1, 0)
+
+
+@pytest.mark.parametrize("box", BOXES)
+@pytest.mark.parametrize("engine", ["kdtree", "numba"])
+def test_engine_matches_gen_dist_subprocess(xyz_file, tmp_path, engine, box):
+    lower, upper, resolution, cutoff = box
+    reference = _gen_dist(xyz_file, lower, upper, resolution, cutoff, tmp_path)
+    atoms = np.loadtxt(xyz_file)
+    val3d, extents, counts = compute_distance_field(
+        atoms[:, :3], atoms[:, 3], lower, upper, resolution, cutoff, engine=engine,
+    )
+    assert list(val3d.shape) == counts == list(reference.shape)
+    assert val3d.dtype == np.float32
+    np.testing.assert_array_equal(val3d, reference)
+    assert 0.0 <= val3d.min() < val3d.max() <= cutoff
+    np.testing.assert_allclose(extents, np.float32(resolution) * (np.array(counts) - 1))
+
+
+def test_numba_engine_does_not_depend_on_thread_count(xyz_file):
+    atoms = np.loadtxt(xyz_file)
+    lower, upper, resolution, cutoff = BOXES[0]
+    one, _, _ = compute_distance_field(atoms[:, :3], atoms[:, 3], lower, upper, resolution,
+                                       cutoff, engine="numba", num_threads=1)
+    default, _, _ = compute_distance_field(atoms[:, :3], atoms[:, 3], lower, upper, resolution,
+                                           cutoff, engine="numba")
+    np.testing.assert_array_equal(one, default)
+
+
+@pytest.mark.parametrize("engine", ["kdtree", "numba", "subprocess"])
+def test_engine_errors_are_distance_field_errors(engine):
+    # BiologicalPore falls back to the subprocess only on these (and ImportError).
+    positions = np.full((3, 3), 50.0)
+    with pytest.raises(DistanceFieldError) as info:
+        compute_distance_field(positions, 1.5, (-5.0, -5.0, -5.0), (5.0, 5.0, 5.0), 1.0, 3.0,
+                               engine=engine)
+    assert isinstance(info.value, ValueError)
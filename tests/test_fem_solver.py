@@ -0,0 +1,272 @@
+"""
+Equivalence tests for ``sem.fem_solver.PersistentPoissonSolver``.
+
+The persistent solver must reproduce the per-call ``LinearProblem`` solve it
+replaced, and incremental assembly must give the same matrix (and solution)
+as a full reassembly. The problem is the SEM one in miniature: P1 potential,
+DG0 conductivity, fixed voltage on the top face and ground on the bottom.
+"""
+
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("dolfinx")
+
+import dolfinx  # noqa: E402
+import ufl  # noqa: E402
+from dolfinx import fem, mesh  # noqa: E402
+from mpi4py import MPI  # noqa: E402
+from petsc4py import PETSc  # noqa: E402
+
+from sem.fem_solver import PersistentPoissonSolver, PreconditionerReusePolicy  # noqa: E402
+
+TIGHT_OPTIONS = {"ksp_type": "cg", "pc_type": "hypre", "ksp_rtol": 1e-12, "ksp_max_it": 2000}
+MPIRUN = shutil.which("mpirun") or shutil.which("mpiexec")
+
+
+class _Problem:
+    """Unit box with a conductivity block that can be perturbed."""
+
+    def __init__(self, n=8, voltage=0.1):
+        self.mesh = mesh.create_unit_cube(MPI.COMM_WORLD, n, n, n)
+        self.V = fem.functionspace(self.mesh, ("Lagrange", 1))
+        self.Q = fem.functionspace(self.mesh, ("DG", 0))
+        fdim = self.mesh.topology.dim - 1
+        top = dolfinx.mesh.locate_entities_boundary(self.mesh, fdim, lambda x: np.isclose(x[2], 1.0))
+        bot = dolfinx.mesh.locate_entities_boundary(self.mesh, fdim, lambda x: np.isclose(x[2], 0.0))
+        self.bcs = [
+            fem.dirichletbc(PETSc.ScalarType(voltage), fem.locate_dofs_topological(self.V, fdim, top), self.V),
+            fem.dirichletbc(PETSc.ScalarType(0.0), fem.locate_dofs_topological(self.V, fdim, bot), self.V),
+        ]
+        u, v = ufl.TrialFunction(self.V), ufl.TestFunction(self.V)
+        self.sig = fem.Function(self.Q)
+        self.sig.x.array[:] = 1.0
+        self.a = self.sig * ufl.dot(ufl.grad(u), ufl.grad(v)) * ufl.dx
+        self.L = fem.Constant(self.mesh, PETSc.ScalarType(0.0)) * v * ufl.dx
+        self.centroids = self.Q.tabulate_dof_coordinates()
+
+    def block_conductivity(self, z_center, width=0.2, value=1e-3):
+        """Bulk conductivity with a low-conductivity slab around ``z_center``."""
+        sig = np.ones_like(self.sig.x.array)
+        sig[np.abs(self.centroids[:, 2] - z_center) < width / 2] = value
+        return sig
+
+    def solver(self, **kwargs):
+        kwargs.setdefault("petsc_options", TIGHT_OPTIONS)
+        return PersistentPoissonSolver(self.a, self.L, self.bcs, self.V, **kwargs)
+
+    def linear_problem(self):
+        from dolfinx.fem.petsc import LinearProblem
+
+        try:
+            problem = LinearProblem(self.a, self.L, bcs=self.bcs, petsc_options=TIGHT_OPTIONS,
+                                    petsc_options_prefix="sem_test_lp_")
+        except TypeError:  # dolfinx < 0.10 has no petsc_options_prefix
+            problem = LinearProblem(self.a, self.L, bcs=self.bcs, petsc_options=TIGHT_OPTIONS)
+        return problem.solve()
+
+
+def _assert_close(u1, u2, rtol=1e-8):
+    a = u1.x.array if hasattr(u1, "x") else u1
+    b = u2.x.array if hasattr(u2, "x") else u2
+    scale = max(np.max(np.abs(b)), 1e-30)
+    assert np.max(np.abs(a - b)) <= rtol * scale
+
+
+def test_persistent_matches_linear_problem_over_trace():
+    problem = _Problem()
+    solver = problem.solver()
+    for z in (0.3, 0.5, 0.7):
+        problem.sig.x.array[:] = problem.block_conductivity(z)
+        uh = solver.solve()
+        assert solver.last_converged_reason > 0
+        _assert_close(uh, problem.linear_problem())
+    assert solver.num_solves == 3
+    solver.destroy()
+
+
+def test_lagged_preconditioner_matches_linear_problem():
+    problem = _Problem()
+    solver = problem.solver(reuse_policy=PreconditionerReusePolicy(rebuild_every=0))
+    for z in (0.4, 0.45, 0.5):
+        problem.sig.x.array[:] = problem.block_conductivity(z)
+        uh = solver.solve()
+        _assert_close(uh, problem.linear_problem())
+    assert solver.num_pc_setups == 1
+    assert solver.last_pc_reused
+    solver.destroy()
+
+
+def test_diverged_solve_resets_reuse_policy_on_every_rank():
+    problem = _Problem()
+    solver = problem.solver(reuse_policy=PreconditionerReusePolicy(rebuild_every=0))
+    problem.sig.x.array[:] = problem.block_conductivity(0.4)
+    solver.solve()
+
+    # A lagged solve capped at one iteration diverges (DIVERGED_ITS).
+    solver.set_petsc_options({**TIGHT_OPTIONS, "ksp_max_it": 1})
+    problem.sig.x.array[:] = problem.block_conductivity(0.5)
+    solver.solve()
+    assert solver.last_converged_reason < 0
+    assert solver.last_pc_reused
+
+    # Every rank must rebuild on the next solve, or PCSetUp is not collective.
+    solver.set_petsc_options(TIGHT_OPTIONS)
+    uh = solver.solve()
+    assert solver.last_converged_reason > 0
+    assert problem.mesh.comm.allgather(solver.last_pc_reused) == [False] * problem.mesh.comm.size
+    assert solver.num_pc_setups == 2
+    _assert_close(uh, problem.linear_problem())
+    solver.destroy()
+
+
+@pytest.mark.skipif(MPI.COMM_WORLD.size > 1 or MPIRUN is None, reason="launches its own 2-rank run")
+def test_diverged_solve_under_mpirun():
+    cmd = [MPIRUN, "-n", "2", sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+           __file__, "-k", "resets_reuse_policy_on_every_rank"]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+@pytest.mark.parametrize("rebuild_every", [1, 3])
+def test_deflation_recycling_matches_linear_problem(rebuild_every):
+    problem = _Problem()
+    solver = problem.solver(recycle="deflation", recycle_size=3,
+                            reuse_policy=PreconditionerReusePolicy(rebuild_every=rebuild_every))
+    recycled = []
+    for z in np.linspace(0.3, 0.6, 6):
+        problem.sig.x.array[:] = problem.block_conductivity(z)
+        uh = solver.solve()
+        recycled.append(solver.last_recycled)
+        _assert_close(uh, problem.linear_problem())
+    # The space is only installed on rebuilds. With rebuild_every=3 the
+    # second solve lags the space-less first PC; the fifth lags the PC
+    # rebuilt with a space at the fourth.
+    assert recycled[0] is False
+    assert recycled[1] is (rebuild_every == 1)
+    assert recycled[4]
+    assert solver.num_pc_setups == (6 if rebuild_every == 1 else 2)
+    solver.destroy()
+
+
+def _flux(problem, uh):
+    """Mean z-flux over the unit cube, i.e. the current through any z-plane."""
+    form = fem.form(problem.sig * uh.dx(2) * ufl.dx)
+    return problem.mesh.comm.allreduce(fem.assemble_scalar(form), op=MPI.SUM)
+
+
+def test_current_stop_ends_once_the_current_settles():
+    problem = _Problem(n=12)
+    v = ufl.TestFunction(problem.V)
+    solver = problem.solver(current_form=problem.sig * v.dx(2) * ufl.dx, current_rtol=1e-3,
+                            current_check_every=1)
+    problem.sig.x.array[:] = problem.block_conductivity(0.5)
+
+    exact = solver.solve(stop_on_current=False)
+    assert not solver.last_stopped_on_current
+    assert solver.last_converged_reason > 0
+    full_iterations = solver.last_iterations
+    exact_current = _flux(problem, exact)
+    exact_values = exact.x.array.copy()
+
+    uh = solver.solve(stop_on_current=True)
+    assert solver.last_stopped_on_current
+    assert solver.last_iterations < full_iterations
+    assert abs(_flux(problem, uh) - exact_current) <= 1e-2 * abs(exact_current)
+
+    # From the converged field, rtol is judged against |Bb| as in PETSc's
+    # default test, not against the already tiny initial residual.
+    solver.solve(initial_guess=exact_values, stop_on_current=True)
+    assert solver.last_converged_reason > 0
+    assert solver.last_iterations <= 2
+    assert not solver.last_stopped_on_current
+
+    # Back to PETSc's own test for residual-converged solves.
+    solver.solve(stop_on_current=False)
+    assert solver.last_iterations == full_iterations
+    assert not solver.last_stopped_on_current
+    solver.destroy()
+
+
+def test_warm_start_matches_cold_solve_in_fewer_iterations():
+    problem = _Problem(n=12)
+    solver = problem.solver()
+    problem.sig.x.array[:] = problem.block_conductivity(0.45)
+    previous = solver.solve().x.array.copy()
+
+    # Next position along the trace, from zero and from the previous field.
+    problem.sig.x.array[:] = problem.block_conductivity(0.5)
+    cold = solver.solve()
+    assert solver.last_converged_reason > 0
+    cold_iterations = solver.last_iterations
+    cold_current = _flux(problem, cold)
+    cold_values = cold.x.array.copy()
+
+    warm = solver.solve(initial_guess=previous)
+    assert solver.last_converged_reason > 0
+    assert solver.last_iterations <= cold_iterations
+    assert abs(_flux(problem, warm) - cold_current) <= 1e-8 * abs(cold_current)
+    _assert_close(warm, cold_values)
+    solver.destroy()
+
+
+def test_incremental_assembly_matches_full_assembly():
+    problem = _Problem()
+    incremental = problem.solver(coefficient=problem.sig, incremental_max_fraction=0.5,
+                                 options_prefix="sem_test_inc_")
+    full = problem.solver(options_prefix="sem_test_full_")
+
+    problem.sig.x.array[:] = problem.block_conductivity(0.3)
+    incremental.solve()
+    assert incremental.last_assembly_mode == "full"
+
+    problem.sig.x.array[:] = problem.block_conductivity(0.35)
+    u_inc = incremental.solve().x.array.copy()
+    assert incremental.last_assembly_mode == "incremental"
+    assert 0.0 < incremental.last_changed_fraction <= 0.5
+    u_full = full.solve().x.array.copy()
+
+    A_inc = incremental.A.convert("dense").getDenseArray()
+    A_full = full.A.convert("dense").getDenseArray()
+    np.testing.assert_allclose(A_inc, A_full, rtol=1e-12, atol=1e-12 * np.abs(A_full).max())
+    _assert_close(u_inc, u_full)
+
+    incremental.solve()
+    assert incremental.last_assembly_mode == "skipped"
+    incremental.destroy()
+    full.destroy()
+
+
+def test_incremental_falls_back_to_full_above_fraction():
+    problem = _Problem()
+    solver = problem.solver(coefficient=problem.sig, incremental_max_fraction=0.01)
+    solver.solve()
+    problem.sig.x.array[:] = problem.block_conductivity(0.5, width=0.5)
+    solver.solve()
+    assert solver.last_assembly_mode == "full"
+    _assert_close(solver.uh, problem.linear_problem())
+    solver.destroy()
+
+
+def test_reuse_policy_schedule():
+    policy = PreconditionerReusePolicy(rebuild_every=3)
+    schedule = []
+    for _ in range(7):
+        rebuild = policy.should_rebuild()
+        schedule.append(rebuild)
+        policy.record(10, rebuild)
+    assert schedule == [True, False, False, True, False, False, True]
+
+    policy = PreconditionerReusePolicy(rebuild_every=0, iteration_growth=2.0)
+    policy.record(10, policy.should_rebuild())
+    policy.record(15, policy.should_rebuild())
+    assert not policy.should_rebuild()
+    policy.record(25, False)
+    assert policy.should_rebuild()
+
+    with pytest.raises(ValueError):
+        PreconditionerReusePolicy(iteration_growth=1.0)
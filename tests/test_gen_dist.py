@@ -0,0 +1,127 @@
+"""
+``scripts/gen_dist.py`` against the baseline implementation it replaced.
+
+``_baseline_binary`` is the original pipeline in plain Python: per-line XYZ
+parsing into ``Atom`` objects, per-atom cell hashing, a list sort, the loop
+built cell tables, the triple-loop kernel and the slice-by-slice writer. On
+a tiny grid the array front end must write the same bytes.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from sem.scripts.gen_dist import generate_binary_distance_field  # noqa: E402
+
+SEARCH_LENGTH = 2
+
+
+class _Atom:
+    def __init__(self, x, y, z, radius):
+        self.x, self.y, self.z, self.radius = float(x), float(y), float(z), float(radius)
+        self.hVal = 0
+
+
+def _cell_index(x, y, z, cell_size, nx, ny, nz):
+    cx = max(0, min(int(x / cell_size), nx - 1))
+    cy = max(0, min(int(y / cell_size), ny - 1))
+    cz = max(0, min(int(z / cell_size), nz - 1))
+    return cx + nx * cy + nx * ny * cz
+
+
+def _baseline_atoms(filename, lower, upper):
+    atoms = []
+    with open(filename) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                parts = line.split()
+                if len(parts) >= 4:
+                    x, y, z, r = map(float, parts[:4])
+                    if x > upper[0] or y > upper[1] or z > upper[2]:
+                        continue
+                    if x - lower[0] > 0 and y - lower[1] > 0 and z - lower[2] > 0:
+                        atoms.append(_Atom(x - lower[0], y - lower[1], z - lower[2], r))
+            except ValueError:
+                continue
+    return atoms
+
+
+def _baseline_field(atoms, resolution, cutoff, box):
+    cutoff = cutoff + 2  # gen_dist searches with cutoff + 2
+    cell_size = cutoff / SEARCH_LENGTH
+    nx, ny, nz = (int(b * SEARCH_LENGTH / cutoff) for b in box)
+    gx, gy, gz = (int(b / resolution) + 1 for b in box)
+
+    for atom in atoms:
+        atom.hVal = _cell_index(atom.x, atom.y, atom.z, cell_size, nx, ny, nz)
+    atoms.sort(key=lambda a: a.hVal)
+    starts, ends = {}, {}
+    for i, atom in enumerate(atoms):
+        starts.setdefault(atom.hVal, i)
+        ends[atom.hVal] = i + 1
+
+    field = np.full((gz, gy, gx), cutoff, dtype=np.float32)
+    for k in range(gz):
+        pz = k * resolution
+        cz = max(0, min(int(pz / cell_size), nz - 1))
+        for j in range(gy):
+            py = j * resolution
+            cy = max(0, min(int(py / cell_size), ny - 1))
+            for i in range(gx):
+                px = i * resolution
+                cx = max(0, min(int(px / cell_size), nx - 1))
+                min_dist = cutoff
+                for z in range(max(0, cz - SEARCH_LENGTH), min(nz, cz + SEARCH_LENGTH + 1)):
+                    for y in range(max(0, cy - SEARCH_LENGTH), min(ny, cy + SEARCH_LENGTH + 1)):
+                        for x in range(max(0, cx - SEARCH_LENGTH), min(nx, cx + SEARCH_LENGTH + 1)):
+                            cell = x + nx * y + nx * ny * z
+                            for atom in atoms[starts.get(cell, 0):ends.get(cell, 0)]:
+                                dx, dy, dz = atom.x - px, atom.y - py, atom.z - pz
+                                dist = math.sqrt(dx * dx + dy * dy + dz * dz) - atom.radius
+                                if dist < min_dist:
+                                    min_dist = dist
+                field[k, j, i] = max(min_dist, 0.0)
+    return field
+
+
+def _baseline_binary(xyz_file, lower, upper, resolution, cutoff):
+    box = [u - lo for u, lo in zip(upper, lower)]
+    atoms = _baseline_atoms(xyz_file, lower, upper)
+    field = np.minimum(_baseline_field(atoms, resolution, cutoff, box), cutoff)
+    header = [float(field.shape[2]), float(field.shape[1]), float(field.shape[0]), *lower, resolution]
+    data = np.array(header, dtype=np.float32).tobytes()
+    for k in range(field.shape[0]):
+        data += field[k].astype(np.float32).tobytes()
+    return data
+
+
+def _write_xyz(path, rng, with_junk):
+    positions = rng.uniform(-6.0, 6.0, size=(60, 3))
+    radii = rng.choice([1.1, 1.52, 1.7, 1.8], 60)
+    # On the box faces: kept on the upper corner, dropped on the lower one.
+    positions[0] = [5.0, 4.0, 3.5]
+    positions[1] = [-4.0, 0.0, 0.0]
+    lines = [f"{x:.4f} {y:.4f} {z:.4f} {r:.2f}" for (x, y, z), r in zip(positions, radii)]
+    if with_junk:
+        lines[3] += " C"
+        lines[5:5] = ["# comment", "", "1.0 2.0 3.0", "1.0 x 3.0 1.5"]
+    path.write_text("\n".join(lines) + "\n")
+
+
+@pytest.mark.parametrize("with_junk", [False, True])
+def test_binary_output_matches_baseline(tmp_path, with_junk):
+    xyz_file = tmp_path / "atoms.xyz"
+    _write_xyz(xyz_file, np.random.default_rng(4), with_junk)
+    lower, upper, resolution, cutoff = (-4.0, -3.0, -5.0), (5.0, 4.0, 3.5), 0.9, 2.5
+
+    out = tmp_path / "field.bin"
+    metadata = generate_binary_distance_field(xyz_file, *lower, *upper, resolution, cutoff, out)
+    expected = _baseline_binary(xyz_file, lower, upper, resolution, cutoff)
+    assert metadata["grid_shape"] == (11, 8, 10)
+    assert out.read_bytes() == expected
@@ -0,0 +1,120 @@
+"""Numba kernels against the NumPy / brute-force computations they replace."""
+
+import numpy as np
+import pytest
+
+from sem.conductivity_models import DebyeHuckelPotential, SimpleConductivityModel
+from sem.kernels import fused_conductivity_update
+
+MEMBRANE_CONDUCTIVITY = 1e-6
+
+
+def _case(num_points=4000, num_atoms=80, seed=0):
+    rng = np.random.default_rng(seed)
+    model = SimpleConductivityModel(bulk_conductivity=11.2, cutoff=4.1)
+    base = np.full(num_points, model.bulk_conductivity)
+    base[rng.random(num_points) < 0.05] = 2.0
+    rows = np.sort(rng.choice(num_points, num_points // 2, replace=False))
+    radii = rng.choice([1.2, 1.55, 1.7, 1.8], num_atoms)
+    indices = rng.integers(0, num_atoms, rows.size)
+    distances = rng.uniform(0.0, 8.0, rows.size)
+    distances[distances > model.cutoff + 1.5] = np.inf
+    return model, base, rows, distances, indices, radii
+
+
+def _numpy_update(model, base, rows, distances, indices, radii):
+    """The NumPy sequence of ``calculate_analyte_conductivity_modification``."""
+    conductivity = base.copy()
+    d = distances.copy()
+    if indices is not None:
+        near = ~np.isinf(d)
+        d[near] = np.maximum(d[near] - radii[indices[near]], 0)
+    all_distances = np.full(base.shape[0], np.inf)
+    all_distances[rows] = d
+    valid = ~np.isinf(all_distances)
+    conductivity[valid] = np.minimum(conductivity[valid], model(all_distances[valid]))
+    hard_core = valid & (all_distances <= model.min_distance) & (base <= MEMBRANE_CONDUCTIVITY)
+    return conductivity, int(hard_core.sum())
+
+
+def _fused(model, base, rows, distances, indices, radii, check_overlap=True):
+    out = base.copy()
+    overlaps = fused_conductivity_update(
+        out, base, rows, distances,
+        indices if indices is not None else np.empty(0, dtype=np.intp), radii,
+        model.cutoff, model.min_distance, model.bulk_conductivity,
+        0.0000001 * model.bulk_conductivity, MEMBRANE_CONDUCTIVITY, check_overlap,
+    )
+    return out, overlaps
+
+
+@pytest.mark.parametrize("centre_distances", [True, False])
+def test_fused_kernel_is_bit_identical_to_numpy(centre_distances):
+    model, base, rows, distances, indices, radii = _case()
+    if not centre_distances:
+        # Surface distances: no radii subtracted, indices empty.
+        indices = None
+    expected, _ = _numpy_update(model, base, rows, distances, indices, radii)
+    out, overlaps = _fused(model, base, rows, distances, indices, radii)
+    np.testing.assert_array_equal(out, expected)
+    assert overlaps == 0
+
+
+def test_fused_kernel_counts_membrane_overlaps():
+    model, base, rows, distances, indices, radii = _case(seed=1)
+    base[rows[:10]] = MEMBRANE_CONDUCTIVITY
+    distances[:10] = 0.5
+    expected, expected_overlaps = _numpy_update(model, base, rows, distances, indices, radii)
+    out, overlaps = _fused(model, base, rows, distances, indices, radii)
+    assert overlaps == expected_overlaps >= 10
+    np.testing.assert_array_equal(out, expected)
+
+    _, overlaps = _fused(model, base, rows, distances, indices, radii, check_overlap=False)
+    assert overlaps == 0
+
+
+def _brute_force_potential(points, positions, charges, radii, debye_length, bjerrum_length, cutoff):
+    """O(N * M) screened sum over every charge within the cutoff."""
+    r = np.linalg.norm(points[:, None, :] - positions[None, :, :], axis=2)
+    r_eff = np.maximum(r, radii[None, :])
+    terms = np.where(r < cutoff, charges[None, :] * np.exp(-r_eff / debye_length) / r_eff, 0.0)
+    return bjerrum_length * terms.sum(axis=1)
+
+
+def test_cell_list_potential_matches_brute_force():
+    rng = np.random.default_rng(2)
+    # Integer positions, so offsets of exactly one cutoff are exact.
+    positions = rng.integers(-12, 13, size=(150, 3)).astype(float)
+    charges = rng.choice([-1.0, 0.0, 0.5, 1.0], positions.shape[0])
+    radii = rng.choice([1.2, 1.5, 1.8], positions.shape[0])
+    potential = DebyeHuckelPotential(positions, charges, radii, debye_length=2.0, bjerrum_length=7.15)
+    assert potential.cutoff == potential.cell_size == 8.0
+
+    charged = charges != 0
+    cutoff_offsets = np.array([[8.0, 0.0, 0.0], [0.0, -8.0, 0.0], [0.0, 0.0, 8.0]])
+    edges = [potential.lower[axis] + potential.cell_size * np.arange(potential.dims[axis] + 1)
+             for axis in range(3)]
+    points = np.vstack([
+        rng.uniform(-20.0, 20.0, size=(2000, 3)),
+        # Exactly one cutoff away from a charge: excluded by ``r < cutoff``.
+        (positions[charged][:20, None, :] + cutoff_offsets).reshape(-1, 3),
+        # Cell corners and points on cell faces, including the outer faces.
+        np.stack(np.meshgrid(*edges, indexing="ij"), axis=-1).reshape(-1, 3),
+        np.column_stack([np.full(50, edges[0][1]), rng.uniform(-12.0, 12.0, size=(50, 2))]),
+        # On and inside charges (distance floored at the radius), and far away.
+        positions[:10],
+        positions[:10] + 0.1,
+        [[100.0, 0.0, 0.0], [-40.0, -40.0, -40.0]],
+    ])
+
+    expected = _brute_force_potential(points, positions[charged], charges[charged], radii[charged],
+                                      2.0, 7.15, 8.0)
+    np.testing.assert_allclose(potential(points), expected, rtol=1e-12, atol=1e-12)
+    assert np.any(expected != 0.0)
+    assert np.all(potential(np.array([[100.0, 0.0, 0.0]])) == 0.0)
+
+
+def test_cell_list_potential_without_charges():
+    potential = DebyeHuckelPotential(np.zeros((3, 3)), np.zeros(3), 1.5)
+    assert potential.num_charges == 0
+    np.testing.assert_array_equal(potential(np.ones((4, 3))), np.zeros(4))
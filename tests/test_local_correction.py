@@ -0,0 +1,144 @@
+"""
+``sem.local_correction.LocalCorrectionSolver`` against the global solve.
+
+With a halo that covers the whole mesh the subdomain problem is the full
+problem, so the correction must reproduce the global solution; with finite
+halos the truncation error must shrink as the halo grows, and the residual
+check must hand positions it cannot accept to the global solver.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("dolfinx")
+
+import dolfinx  # noqa: E402
+import ufl  # noqa: E402
+from dolfinx import fem, mesh  # noqa: E402
+from mpi4py import MPI  # noqa: E402
+from petsc4py import PETSc  # noqa: E402
+
+from sem.fem_solver import PersistentPoissonSolver  # noqa: E402
+from sem.local_correction import LocalCorrectionSolver  # noqa: E402
+
+OPTIONS = {"ksp_type": "cg", "pc_type": "hypre", "ksp_rtol": 1e-12, "ksp_max_it": 2000}
+
+
+class _Problem:
+    """Unit cube whose conductivity drops inside a small block."""
+
+    def __init__(self, n=12):
+        self.mesh = mesh.create_unit_cube(MPI.COMM_WORLD, n, n, n)
+        self.V = fem.functionspace(self.mesh, ("Lagrange", 1))
+        self.Q = fem.functionspace(self.mesh, ("DG", 0))
+        fdim = self.mesh.topology.dim - 1
+        top = dolfinx.mesh.locate_entities_boundary(self.mesh, fdim, lambda x: np.isclose(x[2], 1.0))
+        bot = dolfinx.mesh.locate_entities_boundary(self.mesh, fdim, lambda x: np.isclose(x[2], 0.0))
+        self.bcs = [
+            fem.dirichletbc(PETSc.ScalarType(0.1), fem.locate_dofs_topological(self.V, fdim, top), self.V),
+            fem.dirichletbc(PETSc.ScalarType(0.0), fem.locate_dofs_topological(self.V, fdim, bot), self.V),
+        ]
+        u, v = ufl.TrialFunction(self.V), ufl.TestFunction(self.V)
+        self.sig = fem.Function(self.Q)
+        self.sig.x.array[:] = 1.0
+        self.a = self.sig * ufl.dot(ufl.grad(u), ufl.grad(v)) * ufl.dx
+        self.L = fem.Constant(self.mesh, PETSc.ScalarType(0.0)) * v * ufl.dx
+        self.centroids = self.Q.tabulate_dof_coordinates()
+
+    def solver(self, prefix):
+        return PersistentPoissonSolver(self.a, self.L, self.bcs, self.V, petsc_options=OPTIONS,
+                                       options_prefix=prefix)
+
+    def place_block(self, center, half_width=0.1, value=1e-3):
+        """Set a low-conductivity block and return its corners."""
+        center = np.asarray(center, dtype=float)
+        inside = np.all(np.abs(self.centroids - center) < half_width, axis=1)
+        self.sig.x.array[:] = 1.0
+        self.sig.x.array[inside] = value
+        return center - half_width, center + half_width
+
+
+def _max_rel_error(u, reference):
+    return np.max(np.abs(u - reference)) / np.max(np.abs(reference))
+
+
+def test_halo_covering_the_mesh_reproduces_the_global_solve():
+    problem = _Problem()
+    full = problem.solver("sem_test_lc_full_")
+    base = problem.solver("sem_test_lc_base_")
+    base.solve()
+    local = LocalCorrectionSolver(base, halo=2.0, rtol=1e-12, max_iterations=2000)
+    local.set_reference()
+    assert local.ready
+
+    for z in (0.3, 0.5):
+        box = problem.place_block([0.5, 0.5, z])
+        reference = full.solve().x.array.copy()
+        uh = local.solve(*box)
+        assert local.last_converged_reason > 0
+        assert local.last_local_fraction == 1.0
+        assert not local.last_fallback
+        assert _max_rel_error(uh.x.array, reference) < 1e-8
+        assert local.relative_residual() < 1e-8
+    full.destroy()
+    base.destroy()
+    local.destroy()
+
+
+def test_truncation_error_shrinks_with_halo():
+    problem = _Problem()
+    base = problem.solver("sem_test_lc_halo_")
+    base.solve()
+    open_pore = base.uh.x.array.copy()
+    box = problem.place_block([0.5, 0.5, 0.5])
+    full = problem.solver("sem_test_lc_ref_")
+    reference = full.solve().x.array.copy()
+    full.destroy()
+
+    errors, fractions = [], []
+    for halo in (0.1, 0.2, 0.3):
+        problem.sig.x.array[:] = 1.0
+        base.solve()
+        # Accept every corrected field to see the truncation error itself.
+        local = LocalCorrectionSolver(base, halo=halo, rtol=1e-12, max_iterations=2000,
+                                      residual_rtol=np.inf)
+        local.set_reference()
+        problem.place_block([0.5, 0.5, 0.5])
+        uh = local.solve(*box)
+        assert not local.last_fallback
+        errors.append(_max_rel_error(uh.x.array, reference))
+        fractions.append(local.last_local_fraction)
+        # DOFs outside the subdomain keep the open-pore values.
+        outside = np.any(np.abs(problem.V.tabulate_dof_coordinates() - 0.5) > 0.1 + halo + 1e-12, axis=1)
+        np.testing.assert_array_equal(uh.x.array[outside], local.reference[outside])
+        local.destroy()
+    assert fractions[0] < fractions[1] < fractions[2] < 1.0
+    assert errors[0] > errors[1] > errors[2]
+    assert errors[0] < _max_rel_error(open_pore, reference)
+    base.destroy()
+
+
+@pytest.mark.parametrize("shift", [0.05, 0.15])
+def test_perturbation_at_the_box_edge_matches_the_global_solve(shift):
+    problem = _Problem()
+    base = problem.solver("sem_test_lc_edge_")
+    base.solve()
+    local = LocalCorrectionSolver(base, halo=0.1, rtol=1e-10, max_iterations=2000)
+    local.set_reference()
+    full = problem.solver("sem_test_lc_edge_full_")
+    box_min, box_max = problem.place_block([0.5, 0.5, 0.5])
+    reference = full.solve().x.array.copy()
+
+    # Box moved up: the block ends 0.05 inside the subdomain, or crosses its
+    # lower edge so some changed cells are outside it.
+    offset = np.array([0.0, 0.0, shift])
+    uh = local.solve(box_min + offset, box_max + offset)
+    assert local.last_fallback
+    assert local.last_residual > local.residual_rtol
+    assert base.last_converged_reason > 0
+    assert _max_rel_error(uh.x.array, reference) < 1e-8
+    assert local.relative_residual() < 1e-8
+    assert (local.num_solves, local.num_fallbacks) == (1, 1)
+    full.destroy()
+    base.destroy()
+    local.destroy()
@@ -0,0 +1,95 @@
+"""Analytic pore conductivity against the grid interpolator, and the biological pore's engine choice."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("dolfinx")
+
+from sem.pore_geometry import PoreGeometry, _resolve_distance_engine  # noqa: E402
+
+BULK = 1.12
+MEMBRANE = 1.12e-7
+SPACING = 0.5
+# condfrac ramps from 0 to 1 between 1.3 and 4.1 Å from the membrane.
+SLOPE = BULK / (4.1 - 1.3)
+
+PORES = {
+    "cylindrical": dict(pore_radius=10.0, membrane_half_thickness=8.0, corner_radius=3.0),
+    "conical": dict(top_radius=12.0, bottom_radius=6.0, membrane_half_thickness=8.0),
+    "double_cone": dict(inner_radius=6.0, outer_radius=12.0, membrane_half_thickness=8.0),
+}
+
+
+def _evaluators(pore_type):
+    axis = np.arange(-30.0, 30.0 + SPACING / 2, SPACING)
+    X, Y, Z = np.meshgrid(axis, axis, axis, indexing="ij")
+    kwargs = dict(PORES[pore_type], bulk_conductivity=BULK, membrane_conductivity=MEMBRANE)
+    grid = PoreGeometry.create_pore(pore_type, X, Y, Z, **kwargs)
+    analytic = PoreGeometry.create_pore(pore_type, **kwargs)
+    return grid, analytic, np.column_stack([X.ravel(), Y.ravel(), Z.ravel()])
+
+
+@pytest.mark.parametrize("pore_type", list(PORES))
+def test_analytic_matches_grid_on_nodes(pore_type):
+    grid, analytic, nodes = _evaluators(pore_type)
+    nodes = nodes[::37]
+    np.testing.assert_allclose(
+        analytic.get_conductivity_interpolator()(nodes),
+        grid.get_conductivity_interpolator()(nodes),
+        rtol=1e-12, atol=0.0,
+    )
+    R = np.hypot(nodes[:, 0], nodes[:, 1])
+    np.testing.assert_array_equal(analytic.get_conductivity_interpolator()(nodes),
+                                  analytic._conductivity(R, nodes[:, 2]))
+
+
+@pytest.mark.parametrize("pore_type", list(PORES))
+def test_analytic_matches_grid_between_nodes(pore_type):
+    grid, analytic, _ = _evaluators(pore_type)
+    rng = np.random.default_rng(3)
+    points = np.vstack([
+        rng.uniform(-29.9, 29.9, size=(20000, 3)),
+        # On the axis, through the pore and the reservoirs.
+        np.column_stack([np.zeros(200), np.zeros(200), np.linspace(-29.9, 29.9, 200)]),
+    ])
+    exact = analytic.get_conductivity_interpolator()(points)
+    interpolated = grid.get_conductivity_interpolator()(points)
+
+    # Samples cover the channel and reservoirs (bulk) and the membrane solid.
+    assert np.any(exact == BULK)
+    assert np.any(exact < 1e-3 * BULK)
+    error = np.abs(interpolated - exact)
+    # Trilinear interpolation of a Lipschitz field: at most the slope times
+    # the distance to the farthest cell corner; on average far smaller.
+    assert error.max() <= SLOPE * SPACING * np.sqrt(3.0)
+    assert error.mean() < 1e-3 * BULK
+    # More than the ramp plus a cell diagonal from the membrane both are
+    # bulk; deep inside the solid both hold the membrane floor.
+    reservoir = np.abs(points[:, 2]) > 8.0 + 4.1 + SPACING * np.sqrt(3.0)
+    np.testing.assert_allclose(exact[reservoir], BULK, rtol=1e-12)
+    np.testing.assert_allclose(interpolated[reservoir], BULK, rtol=1e-12)
+    solid = (np.hypot(points[:, 0], points[:, 1]) > 20.0) & (np.abs(points[:, 2]) < 2.0)
+    assert np.any(solid)
+    floor = MEMBRANE + 1e-7 * (BULK - MEMBRANE)
+    np.testing.assert_allclose(exact[solid], floor, rtol=1e-9)
+    np.testing.assert_allclose(interpolated[solid], floor, rtol=1e-9)
+
+
+def test_distance_engine_defaults_to_numba(recwarn):
+    assert _resolve_distance_engine() == "numba"
+    assert _resolve_distance_engine("KDTree") == "kdtree"
+    assert not recwarn.list
+    with pytest.raises(ValueError, match="distance_engine"):
+        _resolve_distance_engine("gpu")
+
+
+@pytest.mark.parametrize("direct, engine, expected", [
+    (True, None, "numba"),
+    (False, None, "subprocess"),
+    # An explicit engine wins over the deprecated flag.
+    (False, "kdtree", "kdtree"),
+    (True, "subprocess", "subprocess"),
+])
+def test_use_direct_distance_calculation_is_deprecated(direct, engine, expected):
+    with pytest.warns(DeprecationWarning, match="use_direct_distance_calculation"):
+        assert _resolve_distance_engine(engine, use_direct_distance_calculation=direct) == expected
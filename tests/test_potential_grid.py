@@ -0,0 +1,112 @@
+"""FFT screened-potential grid: values against the direct sum, and its on-disk cache."""
+
+import numpy as np
+import pytest
+
+from sem.conductivity_models import DebyeHuckelPotential
+from sem.potential_grid import cached_screened_potential_grid, screened_potential_grid
+
+
+def _inputs():
+    axes = tuple(np.linspace(-10.0, 10.0, 21) for _ in range(3))
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(-8.0, 8.0, size=(40, 3))
+    charges = rng.choice([-1.0, 0.5, 1.0], 40)
+    return axes, positions, charges, 1.5
+
+
+def _direct_sum(axes, positions, charges, radii):
+    points = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+    potential = DebyeHuckelPotential(positions, charges, radii)
+    return potential(points).reshape(tuple(axis.size for axis in axes)), points
+
+
+def test_grid_matches_direct_sum_for_charges_on_nodes():
+    # Charges on grid nodes are spread without smearing and share one radius,
+    # so the FFT convolution is the direct sum up to float32 rounding. Some
+    # charges lie outside the grid but within the cutoff of it.
+    axes = tuple(np.linspace(-10.0, 10.0, 41) for _ in range(3))
+    rng = np.random.default_rng(1)
+    positions = rng.integers(-28, 29, size=(60, 3)) * 0.5
+    charges = rng.choice([-1.0, 0.5, 1.0], 60)
+    assert np.any(np.abs(positions) > 10.0)
+
+    phi = screened_potential_grid(axes, positions, charges, 1.5)
+    expected, _ = _direct_sum(axes, positions, charges, 1.5)
+    np.testing.assert_allclose(phi, expected, rtol=0.0, atol=1e-6 * np.abs(expected).max())
+
+
+def test_grid_approximates_direct_sum_away_from_charges():
+    axes = tuple(np.linspace(-10.0, 10.0, 41) for _ in range(3))
+    rng = np.random.default_rng(2)
+    positions = rng.uniform(-8.0, 8.0, size=(60, 3))
+    charges = rng.choice([-1.0, 0.5, 1.0], 60)
+
+    phi = screened_potential_grid(axes, positions, charges, 1.5)
+    expected, points = _direct_sum(axes, positions, charges, 1.5)
+    # Cloud-in-cell smearing is only small a few grid spacings from a charge.
+    nearest = np.linalg.norm(points[:, None, :] - positions[None, :, :], axis=2).min(axis=1)
+    far = nearest.reshape(phi.shape) > 2.0
+    error = np.abs(phi - expected)[far]
+    assert error.max() < 0.02 * np.abs(expected).max()
+
+
+class _Rank:
+    """Stand-in for one rank of a communicator whose rank 0 holds ``root_phi``."""
+
+    def __init__(self, rank, root_phi):
+        self.rank, self.root_phi = rank, root_phi
+
+    def Get_size(self):
+        return 2
+
+    def Get_rank(self):
+        return self.rank
+
+    def bcast(self, obj, root=0):
+        return obj if self.rank == root else self.root_phi.shape
+
+    def Bcast(self, buf, root=0):
+        if self.rank != root:
+            buf[...] = self.root_phi
+
+
+def test_cache_round_trip(tmp_path):
+    axes, positions, charges, radii = _inputs()
+    first = cached_screened_potential_grid(tmp_path, "pore", axes, positions, charges, radii)
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert len(files) == 1 and files[0].startswith("pore_phi_") and ".tmp" not in files[0]
+
+    second = cached_screened_potential_grid(tmp_path, "pore", axes, positions, charges, radii)
+    np.testing.assert_array_equal(first, second)
+    assert second.dtype == np.float32
+    np.testing.assert_array_equal(first, screened_potential_grid(axes, positions, charges, radii))
+
+
+def test_cache_key_covers_parameters(tmp_path):
+    axes, positions, charges, radii = _inputs()
+    cached_screened_potential_grid(tmp_path, "pore", axes, positions, charges, radii)
+    cached_screened_potential_grid(tmp_path, "pore", axes, positions, charges, radii, debye_length=3.0)
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_only_root_rank_touches_the_cache(tmp_path):
+    axes, positions, charges, radii = _inputs()
+    reference = screened_potential_grid(axes, positions, charges, radii)
+
+    root = cached_screened_potential_grid(tmp_path / "root", "pore", axes, positions, charges, radii,
+                                          comm=_Rank(0, reference))
+    other = cached_screened_potential_grid(tmp_path / "other", "pore", axes, positions, charges, radii,
+                                           comm=_Rank(1, reference))
+    np.testing.assert_array_equal(root, reference)
+    np.testing.assert_array_equal(other, reference)
+    assert len(list((tmp_path / "root").iterdir())) == 1
+    assert not (tmp_path / "other").exists()
+
+
+def test_root_failure_is_raised_on_every_rank(tmp_path):
+    axes, positions, charges, radii = _inputs()
+    bad_axes = (np.array([0.0, 1.0, 3.0]),) + axes[1:]
+    with pytest.raises(ValueError):
+        cached_screened_potential_grid(tmp_path, "pore", bad_axes, positions, charges, radii,
+                                       comm=_Rank(0, np.zeros(1)))
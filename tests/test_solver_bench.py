@@ -0,0 +1,153 @@
+"""
+``sem.solver_bench``: preset selection, the written config, and the options
+each preset is benchmarked with.
+
+The benchmark itself runs on a stand-in SEM whose solves report scripted
+currents and converged reasons, so only the bookkeeping is exercised.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip("dolfinx")
+
+from sem.fem_solver import SOLVER_PRESETS, resolve_petsc_options  # noqa: E402
+from sem.solver_bench import (  # noqa: E402
+    benchmark_solver_presets,
+    select_fastest,
+    write_preset_to_config,
+)
+
+
+class _Solver:
+    last_iterations = 7
+    last_converged_reason = 2
+
+
+class _Sem:
+    """Stand-in SEM: each preset returns scripted (current, reason) pairs per solve."""
+
+    rank = 0
+    z_start = 10.0
+
+    def __init__(self, outcomes, solver_config):
+        self.outcomes = outcomes
+        self.solver_config = dict(solver_config)
+        self.sig = type("Sig", (), {"x": type("X", (), {"array": np.zeros(4)})()})()
+        self.fem_solver = _Solver()
+        self.options = {}
+        self._pending = []
+
+    def _maybe_rebuild_mesh_for_position(self, z):
+        pass
+
+    def _load_base_conductivity(self):
+        self.sig.x.array[:] = 1.0
+
+    def get_conductivity_at_position(self, z):
+        self.sig.x.array[:] = 0.5
+
+    def set_solver_preset(self, preset, petsc_options=None):
+        self.solver_config["preset"] = preset
+        if petsc_options is None:
+            self.solver_config.pop("petsc_options", None)
+        else:
+            self.solver_config["petsc_options"] = dict(petsc_options)
+        self.options[preset] = resolve_petsc_options(self.solver_config)
+        self._pending = list(self.outcomes.get(preset, []))
+
+    def solve_for_current(self, **kwargs):
+        current, reason = self._pending.pop(0)
+        self.fem_solver.last_converged_reason = reason
+        return current
+
+
+def test_select_fastest_skips_rejected_presets():
+    results = [
+        {"preset": "mumps_lu", "ok": False, "total_time": 0.1},
+        {"preset": "cg_gamg", "ok": True, "total_time": 0.4},
+        {"preset": "cg_boomeramg", "ok": True, "total_time": 0.3},
+        {"preset": "gmres_hypre", "error": "failed", "ok": False},
+    ]
+    assert select_fastest(results) == "cg_boomeramg"
+    assert select_fastest(results[:1] + results[3:]) is None
+    assert select_fastest([]) is None
+
+
+def test_write_preset_round_trip(tmp_path):
+    config = {
+        "pore": {"type": "cylindrical", "radius": 20.0},
+        "simulation": {
+            "voltage": 100.0,
+            "solver": {
+                "preset": "gmres_hypre",
+                "initial_guess": "open_pore",
+                "petsc_options": {"ksp_type": "gmres", "ksp_monitor": None,
+                                  "pc_hypre_boomeramg_strong_threshold": 0.7},
+            },
+        },
+    }
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(config))
+
+    write_preset_to_config(path, "cg_boomeramg")
+    written = json.loads(path.read_text())
+    solver = written["simulation"]["solver"]
+    assert solver["preset"] == "cg_boomeramg"
+    # Options the preset sets would override it at run time and are dropped.
+    assert solver["petsc_options"] == {"ksp_monitor": None, "pc_hypre_boomeramg_strong_threshold": 0.7}
+    assert solver["initial_guess"] == "open_pore"
+    assert written["pore"] == config["pore"]
+    assert written["simulation"]["voltage"] == 100.0
+    assert resolve_petsc_options(solver)["ksp_type"] == SOLVER_PRESETS["cg_boomeramg"]["ksp_type"]
+
+    write_preset_to_config(path, "cg_boomeramg")
+    assert json.loads(path.read_text()) == written
+
+
+def test_write_preset_creates_the_solver_block(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"pore": {"type": "cylindrical"}}))
+    write_preset_to_config(path, "cg_gamg")
+    assert json.loads(path.read_text()) == {
+        "pore": {"type": "cylindrical"},
+        "simulation": {"solver": {"preset": "cg_gamg"}},
+    }
+
+
+def test_benchmark_keeps_user_options_under_each_preset():
+    user_options = {"ksp_type": "gmres", "pc_hypre_boomeramg_strong_threshold": 0.7}
+    outcomes = {preset: [(1.0, 2), (0.5, 2)] for preset in ("cg_boomeramg", "cg_gamg")}
+    sem = _Sem(outcomes, {"preset": "gmres_hypre", "petsc_options": user_options})
+
+    results = benchmark_solver_presets(sem, presets=["cg_boomeramg", "cg_gamg"])
+    assert [r["ok"] for r in results] == [True, True]
+    for preset in ("cg_boomeramg", "cg_gamg"):
+        options = sem.options[preset]
+        for key, value in SOLVER_PRESETS[preset].items():
+            assert options[key] == value
+        assert options["pc_hypre_boomeramg_strong_threshold"] == 0.7
+    # The configured solver is restored afterwards.
+    assert sem.solver_config == {"preset": "gmres_hypre", "petsc_options": user_options}
+
+
+def test_benchmark_checks_every_solve():
+    outcomes = {
+        "cg_boomeramg": [(1.0, 2), (0.5, 2)],
+        # Open-pore solve diverged; the position solve converged.
+        "cg_gamg": [(1.0, -3), (0.5, 2)],
+        # Open-pore current off; the position current matches.
+        "gmres_hypre": [(1.1, 2), (0.5, 2)],
+        "mumps_lu": [(1.0, 1), (0.5, 1)],
+    }
+    sem = _Sem(outcomes, {})
+    results = {r["preset"]: r for r in benchmark_solver_presets(sem, presets=list(outcomes))}
+
+    assert results["cg_boomeramg"]["ok"]
+    assert not results["cg_gamg"]["converged"] and not results["cg_gamg"]["ok"]
+    assert results["cg_gamg"]["open_pore_reason"] == -3
+    assert results["gmres_hypre"]["converged"] and not results["gmres_hypre"]["ok"]
+    assert results["gmres_hypre"]["deviation"] == pytest.approx(0.1)
+    assert results["mumps_lu"]["ok"]
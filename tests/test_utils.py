@@ -0,0 +1,36 @@
+"""DOF coordinate tabulation and memoization in ``sem.utils``."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("dolfinx")
+
+from dolfinx import fem, mesh  # noqa: E402
+from mpi4py import MPI  # noqa: E402
+
+from sem.utils import get_dof_coordinates  # noqa: E402
+
+
+@pytest.fixture
+def dg0_space():
+    domain = mesh.create_unit_cube(MPI.COMM_WORLD, 3, 3, 3)
+    return domain, fem.functionspace(domain, ("DG", 0))
+
+
+def test_dg0_coordinates_are_cell_midpoints(dg0_space):
+    domain, Q = dg0_space
+    coords = get_dof_coordinates(domain, Q)
+    np.testing.assert_allclose(coords, Q.tabulate_dof_coordinates(), atol=1e-12)
+    assert not coords.flags.writeable
+    assert get_dof_coordinates(domain, Q) is coords
+
+
+def test_memo_is_keyed_by_dtype(dg0_space):
+    domain, Q = dg0_space
+    single = get_dof_coordinates(domain, Q, dtype=np.float32)
+    native = get_dof_coordinates(domain, Q)
+    assert single.dtype == np.float32
+    assert native.dtype == domain.geometry.x.dtype
+    assert get_dof_coordinates(domain, Q, dtype=np.float32) is single
+    assert get_dof_coordinates(domain, Q) is native
+    np.testing.assert_allclose(single, native, rtol=1e-6)